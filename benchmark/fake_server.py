@@ -0,0 +1,542 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process HTTP stand-in for the BigQuery REST API.
+
+Serves enough of the API to exercise the client's throughput behavior
+(retries, pagination, polling, ``insertAll`` and uploads) without a live
+project:
+
+* ``jobs.insert``, ``jobs.get``, ``jobs.query`` and ``jobs.getQueryResults``
+* ``tables.get``, ``tabledata.list`` and ``tabledata.insertAll``
+* multipart and resumable uploads to ``/upload/bigquery/v2/.../jobs``
+
+Every table holds the same deterministic rows (see ``replay.py``), and every
+query returns them. Latency, server-side page size, job duration and the
+rate of injected 429/5xx errors are configurable.
+
+Example::
+
+    with FakeBigQueryServer(latency=0.005, error_rate=0.01) as server:
+        client = server.client()
+        rows = list(client.query_and_wait("SELECT 1"))
+"""
+
+import argparse
+import collections
+import http.server
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+import urllib.parse
+import uuid
+
+import replay
+
+_API_PREFIX = "/bigquery/v2"
+_UPLOAD_PREFIX = "/upload/bigquery/v2"
+
+_ERROR_DETAILS = {
+    429: ("rateLimitExceeded", "RESOURCE_EXHAUSTED"),
+    500: ("backendError", "INTERNAL"),
+    502: ("badGateway", "UNAVAILABLE"),
+    503: ("backendError", "UNAVAILABLE"),
+}
+
+
+class _Job:
+    def __init__(self, resource: Dict[str, Any], duration: float):
+        self.resource = resource
+        self.done_at = time.monotonic() + duration
+
+    @property
+    def done(self) -> bool:
+        return time.monotonic() >= self.done_at
+
+    def to_api_repr(self) -> Dict[str, Any]:
+        resource = dict(self.resource)
+        resource["status"] = {"state": "DONE" if self.done else "RUNNING"}
+        return resource
+
+
+class FakeBigQueryServer:
+    """A threaded HTTP server implementing a subset of the BigQuery API.
+
+    Args:
+        num_rows: Number of rows in every table and query result.
+        page_size:
+            Maximum number of rows the server returns per page, whatever
+            ``maxResults`` the client asks for.
+        latency: Seconds to sleep before answering each request.
+        jitter: Extra random latency, up to this many seconds.
+        job_duration:
+            Seconds before a job (or a ``jobs.query`` call) is done. The
+            client keeps polling until then.
+        error_rate: Fraction of requests answered with an injected error.
+        error_codes: HTTP status codes the injected errors are drawn from.
+        seed: Seed for the injected errors, latency jitter and row data.
+        port: Port to listen on. Defaults to an unused port.
+    """
+
+    def __init__(
+        self,
+        num_rows: int = 1000,
+        page_size: int = 500,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        job_duration: float = 0.0,
+        error_rate: float = 0.0,
+        error_codes: Sequence[int] = (429, 500, 503),
+        seed: int = 0,
+        port: int = 0,
+    ):
+        recording = replay.synthetic_recording(num_rows, num_rows or 1, seed=seed)
+        self.schema = recording["schema"]
+        self.rows = replay.recording_rows(recording)
+        self.page_size = page_size
+        self.latency = latency
+        self.jitter = jitter
+        self.job_duration = job_duration
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.port = port
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, _Job] = {}
+        self._uploads: Dict[str, Dict[str, Any]] = {}
+        self._httpd: Optional[http.server.ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.requests: collections.Counter = collections.Counter()
+        self.injected_errors: collections.Counter = collections.Counter()
+        self.inserted_rows = 0
+        self.uploaded_bytes = 0
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as the client's ``api_endpoint``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeBigQueryServer":
+        server = self
+
+        class Handler(_Handler):
+            fake = server
+
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-bigquery", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self) -> "FakeBigQueryServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def client(self, project: str = replay.PROJECT, **kwargs):
+        """Create a :class:`~google.cloud.bigquery.client.Client` for this server."""
+        from google.auth.credentials import AnonymousCredentials
+        from google.cloud import bigquery
+
+        return bigquery.Client(
+            project=project,
+            credentials=AnonymousCredentials(),
+            client_options={"api_endpoint": self.url},
+            **kwargs,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts of requests per endpoint and of injected errors."""
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "injected_errors": dict(self.injected_errors),
+                "inserted_rows": self.inserted_rows,
+                "uploaded_bytes": self.uploaded_bytes,
+            }
+
+    # Helpers used by the request handler, guarded by ``_lock`` where they
+    # touch shared state.
+
+    def _count(self, endpoint: str):
+        with self._lock:
+            self.requests[endpoint] += 1
+
+    def _pick_error(self, endpoint: str) -> Optional[int]:
+        with self._lock:
+            if not self.error_codes or self._random.random() >= self.error_rate:
+                return None
+            code = self._random.choice(self.error_codes)
+            self.injected_errors[(endpoint, code)] += 1
+            return code
+
+    def _delay(self) -> float:
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def _add_job(self, resource: Dict[str, Any]) -> _Job:
+        job = _Job(resource, self.job_duration)
+        with self._lock:
+            self._jobs[resource["jobReference"]["jobId"]] = job
+        return job
+
+    def _get_job(self, job_id: str) -> Optional[_Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _page(self, query_params: Dict[str, str]) -> Dict[str, Any]:
+        start = int(query_params.get("pageToken") or query_params.get("startIndex", 0))
+        size = self.page_size
+        if "maxResults" in query_params:
+            size = min(size, int(query_params["maxResults"]))
+        end = min(start + size, len(self.rows))
+
+        page: Dict[str, Any] = {"totalRows": str(len(self.rows))}
+        if size > 0:
+            page["rows"] = self.rows[start:end]
+            if end < len(self.rows):
+                page["pageToken"] = str(end)
+        return page
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fake: FakeBigQueryServer
+
+    _ROUTES = (
+        ("POST", r"/projects/(?P<project>[^/]+)/jobs", "jobs.insert"),
+        ("GET", r"/projects/(?P<project>[^/]+)/jobs/(?P<job>[^/]+)", "jobs.get"),
+        ("POST", r"/projects/(?P<project>[^/]+)/queries", "jobs.query"),
+        (
+            "GET",
+            r"/projects/(?P<project>[^/]+)/queries/(?P<job>[^/]+)",
+            "jobs.getQueryResults",
+        ),
+        (
+            "GET",
+            r"/projects/(?P<project>[^/]+)/datasets/(?P<dataset>[^/]+)"
+            r"/tables/(?P<table>[^/]+)/data",
+            "tabledata.list",
+        ),
+        (
+            "POST",
+            r"/projects/(?P<project>[^/]+)/datasets/(?P<dataset>[^/]+)"
+            r"/tables/(?P<table>[^/]+)/insertAll",
+            "tabledata.insertAll",
+        ),
+        (
+            "GET",
+            r"/projects/(?P<project>[^/]+)/datasets/(?P<dataset>[^/]+)"
+            r"/tables/(?P<table>[^/]+)",
+            "tables.get",
+        ),
+    )
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status: int, body: Any = None, headers=None):
+        payload = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if body is not None:
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_error(self, status: int, message: str, reason: str = "notFound"):
+        code_reason, code_status = _ERROR_DETAILS.get(status, (reason, "UNKNOWN"))
+        self._send(
+            status,
+            {
+                "error": {
+                    "code": status,
+                    "message": message,
+                    "errors": [{"reason": code_reason, "message": message}],
+                    "status": code_status,
+                }
+            },
+        )
+
+    def _dispatch(self, method: str):
+        url = urllib.parse.urlsplit(self.path)
+        query_params = dict(urllib.parse.parse_qsl(url.query))
+        body = self._read_body()
+
+        if url.path.startswith(_UPLOAD_PREFIX):
+            endpoint, handler, match = "upload", self._upload, None
+        elif url.path.startswith("/upload-session/"):
+            endpoint, handler, match = "upload.chunk", self._upload_chunk, None
+        else:
+            endpoint = handler = match = None
+            path = url.path[len(_API_PREFIX) :]
+            for route_method, pattern, name in self._ROUTES:
+                match = re.fullmatch(pattern, path)
+                if route_method == method and match:
+                    endpoint = name
+                    handler = getattr(self, "_" + name.replace(".", "_"))
+                    break
+
+        fake = self.fake
+        if endpoint is None:
+            self._send_error(404, f"No fake for {method} {url.path}")
+            return
+
+        fake._count(endpoint)
+        delay = fake._delay()
+        if delay:
+            time.sleep(delay)
+
+        error_code = fake._pick_error(endpoint)
+        if error_code is not None:
+            self._send_error(error_code, f"Injected error for {endpoint}")
+            return
+
+        groups = match.groupdict() if match else {}
+        handler(groups, query_params, body, url)
+
+    def _job_resource(self, project: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        reference = dict(request.get("jobReference") or {})
+        reference.setdefault("projectId", project)
+        reference.setdefault("jobId", str(uuid.uuid4()))
+        reference.setdefault("location", "US")
+        configuration = request.get("configuration") or {"query": {"query": ""}}
+        resource = {
+            "kind": "bigquery#job",
+            "id": f"{project}:{reference['location']}.{reference['jobId']}",
+            "jobReference": reference,
+            "configuration": configuration,
+            "statistics": {"creationTime": str(int(time.time() * 1000))},
+        }
+        if "query" in configuration:
+            configuration["query"].setdefault(
+                "destinationTable",
+                {
+                    "projectId": project,
+                    "datasetId": "_fake_anonymous",
+                    "tableId": "anon" + reference["jobId"].replace("-", "_"),
+                },
+            )
+        return resource
+
+    def _query_results(self, job: _Job, query_params) -> Dict[str, Any]:
+        reference = job.resource["jobReference"]
+        if not job.done:
+            return {"jobReference": reference, "jobComplete": False}
+
+        response = self.fake._page(query_params)
+        response.update(
+            {
+                "kind": "bigquery#getQueryResultsResponse",
+                "jobReference": reference,
+                "jobComplete": True,
+                "schema": self.fake.schema,
+                "totalBytesProcessed": "0",
+                "cacheHit": False,
+            }
+        )
+        return response
+
+    def _wait_for_job(self, job: _Job, timeout_ms: Optional[str]):
+        """Hold the request open until the job is done, like the real API."""
+        if timeout_ms is None:
+            return
+        remaining = job.done_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(min(remaining, int(timeout_ms) / 1000))
+
+    def _jobs_insert(self, groups, query_params, body, url):
+        request = json.loads(body or b"{}")
+        job = self.fake._add_job(self._job_resource(groups["project"], request))
+        self._send(200, job.to_api_repr())
+
+    def _jobs_get(self, groups, query_params, body, url):
+        job = self.fake._get_job(groups["job"])
+        if job is None:
+            self._send_error(404, f"Not found: Job {groups['job']}")
+            return
+        self._send(200, job.to_api_repr())
+
+    def _jobs_query(self, groups, query_params, body, url):
+        request = json.loads(body or b"{}")
+        job_request = {
+            "jobReference": {"jobId": str(uuid.uuid4())},
+            "configuration": {"query": {"query": request.get("query", "")}},
+        }
+        job = self.fake._add_job(self._job_resource(groups["project"], job_request))
+        self._wait_for_job(job, request.get("timeoutMs"))
+
+        page_params = {}
+        if "maxResults" in request:
+            page_params["maxResults"] = str(request["maxResults"])
+        self._send(200, self._query_results(job, page_params))
+
+    def _jobs_getQueryResults(self, groups, query_params, body, url):
+        job = self.fake._get_job(groups["job"])
+        if job is None:
+            self._send_error(404, f"Not found: Job {groups['job']}")
+            return
+        self._wait_for_job(job, query_params.get("timeoutMs"))
+        self._send(200, self._query_results(job, query_params))
+
+    def _tables_get(self, groups, query_params, body, url):
+        self._send(
+            200,
+            {
+                "kind": "bigquery#table",
+                "tableReference": {
+                    "projectId": groups["project"],
+                    "datasetId": groups["dataset"],
+                    "tableId": groups["table"],
+                },
+                "schema": self.fake.schema,
+                "numRows": str(len(self.fake.rows)),
+                "type": "TABLE",
+            },
+        )
+
+    def _tabledata_list(self, groups, query_params, body, url):
+        page = self.fake._page(query_params)
+        page["kind"] = "bigquery#tableDataList"
+        self._send(200, page)
+
+    def _tabledata_insertAll(self, groups, query_params, body, url):
+        request = json.loads(body or b"{}")
+        with self.fake._lock:
+            self.fake.inserted_rows += len(request.get("rows", ()))
+        self._send(200, {"kind": "bigquery#tableDataInsertAllResponse"})
+
+    def _upload(self, groups, query_params, body, url):
+        project = url.path[len(_UPLOAD_PREFIX) :].split("/")[2]
+        upload_type = query_params.get("uploadType")
+
+        if upload_type == "resumable":
+            session_id = str(uuid.uuid4())
+            with self.fake._lock:
+                self.fake._uploads[session_id] = {
+                    "project": project,
+                    "request": json.loads(body or b"{}"),
+                    "received": 0,
+                }
+            self._send(
+                200,
+                headers={"Location": f"{self.fake.url}/upload-session/{session_id}"},
+            )
+            return
+
+        # Multipart: the first part holds the job resource as JSON.
+        metadata = re.search(rb"\{.*?\}\r?\n", body, re.DOTALL)
+        request = json.loads(metadata.group(0)) if metadata else {}
+        with self.fake._lock:
+            self.fake.uploaded_bytes += len(body)
+        job = self.fake._add_job(self._job_resource(project, request))
+        self._send(200, job.to_api_repr())
+
+    def _upload_chunk(self, groups, query_params, body, url):
+        session_id = url.path.rsplit("/", 1)[-1]
+        with self.fake._lock:
+            session = self.fake._uploads.get(session_id)
+        if session is None:
+            self._send_error(404, f"Unknown upload session {session_id}")
+            return
+
+        # Content-Range: bytes START-END/TOTAL, where TOTAL is "*" until the
+        # last chunk.
+        content_range = self.headers.get("Content-Range", "")
+        total = content_range.rsplit("/", 1)[-1]
+        with self.fake._lock:
+            session["received"] += len(body)
+            self.fake.uploaded_bytes += len(body)
+            received = session["received"]
+
+        if total == "*" or int(total) > received:
+            self._send(308, headers={"Range": f"bytes=0-{received - 1}"})
+            return
+
+        with self.fake._lock:
+            self.fake._uploads.pop(session_id, None)
+        job = self.fake._add_job(
+            self._job_resource(session["project"], session["request"])
+        )
+        self._send(200, job.to_api_repr())
+
+
+def _parse_args() -> dict:
+    """Parses input flags."""
+    parser = argparse.ArgumentParser(
+        description="Serve a fake BigQuery REST API until interrupted."
+    )
+    parser.add_argument("--port", type=int, default=9050, metavar="")
+    parser.add_argument("--rows", type=int, default=1000, metavar="")
+    parser.add_argument("--page-size", type=int, default=500, metavar="")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="")
+    parser.add_argument("--job-duration", type=float, default=0.0, metavar="")
+    parser.add_argument("--error-rate", type=float, default=0.0, metavar="")
+    return vars(parser.parse_args())
+
+
+def _main():
+    options = _parse_args()
+    server = FakeBigQueryServer(
+        num_rows=options["rows"],
+        page_size=options["page_size"],
+        latency=options["latency"],
+        jitter=options["jitter"],
+        job_duration=options["job_duration"],
+        error_rate=options["error_rate"],
+        port=options["port"],
+    )
+    with server:
+        print(f"Serving a fake BigQuery API at {server.url}, Ctrl+C to stop.")
+        try:
+            server._thread.join()
+        except KeyboardInterrupt:
+            pass
+    print(json.dumps(server.stats()["requests"], indent=2))
+
+
+if __name__ == "__main__":
+    _main()
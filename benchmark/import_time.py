@@ -0,0 +1,151 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Scripts for benchmarking the cold import time of the BigQuery client."""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Optional dependencies which should only be imported on first use.
+_HEAVY_MODULES = (
+    "pandas",
+    "pyarrow",
+    "numpy",
+    "db_dtypes",
+    "geopandas",
+    "shapely",
+    "google.cloud.bigquery_storage_v1",
+    "tqdm.notebook",
+    "IPython",
+)
+
+_PROBE = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def _check_pos_int(value):
+    ivalue = int(value)
+    if ivalue <= 0:
+        raise argparse.ArgumentTypeError(
+            f"Argument rerun should be positive int. Actual value: {value}"
+        )
+    return ivalue
+
+
+def _parse_args() -> dict:
+    """Parses input flags."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark for the import time of the BigQuery client."
+    )
+
+    parser.add_argument(
+        "--reruns",
+        action="store",
+        type=_check_pos_int,
+        default=10,
+        metavar="",
+        help="how many times each import is measured in a fresh interpreter",
+    )
+
+    parser.add_argument(
+        "--module",
+        action="append",
+        metavar="",
+        help="module to import, can be specified multiple times. Defaults to "
+        "google.cloud.bigquery and google.cloud.bigquery.dbapi",
+    )
+
+    parser.add_argument(
+        "--importtime",
+        action="store_true",
+        help="print the slowest entries of `python -X importtime` for each module",
+    )
+
+    args = parser.parse_args()
+    if not args.module:
+        args.module = ["google.cloud.bigquery", "google.cloud.bigquery.dbapi"]
+    return vars(args)
+
+
+def _measure(module: str) -> dict:
+    """Imports ``module`` in a fresh interpreter and reports the elapsed time."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=_HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _print_importtime(module: str, limit: int = 15):
+    """Prints the modules with the largest cumulative import time."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        entries.append((int(cumulative), name.strip()))
+
+    for cumulative, name in sorted(entries, reverse=True)[:limit]:
+        print(f"    {cumulative / 1e6:8.3f}s  {name}")
+
+
+def _run(module: str, reruns: int, importtime: bool):
+    # The first import warms the filesystem and bytecode caches.
+    _measure(module)
+    results = [_measure(module) for _ in range(reruns)]
+    seconds = [result["seconds"] for result in results]
+
+    print(f"{module}:")
+    print(
+        f"  median {statistics.median(seconds):.3f}s, "
+        f"min {min(seconds):.3f}s, max {max(seconds):.3f}s over {reruns} runs"
+    )
+    loaded = results[-1]["loaded"]
+    print(f"  optional modules imported: {', '.join(loaded) or 'none'}")
+
+    if importtime:
+        _print_importtime(module)
+
+
+def _main():
+    args = _parse_args()
+    for module in args["module"]:
+        _run(module, args["reruns"], args["importtime"])
+
+
+if __name__ == "__main__":
+    _main()
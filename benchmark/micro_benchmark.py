@@ -0,0 +1,614 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline micro-benchmarks for the client's CPU bound code paths.
+
+Recorded REST pages and Storage API Arrow streams (see ``replay.py``) are
+replayed through the client, so no credentials or network are needed.
+
+Suites follow the airspeed velocity (asv) conventions: a class with optional
+``setup`` and ``teardown`` methods and one ``time_*`` method per benchmark.
+``setup`` raises ``NotImplementedError`` to skip a suite whose optional
+dependencies are missing. Each ``time_*`` method returns the number of items
+it processed, which is used to report throughput.
+"""
+
+import argparse
+import copy
+import io
+import json
+import os
+import re
+import statistics
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+from google.auth.credentials import AnonymousCredentials
+
+from google.cloud import bigquery
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery import dbapi
+
+import replay
+
+_TABLE_ID = f"{replay.PROJECT}.{replay.DATASET}.{replay.TABLE}"
+_QUERY = f"SELECT * FROM `{_TABLE_ID}`"
+
+
+def _replay_client(recording):
+    client = bigquery.Client(project=replay.PROJECT, credentials=AnonymousCredentials())
+    client._connection = replay.ReplayConnection(recording)
+    return client
+
+
+def _schema_fields(recording):
+    return [
+        bigquery.SchemaField.from_api_repr(field)
+        for field in recording["schema"]["fields"]
+    ]
+
+
+def _require(*modules):
+    for module in modules:
+        try:
+            __import__(module)
+        except ImportError:
+            raise NotImplementedError(f"requires {module}")
+
+
+def _python_rows(recording, schema):
+    """Recorded rows as the dictionaries users pass to ``insert_rows``."""
+    rows = _helpers._rows_from_json(replay.recording_rows(recording), schema)
+    return [dict(row.items()) for row in rows]
+
+
+def _arrow_table(recording, schema):
+    import pyarrow
+
+    arrow_schema = _pandas_helpers.bq_to_arrow_schema(schema)
+    return pyarrow.Table.from_pylist(
+        _python_rows(recording, schema), schema=arrow_schema
+    )
+
+
+class RowIteratorSuite:
+    """REST pages through ``RowIterator``."""
+
+    unit = "rows"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        self.client = _replay_client(self.options["recording"])
+
+    def time_list_rows(self):
+        return sum(1 for _ in self.client.list_rows(_TABLE_ID))
+
+    def time_query_and_wait(self):
+        return sum(1 for _ in self.client.query_and_wait(_QUERY))
+
+    def time_list_rows_to_arrow(self):
+        _require("pyarrow")
+        rows = self.client.list_rows(_TABLE_ID)
+        return rows.to_arrow(create_bqstorage_client=False).num_rows
+
+    def time_list_rows_to_dataframe(self):
+        _require("pandas", "db_dtypes")
+        rows = self.client.list_rows(_TABLE_ID)
+        return len(rows.to_dataframe(create_bqstorage_client=False))
+
+
+class BQStorageDownloadSuite:
+    """Storage API Arrow streams through ``_pandas_helpers.download_*``."""
+
+    unit = "rows"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        _require("pyarrow", "google.cloud.bigquery_storage")
+        recording = self.options["recording"]
+        self.schema = _schema_fields(recording)
+        self.table = bigquery.TableReference.from_string(_TABLE_ID)
+        self.read_client = replay.ReplayReadClient(
+            _arrow_table(recording, self.schema),
+            num_streams=self.options["streams"],
+            batch_size=self.options["page_size"],
+        )
+
+    def time_download_arrow_bqstorage(self):
+        batches = _pandas_helpers.download_arrow_bqstorage(
+            replay.PROJECT, self.table, self.read_client
+        )
+        return sum(batch.num_rows for batch in batches)
+
+    def time_download_dataframe_bqstorage(self):
+        _require("pandas", "db_dtypes")
+        frames = _pandas_helpers.download_dataframe_bqstorage(
+            replay.PROJECT,
+            self.table,
+            self.read_client,
+            [field.name for field in self.schema],
+            {},
+        )
+        return sum(len(frame) for frame in frames)
+
+
+class CellDataParserSuite:
+    """Conversion of REST cells to Python values."""
+
+    unit = "rows"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        recording = self.options["recording"]
+        self.rows = replay.recording_rows(recording)
+        self.schema = _schema_fields(recording)
+
+    def time_rows_from_json(self):
+        return len(_helpers._rows_from_json(self.rows, self.schema))
+
+    def time_cell_data_parser_to_py(self):
+        to_py = _helpers.CELL_DATA_PARSER.to_py
+        for row in self.rows:
+            for cell, field in zip(row["f"], self.schema):
+                to_py(cell["v"], field)
+        return len(self.rows)
+
+
+class NestedDecodingSuite:
+    """Conversion of deeply nested ``ARRAY<STRUCT>`` REST rows."""
+
+    unit = "rows"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        recording = self.options["nested_recording"]
+        self.rows = replay.recording_rows(recording)
+        self.schema = _schema_fields(recording)
+        self.client = _replay_client(recording)
+
+    def time_rows_from_json(self):
+        return len(_helpers._rows_from_json(self.rows, self.schema))
+
+    def time_list_rows_to_arrow(self):
+        _require("pyarrow")
+        rows = self.client.list_rows(_TABLE_ID)
+        return rows.to_arrow(create_bqstorage_client=False).num_rows
+
+
+class InsertRowsSuite:
+    """Serialization of rows for ``tabledata.insertAll``."""
+
+    unit = "rows"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        recording = self.options["recording"]
+        self.client = _replay_client(recording)
+        schema = _schema_fields(recording)
+        self.table = bigquery.Table(_TABLE_ID, schema=schema)
+        self.rows = _python_rows(recording, schema)
+
+    def time_insert_rows(self):
+        self.client.insert_rows(self.table, self.rows)
+        return len(self.rows)
+
+
+class DataFrameToParquetSuite:
+    """``_pandas_helpers.dataframe_to_parquet`` as used by load jobs."""
+
+    unit = "rows"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        _require("pandas", "pyarrow")
+        recording = self.options["recording"]
+        self.schema = _schema_fields(recording)
+        self.dataframe = _arrow_table(recording, self.schema).to_pandas()
+        handle, self.path = tempfile.mkstemp(suffix=".parquet")
+        os.close(handle)
+
+    def teardown(self):
+        os.remove(self.path)
+
+    def time_dataframe_to_parquet(self):
+        _pandas_helpers.dataframe_to_parquet(self.dataframe, self.schema, self.path)
+        return len(self.dataframe)
+
+
+class DataFrameSchemaSuite:
+    """``_pandas_helpers.dataframe_to_bq_schema`` on a wide ``object`` frame."""
+
+    unit = "columns"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        _require("pandas", "pyarrow")
+        import decimal
+
+        import pandas
+
+        # pandas-gbq is optional, don't report its absence on every run.
+        warnings.filterwarnings("ignore", "Loading pandas DataFrame", FutureWarning)
+
+        num_rows = self.options["rows"]
+        makers = (
+            lambda row: f"value-{row}",
+            lambda row: [row, row + 1],
+            lambda row: decimal.Decimal(row) / 100,
+        )
+        self.dataframe = pandas.DataFrame(
+            {
+                f"col_{index}": pandas.Series(
+                    [makers[index % len(makers)](row) for row in range(num_rows)],
+                    dtype=object,
+                )
+                for index in range(self.options["frame_columns"])
+            }
+        )
+
+    def time_dataframe_to_bq_schema(self):
+        _pandas_helpers._SCHEMA_INFERENCE_CACHE.clear()
+        return len(_pandas_helpers.dataframe_to_bq_schema(self.dataframe, []))
+
+    def time_dataframe_to_bq_schema_cached(self):
+        # The warm-up run fills the cache.
+        return len(
+            _pandas_helpers.dataframe_to_bq_schema(self.dataframe, [], use_cache=True)
+        )
+
+    # The client's own inference, used when pandas-gbq is not installed.
+    def time_infer_bq_schema(self):
+        return len(_pandas_helpers._infer_bq_schema(self.dataframe, [], None))
+
+    def time_infer_bq_schema_sampled(self):
+        return len(_pandas_helpers._infer_bq_schema(self.dataframe, [], 1000))
+
+
+class SchemaSuite:
+    """Parsing of wide API schema resources."""
+
+    unit = "fields"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        fields = self.options["recording"]["schema"]["fields"]
+        self.resources = [
+            dict(field, name=f"{field['name']}_{index}")
+            for index in range(self.options["schema_copies"])
+            for field in fields
+        ]
+        self.client = _replay_client(self.options["recording"])
+        self.schema_json = json.dumps(self.resources)
+        self.fields = self.client.schema_from_json(io.StringIO(self.schema_json))
+        self.frozen = bigquery.FrozenSchema(self.resources)
+
+    def time_schema_field_from_api_repr(self):
+        fields = [bigquery.SchemaField.from_api_repr(r) for r in self.resources]
+        return len(fields)
+
+    def time_schema_from_json(self):
+        return len(self.client.schema_from_json(io.StringIO(self.schema_json)))
+
+    def time_schema_from_json_frozen(self):
+        file_obj = io.StringIO(self.schema_json)
+        return len(self.client.schema_from_json(file_obj, frozen=True))
+
+    def time_schema_equality(self):
+        other = self.client.schema_from_json(io.StringIO(self.schema_json))
+        assert self.fields == other
+        return len(other)
+
+    def time_schema_equality_frozen(self):
+        other = self.client.schema_from_json(io.StringIO(self.schema_json), frozen=True)
+        assert self.frozen == other
+        return len(other)
+
+
+class ResourceCopySuite:
+    """Copies of resource properties made by ``to_api_repr`` and job configs."""
+
+    unit = "copies"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        fields = self.options["recording"]["schema"]["fields"]
+        self.table = bigquery.Table("project.dataset.table")
+        self.table.schema = [bigquery.SchemaField.from_api_repr(f) for f in fields]
+        self.table.labels = {"team": "benchmarks", "env": "test"}
+        self.job_config = bigquery.QueryJobConfig(
+            labels={"team": "benchmarks"},
+            query_parameters=[bigquery.ScalarQueryParameter("x", "INT64", 1)],
+            use_query_cache=False,
+        )
+
+    def time_table_to_api_repr(self):
+        return len(self.table.to_api_repr())
+
+    def time_job_config_deepcopy(self):
+        return len(copy.deepcopy(self.job_config).to_api_repr())
+
+
+class DBAPISuite:
+    """DB-API ``Cursor.fetchmany`` over REST pages."""
+
+    unit = "rows"
+
+    def __init__(self, options):
+        self.options = options
+
+    def setup(self):
+        self.connection = dbapi.connect(
+            _replay_client(self.options["recording"]), prefer_bqstorage_client=False
+        )
+
+    def teardown(self):
+        self.connection.close()
+
+    def time_fetchmany(self):
+        cursor = self.connection.cursor()
+        cursor.execute(_QUERY)
+        total = 0
+        while True:
+            rows = cursor.fetchmany(self.options["page_size"])
+            if not rows:
+                return total
+            total += len(rows)
+
+
+SUITES = (
+    RowIteratorSuite,
+    BQStorageDownloadSuite,
+    CellDataParserSuite,
+    NestedDecodingSuite,
+    InsertRowsSuite,
+    DataFrameToParquetSuite,
+    DataFrameSchemaSuite,
+    SchemaSuite,
+    ResourceCopySuite,
+    DBAPISuite,
+)
+
+
+def _check_pos_int(value):
+    ivalue = int(value)
+    if ivalue <= 0:
+        raise argparse.ArgumentTypeError(
+            f"Argument should be positive int. Actual value: {value}"
+        )
+    return ivalue
+
+
+def _parse_args() -> dict:
+    """Parses input flags."""
+    parser = argparse.ArgumentParser(
+        description="Offline micro-benchmarks for the BigQuery client."
+    )
+
+    parser.add_argument(
+        "--rows",
+        action="store",
+        type=_check_pos_int,
+        default=20000,
+        metavar="",
+        help="number of rows in the synthetic recording",
+    )
+
+    parser.add_argument(
+        "--page-size",
+        action="store",
+        type=_check_pos_int,
+        default=2000,
+        metavar="",
+        help="rows per REST page, Arrow record batch and fetchmany() call",
+    )
+
+    parser.add_argument(
+        "--streams",
+        action="store",
+        type=_check_pos_int,
+        default=4,
+        metavar="",
+        help="number of Storage API read streams",
+    )
+
+    parser.add_argument(
+        "--schema-copies",
+        action="store",
+        type=_check_pos_int,
+        default=100,
+        metavar="",
+        help="how many times the schema is repeated for the schema benchmark",
+    )
+
+    parser.add_argument(
+        "--frame-columns",
+        action="store",
+        type=_check_pos_int,
+        default=60,
+        metavar="",
+        help="number of object columns of the DataFrame schema benchmark",
+    )
+
+    parser.add_argument(
+        "--reruns",
+        action="store",
+        type=_check_pos_int,
+        default=5,
+        metavar="",
+        help="how many times each benchmark is timed, after one warm-up run",
+    )
+
+    parser.add_argument(
+        "--recording",
+        action="store",
+        metavar="",
+        help="JSON file with recorded tabledata.list pages to replay instead "
+        "of the synthetic recording",
+    )
+
+    parser.add_argument(
+        "--nested-recording",
+        action="store",
+        metavar="",
+        help="JSON file with recorded pages of nested rows to replay instead "
+        "of the synthetic nested recording",
+    )
+
+    parser.add_argument(
+        "--filter",
+        action="store",
+        default="",
+        metavar="",
+        help="only run benchmarks whose Suite.method name matches this regex",
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store",
+        metavar="",
+        help="also write the results to this JSON file",
+    )
+
+    return vars(parser.parse_args())
+
+
+def _run_benchmark(suite, method_name: str, reruns: int) -> dict:
+    method = getattr(suite, method_name)
+    method()  # Warm-up, also fills any lazily populated caches.
+
+    durations = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        items = method()
+        durations.append(time.perf_counter() - start)
+
+    # Measure allocations in a separate run, tracing slows down the code.
+    tracemalloc.start()
+    try:
+        method()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained_bytes = sum(stat.size for stat in snapshot.statistics("filename"))
+
+    median = statistics.median(durations)
+    return {
+        "name": f"{type(suite).__name__}.{method_name}",
+        "items": items,
+        "unit": suite.unit,
+        "median_seconds": median,
+        "min_seconds": min(durations),
+        "throughput": items / median if median else None,
+        "peak_alloc_bytes": peak_bytes,
+        "retained_alloc_bytes": retained_bytes,
+    }
+
+
+def _print_result(result: dict):
+    print(
+        "{name:<55} {median_ms:>10.2f} ms {throughput:>14,.0f} {unit}/s "
+        "{peak:>10.1f} MiB peak".format(
+            name=result["name"],
+            median_ms=result["median_seconds"] * 1000,
+            throughput=result["throughput"] or 0,
+            unit=result["unit"],
+            peak=result["peak_alloc_bytes"] / 2**20,
+        )
+    )
+
+
+def _run_suites(options: dict) -> list:
+    pattern = re.compile(options["filter"])
+    results = []
+
+    for suite_class in SUITES:
+        method_names = [
+            name
+            for name in sorted(dir(suite_class))
+            if name.startswith("time_")
+            and pattern.search(f"{suite_class.__name__}.{name}")
+        ]
+        if not method_names:
+            continue
+
+        suite = suite_class(options)
+        try:
+            if hasattr(suite, "setup"):
+                suite.setup()
+        except NotImplementedError as exc:
+            print(f"{suite_class.__name__:<55} skipped: {exc}")
+            continue
+
+        try:
+            for method_name in method_names:
+                try:
+                    result = _run_benchmark(suite, method_name, options["reruns"])
+                except NotImplementedError as exc:
+                    print(f"{suite_class.__name__}.{method_name:<40} skipped: {exc}")
+                    continue
+                _print_result(result)
+                results.append(result)
+        finally:
+            if hasattr(suite, "teardown"):
+                suite.teardown()
+
+    return results
+
+
+def _main():
+    options = _parse_args()
+    if options["recording"]:
+        options["recording"] = replay.load_recording(options["recording"])
+    else:
+        options["recording"] = replay.synthetic_recording(
+            options["rows"], options["page_size"]
+        )
+    if options["nested_recording"]:
+        options["nested_recording"] = replay.load_recording(options["nested_recording"])
+    else:
+        options["nested_recording"] = replay.nested_recording(
+            options["rows"], options["page_size"]
+        )
+
+    results = _run_suites(options)
+
+    if options["json"]:
+        with open(options["json"], "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    _main()
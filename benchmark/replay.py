@@ -0,0 +1,370 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Recorded API responses replayed by the offline micro-benchmarks.
+
+A recording is a JSON document with the table schema and the pages of a
+``tabledata.list`` call, in the REST wire format::
+
+    {
+      "schema": {"fields": [...]},
+      "pages": [{"rows": [{"f": [{"v": "1"}, ...]}, ...]}, ...]
+    }
+
+:func:`synthetic_recording` builds a deterministic recording covering the
+common column types, and :func:`nested_recording` one of deeply nested
+``ARRAY<STRUCT>`` rows, so the benchmarks need neither credentials nor network.
+The same rows are served as ``jobs.query`` / ``jobs.getQueryResults`` pages by
+:class:`ReplayConnection`, and as BigQuery Storage API Arrow streams by
+:class:`ReplayReadClient`.
+"""
+
+import datetime
+import json
+import random
+from typing import Any, Dict, List, Optional
+
+PROJECT = "bench-project"
+DATASET = "bench_dataset"
+TABLE = "bench_table"
+JOB_ID = "bench-job"
+
+_SCHEMA = {
+    "fields": [
+        {"name": "int_col", "type": "INTEGER", "mode": "NULLABLE"},
+        {"name": "float_col", "type": "FLOAT", "mode": "NULLABLE"},
+        {"name": "str_col", "type": "STRING", "mode": "NULLABLE"},
+        {"name": "bool_col", "type": "BOOLEAN", "mode": "NULLABLE"},
+        {"name": "ts_col", "type": "TIMESTAMP", "mode": "NULLABLE"},
+        {"name": "date_col", "type": "DATE", "mode": "NULLABLE"},
+        {"name": "numeric_col", "type": "NUMERIC", "mode": "NULLABLE"},
+        {"name": "repeated_col", "type": "INTEGER", "mode": "REPEATED"},
+        {
+            "name": "struct_col",
+            "type": "RECORD",
+            "mode": "NULLABLE",
+            "fields": [
+                {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+                {"name": "score", "type": "FLOAT", "mode": "NULLABLE"},
+            ],
+        },
+    ]
+}
+
+_EPOCH_MICROS = 1_700_000_000_000_000
+_EPOCH_DATE = datetime.date(2024, 1, 1)
+
+
+def _cell(value) -> Dict[str, Any]:
+    return {"v": value}
+
+
+def _synthetic_row(rng: random.Random) -> Dict[str, Any]:
+    def maybe_null(value):
+        return None if rng.random() < 0.05 else value
+
+    date = _EPOCH_DATE + datetime.timedelta(days=rng.randrange(3650))
+    return {
+        "f": [
+            _cell(maybe_null(str(rng.randrange(-(2**40), 2**40)))),
+            _cell(maybe_null(repr(rng.uniform(-1e6, 1e6)))),
+            _cell(maybe_null("value-{:08x}".format(rng.getrandbits(32)))),
+            _cell(maybe_null("true" if rng.random() < 0.5 else "false")),
+            _cell(maybe_null(str(_EPOCH_MICROS + rng.randrange(10**13)))),
+            _cell(maybe_null(date.isoformat())),
+            _cell(
+                maybe_null(
+                    "{}.{:09d}".format(rng.randrange(10**6), rng.randrange(10**9))
+                )
+            ),
+            _cell([_cell(str(rng.randrange(1000))) for _ in range(rng.randrange(4))]),
+            _cell(
+                maybe_null(
+                    {
+                        "f": [
+                            _cell("name-{}".format(rng.randrange(100))),
+                            _cell(repr(rng.random())),
+                        ]
+                    }
+                )
+            ),
+        ]
+    }
+
+
+def synthetic_recording(num_rows: int, page_size: int, seed: int = 0) -> dict:
+    """Build a deterministic ``tabledata.list`` recording.
+
+    Args:
+        num_rows: Total number of rows across all pages.
+        page_size: Number of rows per page.
+        seed: Seed for the pseudo-random cell values.
+
+    Returns:
+        A recording, see the module docstring for its format.
+    """
+    rng = random.Random(seed)
+    rows = [_synthetic_row(rng) for _ in range(num_rows)]
+    pages = [
+        {"rows": rows[start : start + page_size]}
+        for start in range(0, num_rows, page_size)
+    ]
+    return {"schema": _SCHEMA, "pages": pages or [{"rows": []}]}
+
+
+_NESTED_SCHEMA = {
+    "fields": [
+        {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
+        {
+            "name": "orders",
+            "type": "RECORD",
+            "mode": "REPEATED",
+            "fields": [
+                {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+                {"name": "tags", "type": "STRING", "mode": "REPEATED"},
+                {
+                    "name": "attrs",
+                    "type": "RECORD",
+                    "mode": "NULLABLE",
+                    "fields": [
+                        {"name": "k", "type": "INTEGER", "mode": "NULLABLE"},
+                        {"name": "v", "type": "FLOAT", "mode": "NULLABLE"},
+                    ],
+                },
+                {
+                    "name": "items",
+                    "type": "RECORD",
+                    "mode": "REPEATED",
+                    "fields": [
+                        {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
+                        {"name": "price", "type": "NUMERIC", "mode": "NULLABLE"},
+                    ],
+                },
+            ],
+        },
+    ]
+}
+
+
+def _nested_row(rng: random.Random) -> Dict[str, Any]:
+    def order():
+        attrs = None
+        if rng.random() >= 0.1:
+            attrs = {
+                "f": [
+                    _cell(str(rng.randrange(1000))),
+                    _cell(repr(rng.random())),
+                ]
+            }
+        items = [
+            _cell(
+                {
+                    "f": [
+                        _cell(str(rng.randrange(10**6))),
+                        _cell(
+                            "{}.{:02d}".format(rng.randrange(1000), rng.randrange(100))
+                        ),
+                    ]
+                }
+            )
+            for _ in range(rng.randrange(5))
+        ]
+        return {
+            "f": [
+                _cell("order-{}".format(rng.randrange(1000))),
+                _cell(
+                    [
+                        _cell("tag-{}".format(rng.randrange(20)))
+                        for _ in range(rng.randrange(4))
+                    ]
+                ),
+                _cell(attrs),
+                _cell(items),
+            ]
+        }
+
+    return {
+        "f": [
+            _cell(str(rng.randrange(2**40))),
+            _cell([_cell(order()) for _ in range(rng.randrange(4))]),
+        ]
+    }
+
+
+def nested_recording(num_rows: int, page_size: int, seed: int = 0) -> dict:
+    """Build a deterministic recording of deeply nested rows.
+
+    Each row holds an ``ARRAY<STRUCT>`` whose elements contain a repeated
+    string, a nullable struct and a further ``ARRAY<STRUCT>``.
+
+    Args:
+        num_rows: Total number of rows across all pages.
+        page_size: Number of rows per page.
+        seed: Seed for the pseudo-random cell values.
+
+    Returns:
+        A recording, see the module docstring for its format.
+    """
+    rng = random.Random(seed)
+    rows = [_nested_row(rng) for _ in range(num_rows)]
+    pages = [
+        {"rows": rows[start : start + page_size]}
+        for start in range(0, num_rows, page_size)
+    ]
+    return {"schema": _NESTED_SCHEMA, "pages": pages or [{"rows": []}]}
+
+
+def load_recording(path: str) -> dict:
+    """Load a recording saved as JSON, see the module docstring."""
+    with open(path, "r", encoding="utf-8") as recording_file:
+        recording = json.load(recording_file)
+
+    # Drop per-page metadata, the replay fakes fill in their own.
+    pages = [{"rows": page.get("rows", [])} for page in recording["pages"]]
+    return {"schema": recording["schema"], "pages": pages}
+
+
+def recording_rows(recording: dict) -> List[dict]:
+    """All REST rows of a recording, in order."""
+    return [row for page in recording["pages"] for row in page["rows"]]
+
+
+class ReplayConnection:
+    """Stands in for :class:`google.cloud.bigquery._http.Connection`.
+
+    Serves the recorded pages for ``tabledata.list``, ``jobs.query`` and
+    ``jobs.getQueryResults``, plus the table and job metadata calls that
+    ``list_rows`` and ``query_and_wait`` make along the way. ``insertAll``
+    requests are serialized to JSON, as the real connection would, and their
+    row count is recorded.
+    """
+
+    def __init__(self, recording: dict):
+        self._schema = recording["schema"]
+        self._pages = recording["pages"]
+        self._total_rows = str(len(recording_rows(recording)))
+        self.inserted_rows = 0
+        self.inserted_bytes = 0
+
+    def _job_reference(self) -> Dict[str, str]:
+        return {"projectId": PROJECT, "jobId": JOB_ID, "location": "US"}
+
+    def _page(self, page_token: Optional[str]) -> Dict[str, Any]:
+        index = int(page_token) if page_token else 0
+        page = dict(self._pages[index])
+        page["totalRows"] = self._total_rows
+        if index + 1 < len(self._pages):
+            page["pageToken"] = str(index + 1)
+        return page
+
+    def _query_results(self, page_token: Optional[str]) -> Dict[str, Any]:
+        response = self._page(page_token)
+        response["jobComplete"] = True
+        response["jobReference"] = self._job_reference()
+        response["schema"] = self._schema
+        return response
+
+    def api_request(self, method, path, query_params=None, data=None, **kwargs):
+        query_params = query_params or {}
+
+        if method == "POST" and path.endswith("/insertAll"):
+            self.inserted_rows += len(data["rows"])
+            self.inserted_bytes += len(json.dumps(data))
+            return {}
+        if method == "POST" and path.endswith("/queries"):
+            return self._query_results(None)
+        if method == "GET" and "/queries/" in path:
+            return self._query_results(query_params.get("pageToken"))
+        if method == "GET" and "/jobs/" in path:
+            return {
+                "jobReference": self._job_reference(),
+                "configuration": {"query": {"query": "SELECT 1"}},
+                "status": {"state": "DONE"},
+            }
+        if method == "GET" and path.endswith("/data"):
+            return self._page(query_params.get("pageToken"))
+        if method == "GET" and "/tables/" in path:
+            return {
+                "tableReference": {
+                    "projectId": PROJECT,
+                    "datasetId": DATASET,
+                    "tableId": TABLE,
+                },
+                "schema": self._schema,
+                "numRows": self._total_rows,
+            }
+
+        raise NotImplementedError(f"No recorded response for {method} {path}")
+
+
+class _ReplayReadRowsTransport:
+    """Minimal GAPIC ``BigQueryReadClient`` used by ``ReadRowsStream``."""
+
+    def __init__(self, responses_by_stream):
+        self._responses_by_stream = responses_by_stream
+
+    def read_rows(self, read_stream=None, offset=0, **kwargs):
+        return iter(self._responses_by_stream[read_stream])
+
+
+class ReplayReadClient:
+    """Stands in for ``google.cloud.bigquery_storage.BigQueryReadClient``.
+
+    The rows of ``arrow_table`` are split round-robin across ``num_streams``
+    read streams of serialized Arrow record batches, which are decoded by the
+    real ``google.cloud.bigquery_storage_v1.reader`` module.
+    """
+
+    def __init__(self, arrow_table, num_streams: int = 4, batch_size: int = 1000):
+        from google.cloud.bigquery_storage_v1 import reader, types
+
+        self._reader = reader
+
+        stream_names = [
+            f"projects/{PROJECT}/locations/us/sessions/s/streams/{index}"
+            for index in range(max(1, num_streams))
+        ]
+        arrow_schema = types.ArrowSchema(
+            serialized_schema=arrow_table.schema.serialize().to_pybytes()
+        )
+
+        responses_by_stream: Dict[str, list] = {name: [] for name in stream_names}
+        batches = arrow_table.to_batches(max_chunksize=batch_size)
+        for index, batch in enumerate(batches):
+            responses = responses_by_stream[stream_names[index % len(stream_names)]]
+            response = types.ReadRowsResponse(
+                arrow_record_batch=types.ArrowRecordBatch(
+                    serialized_record_batch=batch.serialize().to_pybytes(),
+                    row_count=batch.num_rows,
+                ),
+                row_count=batch.num_rows,
+            )
+            # Like the API, send the schema with the first message of a stream.
+            if not responses:
+                response.arrow_schema = arrow_schema
+            responses.append(response)
+
+        self._transport = _ReplayReadRowsTransport(responses_by_stream)
+        self._session = types.ReadSession(
+            name=f"projects/{PROJECT}/locations/us/sessions/s",
+            data_format=types.DataFormat.ARROW,
+            arrow_schema=arrow_schema,
+            streams=[types.ReadStream(name=name) for name in stream_names],
+        )
+
+    def create_read_session(self, parent=None, read_session=None, **kwargs):
+        return self._session
+
+    def read_rows(self, name, offset=0, **kwargs):
+        return self._reader.ReadRowsStream(self._transport, name, offset, {})
@@ -0,0 +1,374 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrency soak test of the client against a local fake BigQuery API.
+
+Starts a :class:`fake_server.FakeBigQueryServer` and runs a mix of workloads
+from a pool of threads sharing one :class:`~google.cloud.bigquery.Client`
+for a fixed duration. Reports operations per second, failed operations, the
+client's per-endpoint latency histograms (see
+:class:`~google.cloud.bigquery.metrics.HistogramCollector`) and the requests
+seen by the server, including the injected errors which were retried.
+"""
+
+import argparse
+import concurrent.futures
+import io
+import itertools
+import json
+import threading
+import time
+
+from google.cloud import bigquery
+from google.cloud.bigquery import client as client_module
+from google.cloud.bigquery import metrics
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+import fake_server
+import replay
+
+_TABLE_ID = f"{replay.PROJECT}.{replay.DATASET}.{replay.TABLE}"
+_QUERY = f"SELECT * FROM `{_TABLE_ID}`"
+
+# Retry quickly: the fake server's errors are injected, not a real overload.
+_FAST_RETRY = DEFAULT_RETRY.with_delay(initial=0.01, maximum=0.1)
+
+
+def _query_and_wait(client, options):
+    return sum(1 for _ in client.query_and_wait(_QUERY, retry=_FAST_RETRY))
+
+
+def _query_job(client, options):
+    query_job = client.query(_QUERY, retry=_FAST_RETRY)
+    return sum(1 for _ in query_job.result(retry=_FAST_RETRY))
+
+
+def _list_rows(client, options):
+    return sum(1 for _ in client.list_rows(_TABLE_ID, retry=_FAST_RETRY))
+
+
+def _insert_rows(client, options):
+    rows = [{"int_col": i, "str_col": f"row-{i}"} for i in range(options["batch"])]
+    errors = client.insert_rows_json(_TABLE_ID, rows, retry=_FAST_RETRY)
+    if errors:
+        raise RuntimeError(f"insert_rows_json returned errors: {errors}")
+    return len(rows)
+
+
+def _load_table_from_file(client, options):
+    payload = b"1,row\n" * (options["upload_bytes"] // 6)
+    job_config = bigquery.LoadJobConfig(source_format=bigquery.SourceFormat.CSV)
+    load_job = client.load_table_from_file(
+        io.BytesIO(payload), _TABLE_ID, job_config=job_config
+    )
+    load_job.result(retry=_FAST_RETRY)
+    return len(payload)
+
+
+WORKLOADS = {
+    "query_and_wait": _query_and_wait,
+    "query": _query_job,
+    "list_rows": _list_rows,
+    "insert_rows": _insert_rows,
+    "load_table_from_file": _load_table_from_file,
+}
+
+
+def _check_pos_int(value):
+    ivalue = int(value)
+    if ivalue <= 0:
+        raise argparse.ArgumentTypeError(
+            f"Argument should be positive int. Actual value: {value}"
+        )
+    return ivalue
+
+
+def _check_rate(value):
+    fvalue = float(value)
+    if not 0.0 <= fvalue < 1.0:
+        raise argparse.ArgumentTypeError(
+            f"Argument should be in [0, 1). Actual value: {value}"
+        )
+    return fvalue
+
+
+def _parse_args() -> dict:
+    """Parses input flags."""
+    parser = argparse.ArgumentParser(
+        description="Soak test the BigQuery client against a local fake API."
+    )
+
+    parser.add_argument(
+        "--workers",
+        action="store",
+        type=_check_pos_int,
+        default=8,
+        metavar="",
+        help="number of threads sharing the client",
+    )
+
+    parser.add_argument(
+        "--duration",
+        action="store",
+        type=float,
+        default=10.0,
+        metavar="",
+        help="seconds to keep starting new operations",
+    )
+
+    parser.add_argument(
+        "--workload",
+        action="append",
+        choices=sorted(WORKLOADS),
+        metavar="",
+        help="workload to run, may be repeated; defaults to all of "
+        + ", ".join(sorted(WORKLOADS)),
+    )
+
+    parser.add_argument(
+        "--rows",
+        action="store",
+        type=_check_pos_int,
+        default=1000,
+        metavar="",
+        help="number of rows in every table and query result",
+    )
+
+    parser.add_argument(
+        "--page-size",
+        action="store",
+        type=_check_pos_int,
+        default=500,
+        metavar="",
+        help="maximum rows the server returns per page",
+    )
+
+    parser.add_argument(
+        "--batch",
+        action="store",
+        type=_check_pos_int,
+        default=500,
+        metavar="",
+        help="rows per insert_rows_json call",
+    )
+
+    parser.add_argument(
+        "--upload-bytes",
+        action="store",
+        type=_check_pos_int,
+        default=1024 * 1024,
+        metavar="",
+        help="bytes uploaded per load_table_from_file call",
+    )
+
+    parser.add_argument(
+        "--upload-chunk-size",
+        action="store",
+        type=_check_pos_int,
+        default=256 * 1024,
+        metavar="",
+        help="resumable upload chunk size, a multiple of 262144",
+    )
+
+    parser.add_argument(
+        "--latency",
+        action="store",
+        type=float,
+        default=0.002,
+        metavar="",
+        help="seconds the server waits before each response",
+    )
+
+    parser.add_argument(
+        "--jitter",
+        action="store",
+        type=float,
+        default=0.0,
+        metavar="",
+        help="extra random server latency, up to this many seconds",
+    )
+
+    parser.add_argument(
+        "--job-duration",
+        action="store",
+        type=float,
+        default=0.05,
+        metavar="",
+        help="seconds before a job is done",
+    )
+
+    parser.add_argument(
+        "--error-rate",
+        action="store",
+        type=_check_rate,
+        default=0.02,
+        metavar="",
+        help="fraction of requests answered with an injected 429/5xx error",
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store",
+        metavar="",
+        help="also write the results to this JSON file",
+    )
+
+    return vars(parser.parse_args())
+
+
+def _worker(client, options, workloads, deadline, results, lock):
+    for name in itertools.cycle(workloads):
+        if time.monotonic() >= deadline:
+            return
+        start = time.perf_counter()
+        try:
+            items = WORKLOADS[name](client, options)
+            error = None
+        except Exception as exc:
+            items = 0
+            error = f"{type(exc).__name__}: {exc}"
+        elapsed = time.perf_counter() - start
+
+        with lock:
+            result = results[name]
+            result["operations"] += 1
+            result["items"] += items
+            result["seconds"] += elapsed
+            if error is not None:
+                result["failures"] += 1
+                result["last_error"] = error
+
+
+def run(options: dict) -> dict:
+    """Run the soak test and return its results."""
+    workloads = options["workload"] or sorted(WORKLOADS)
+    # Exercise multi-chunk resumable uploads without uploading 100 MB.
+    client_module._DEFAULT_CHUNKSIZE = options["upload_chunk_size"]
+
+    results = {
+        name: {"operations": 0, "items": 0, "seconds": 0.0, "failures": 0}
+        for name in workloads
+    }
+    lock = threading.Lock()
+    collector = metrics.HistogramCollector()
+
+    server = fake_server.FakeBigQueryServer(
+        num_rows=options["rows"],
+        page_size=options["page_size"],
+        latency=options["latency"],
+        jitter=options["jitter"],
+        job_duration=options["job_duration"],
+        error_rate=options["error_rate"],
+    )
+    with server:
+        client = server.client(metrics_hook=collector)
+
+        start = time.monotonic()
+        deadline = start + options["duration"]
+        with concurrent.futures.ThreadPoolExecutor(options["workers"]) as executor:
+            futures = [
+                executor.submit(
+                    _worker,
+                    client,
+                    options,
+                    # Stagger the workloads so that all run concurrently.
+                    workloads[index % len(workloads) :]
+                    + workloads[: index % len(workloads)],
+                    deadline,
+                    results,
+                    lock,
+                )
+                for index in range(options["workers"])
+            ]
+            for future in futures:
+                future.result()
+        elapsed = time.monotonic() - start
+        client.close()
+
+    return {
+        "elapsed_seconds": elapsed,
+        "workloads": results,
+        "client_metrics": collector.snapshot(),
+        "server": server.stats(),
+    }
+
+
+def _print_results(report: dict):
+    elapsed = report["elapsed_seconds"]
+    print(
+        f"{'workload':<24} {'ops':>7} {'ops/s':>9} {'mean ms':>9} "
+        f"{'failures':>9} {'items':>12}"
+    )
+    for name, result in report["workloads"].items():
+        operations = result["operations"]
+        mean_ms = result["seconds"] / operations * 1000 if operations else 0.0
+        print(
+            f"{name:<24} {operations:>7} {operations / elapsed:>9.1f} "
+            f"{mean_ms:>9.1f} {result['failures']:>9} {result['items']:>12,}"
+        )
+        if "last_error" in result:
+            print(f"    last error: {result['last_error']}")
+
+    print()
+    print(f"{'endpoint':<60} {'attempts':>9} {'retries':>8} {'p50 ms':>8}")
+    for series in report["client_metrics"]["requests"]:
+        latency = series["latency"]
+        print(
+            f"{(series['operation'] or series['path_template'] or '?'):<60} "
+            f"{series['attempts']:>9} {series['retries']:>8} "
+            f"{_median_ms(latency):>8.1f}"
+        )
+    uploads = report["client_metrics"]["uploads"]
+    if uploads["requests"]:
+        print(
+            f"{'resumable upload requests':<60} {uploads['requests']:>9} "
+            f"{'':>8} {_median_ms(uploads['latency']):>8.1f}"
+        )
+
+    server = report["server"]
+    print()
+    print(f"server requests: {sum(server['requests'].values()):,}")
+    print(f"injected errors: {sum(server['injected_errors'].values()):,}")
+
+
+def _median_ms(histogram: dict) -> float:
+    """Upper bound of the latency bucket holding the median, in milliseconds."""
+    count = histogram["count"]
+    if not count:
+        return 0.0
+    seen = 0
+    for bound, bucket_count in zip(histogram["bounds"], histogram["counts"]):
+        seen += bucket_count
+        if seen * 2 >= count:
+            return bound * 1000
+    return float("inf")
+
+
+def _main():
+    options = _parse_args()
+    report = run(options)
+    _print_results(report)
+
+    if options["json"]:
+        server = report["server"]
+        server["injected_errors"] = {
+            f"{endpoint} {code}": count
+            for (endpoint, code), count in server["injected_errors"].items()
+        }
+        with open(options["json"], "w", encoding="utf-8") as json_file:
+            json.dump(report, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    _main()
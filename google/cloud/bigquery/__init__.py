@@ -102,6 +102,7 @@ from google.cloud.bigquery.routine import ExternalRuntimeOptions
 from google.cloud.bigquery.schema import PolicyTagList
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.schema import FieldElementType
+from google.cloud.bigquery.schema import FrozenSchema
 from google.cloud.bigquery.standard_sql import StandardSqlDataType
 from google.cloud.bigquery.standard_sql import StandardSqlField
 from google.cloud.bigquery.standard_sql import StandardSqlStructType
@@ -118,11 +119,6 @@ from google.cloud.bigquery.table import TimePartitioning
 from google.cloud.bigquery.encryption_configuration import EncryptionConfiguration
 from google.cloud.bigquery import _versions_helpers
 
-try:
-    import bigquery_magics  # type: ignore
-except ImportError:
-    bigquery_magics = None
-
 sys_major, sys_minor, sys_micro = _versions_helpers.extract_runtime_version()
 
 if sys_major == 3 and sys_minor in (7, 8):
@@ -186,6 +182,7 @@ __all__ = [
     # Shared helpers
     "SchemaField",
     "FieldElementType",
+    "FrozenSchema",
     "PolicyTagList",
     "UDFResource",
     "ExternalConfig",
@@ -234,6 +231,24 @@ __all__ = [
 ]
 
 
+def _import_bigquery_magics():
+    # bigquery_magics imports IPython, so wait until it is needed.
+    if "bigquery_magics" not in globals():
+        try:
+            import bigquery_magics  # type: ignore
+        except ImportError:
+            bigquery_magics = None
+        globals()["bigquery_magics"] = bigquery_magics
+    return globals()["bigquery_magics"]
+
+
+def __getattr__(name):
+    # PEP 562: resolve optional, slow to import modules on first access.
+    if name == "bigquery_magics":
+        return _import_bigquery_magics()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def load_ipython_extension(ipython):
     """Called by IPython when this module is loaded as an IPython extension."""
     warnings.warn(
@@ -241,8 +256,9 @@ def load_ipython_extension(ipython):
         category=FutureWarning,
     )
 
-    if bigquery_magics is not None:
-        bigquery_magics.load_ipython_extension(ipython)
+    magics_module = _import_bigquery_magics()
+    if magics_module is not None:
+        magics_module.load_ipython_extension(ipython)
     else:
         from google.cloud.bigquery.magics.magics import _cell_magic
 
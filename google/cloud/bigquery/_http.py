@@ -16,6 +16,7 @@
 
 from google.cloud import _http  # type: ignore  # pytype: disable=import-error
 from google.cloud.bigquery import __version__
+from google.cloud.bigquery import metrics
 
 
 class Connection(_http.JSONConnection):
@@ -45,3 +46,10 @@ class Connection(_http.JSONConnection):
 
     API_URL_TEMPLATE = "{api_base_url}/bigquery/{api_version}{path}"  # type: ignore
     """A template for the URL of a particular API call."""
+
+    def _do_request(self, *args, **kwargs):
+        response = super(Connection, self)._do_request(*args, **kwargs)
+        # Make the status code and response size available to metrics hooks,
+        # since ``api_request`` only returns the decoded payload.
+        metrics._record_response(response)
+        return response
@@ -37,10 +37,13 @@ predicates where it is safe to generate a new query ID.
 
 from __future__ import annotations
 
+import collections
 import copy
 import dataclasses
 import datetime
 import functools
+import json
+import threading
 import uuid
 import textwrap
 from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, Union
@@ -742,6 +745,70 @@ def _wait_or_cancel(
         raise
 
 
+_QUERY_ESTIMATE_CACHE_SIZE = 1024
+
+
+def query_estimate_cache_key(
+    query: str, job_config: job.QueryJobConfig, project: str, location: Optional[str]
+) -> tuple:
+    """Key of a dry run in a :class:`QueryEstimateCache`.
+
+    The key covers everything the dry run depends on, other than the data of
+    the tables the query reads: the SQL, the project and location, and the
+    whole job configuration including the query parameters.
+    """
+    config_json = json.dumps(job_config.to_api_repr(), sort_keys=True, default=str)
+    return (project, location, query, config_json)
+
+
+class QueryEstimateCache:
+    """Dry-run query jobs of :meth:`~google.cloud.bigquery.Client.estimate_query`.
+
+    A least recently used cache of ``(query_job, as_of)`` pairs, where
+    ``as_of`` is the time of the dry run. An estimate is only valid while
+    none of the tables the query references was modified after ``as_of``,
+    which the client checks before using it.
+
+    Args:
+        max_size: Maximum number of dry runs to keep.
+    """
+
+    def __init__(self, max_size: int = _QUERY_ESTIMATE_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        """Return the ``(query_job, as_of)`` pair for ``key``, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, query_job: job.QueryJob, as_of: datetime.datetime):
+        """Remember the dry run ``query_job``, made at ``as_of``."""
+        with self._lock:
+            self._entries[key] = (query_job, as_of)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: tuple):
+        """Forget the dry run for ``key``, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Forget all dry runs."""
+        with self._lock:
+            self._entries.clear()
+
+
 @dataclasses.dataclass(frozen=True)
 class QueryFinishedEvent:
     """Query finished successfully."""
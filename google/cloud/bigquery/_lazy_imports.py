@@ -0,0 +1,111 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deferred imports of heavy optional dependencies.
+
+pandas, pyarrow, db-dtypes and the BigQuery Storage client together add
+about a second to ``import google.cloud.bigquery``. Modules which only use
+them inside functions bind a :class:`LazyModule` placeholder instead, so the
+dependency is imported the first time it is actually needed.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, Optional
+
+
+class LazyModule:
+    """Placeholder for an optional module, imported on first use.
+
+    Attribute access is forwarded to the imported module. Truth testing
+    reports whether the module could be imported, so checks are written as
+    ``if not pandas:`` which also holds for a ``None`` patched in by tests.
+
+    Once the module has been imported, the placeholder replaces itself in
+    ``namespace`` so that subsequent global lookups get the real module.
+
+    Args:
+        name (str): Dotted name of the module to import.
+        namespace (Dict[str, Any]):
+            Globals of the module which binds the placeholder.
+        attr (Optional[str]):
+            Name the placeholder is bound to in ``namespace``. Defaults to
+            ``name``.
+        loader (Optional[Callable[[], Any]]):
+            Returns the module, or ``None`` if it is unusable (for example,
+            too old). Defaults to importing ``name``.
+    """
+
+    __slots__ = (
+        "_name",
+        "_namespace",
+        "_attr",
+        "_loader",
+        "_loaded",
+        "_module",
+        "_import_error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        namespace: Dict[str, Any],
+        attr: Optional[str] = None,
+        loader: Optional[Callable[[], Any]] = None,
+    ):
+        self._name = name
+        self._namespace = namespace
+        self._attr = attr or name
+        self._loader = loader
+        self._loaded = False
+        self._module = None
+        self._import_error: Optional[ImportError] = None
+
+    def _load(self) -> Any:
+        if not self._loaded:
+            try:
+                if self._loader is None:
+                    self._module = importlib.import_module(self._name)
+                else:
+                    self._module = self._loader()
+            except ImportError as exc:
+                self._import_error = exc
+            self._loaded = True
+
+            if self._module is not None and self._namespace.get(self._attr) is self:
+                self._namespace[self._attr] = self._module
+
+        return self._module
+
+    def __getattr__(self, name: str) -> Any:
+        module = self._load()
+        if module is None:
+            raise AttributeError(
+                f"Optional module {self._name!r} is not available, "
+                f"cannot access {name!r}."
+            )
+        return getattr(module, name)
+
+    def __bool__(self) -> bool:
+        return self._load() is not None
+
+    def __repr__(self) -> str:
+        return f"<LazyModule {self._name!r}>"
+
+
+def import_error(module: Any) -> Optional[ImportError]:
+    """Return the error raised while importing ``module``, if any."""
+    if isinstance(module, LazyModule):
+        module._load()
+        return module._import_error
+    return None
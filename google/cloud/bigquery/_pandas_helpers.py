@@ -19,87 +19,90 @@ instead. See: go/pandas-gbq-and-bigframes-redundancy and
 https://github.com/googleapis/python-bigquery-pandas/blob/main/pandas_gbq/schema/pandas_to_bigquery.py
 """
 
+import collections
 import concurrent.futures
+import copy
 from datetime import datetime
+import decimal
 import functools
+import importlib.util
 from itertools import islice
+import json
 import logging
+import math
 import queue
 import threading
 import time
 import warnings
-from typing import Any, Union, Optional, Callable, Generator, List
+from typing import Any, Union, Optional, Callable, Generator, List, Sequence
 
 
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _lazy_imports
 from google.cloud.bigquery import _pyarrow_helpers
 from google.cloud.bigquery import _versions_helpers
+from google.cloud.bigquery import metrics
 from google.cloud.bigquery import retry as bq_retry
 from google.cloud.bigquery import schema
 
 
-try:
-    import pandas  # type: ignore
+pandas = _lazy_imports.LazyModule("pandas", globals())
+numpy = _lazy_imports.LazyModule("numpy", globals())
 
-    pandas_import_exception = None
-except ImportError as exc:
-    pandas = None
-    pandas_import_exception = exc
-else:
-    import numpy
 
-
-try:
+def _import_pandas_gbq():
     import pandas_gbq.schema.pandas_to_bigquery  # type: ignore
 
-    pandas_gbq_import_exception = None
-except ImportError as exc:
-    pandas_gbq = None
-    pandas_gbq_import_exception = exc
+    return pandas_gbq
+
+
+pandas_gbq = _lazy_imports.LazyModule(
+    "pandas_gbq", globals(), loader=_import_pandas_gbq
+)
+db_dtypes = _lazy_imports.LazyModule("db_dtypes", globals())
+
+# Names of the db_dtypes.DateDtype and db_dtypes.TimeDtype extension types.
+# Spelled out so that looking them up does not import db_dtypes (and pandas).
+date_dtype_name = "dbdate"
+time_dtype_name = "dbtime"
+
+pyarrow = _lazy_imports.LazyModule(
+    "pyarrow", globals(), loader=_versions_helpers.PYARROW_VERSIONS.try_import
+)
+
 
+def _import_shapely():
+    import shapely.geometry.base  # type: ignore
 
-try:
-    import db_dtypes  # type: ignore
+    return shapely
 
-    date_dtype_name = db_dtypes.DateDtype.name
-    time_dtype_name = db_dtypes.TimeDtype.name
-    db_dtypes_import_exception = None
-except ImportError as exc:
-    db_dtypes = None
-    db_dtypes_import_exception = exc
-    date_dtype_name = time_dtype_name = ""  # Use '' rather than None because pytype
 
-pyarrow = _versions_helpers.PYARROW_VERSIONS.try_import()
+shapely = _lazy_imports.LazyModule("shapely", globals(), loader=_import_shapely)
 
-try:
-    # _BaseGeometry is used to detect shapely objevys in `bq_to_arrow_array`
-    from shapely.geometry.base import BaseGeometry as _BaseGeometry  # type: ignore
-except ImportError:
-    # No shapely, use NoneType for _BaseGeometry as a placeholder.
-    _BaseGeometry = type(None)
-else:
-    # We don't have any unit test sessions that install shapely but not pandas.
-    if pandas is not None:  # pragma: NO COVER
 
-        def _to_wkb():
-            from shapely import wkb  # type: ignore
+def _is_geometry(value) -> bool:
+    """True if ``value`` is a shapely geometry object."""
+    return bool(shapely) and isinstance(value, shapely.geometry.base.BaseGeometry)
 
-            write = wkb.dumps
-            notnull = pandas.notnull
 
-            def _to_wkb(v):
-                return write(v) if notnull(v) else v
+def _make_to_wkb():
+    from shapely import wkb  # type: ignore
 
-            return _to_wkb
+    write = wkb.dumps
+    notnull = pandas.notnull
 
-        _to_wkb = _to_wkb()
+    def _to_wkb(v):
+        return write(v) if notnull(v) else v
 
-try:
-    from google.cloud.bigquery_storage_v1.types import ArrowSerializationOptions
-except ImportError:
-    _ARROW_COMPRESSION_SUPPORT = False
-else:
-    # Having BQ Storage available implies that pyarrow >=1.0.0 is available, too.
-    _ARROW_COMPRESSION_SUPPORT = True
+    return _to_wkb
+
+
+# Check for the package without importing it, the BigQuery Storage client
+# takes a long time to import. Having BQ Storage available implies that
+# pyarrow >=1.0.0 is available, too.
+_ARROW_COMPRESSION_SUPPORT = (
+    importlib.util.find_spec("google.cloud.bigquery_storage_v1") is not None
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -107,6 +110,9 @@ _PROGRESS_INTERVAL = 0.2  # Maximum time between download status checks, in seco
 
 _MAX_QUEUE_SIZE_DEFAULT = object()  # max queue size sentinel for BQ Storage downloads
 
+# Maximum number of DataFrame shapes whose inferred BigQuery schema is cached.
+_SCHEMA_INFERENCE_CACHE_SIZE = 256
+
 _NO_PANDAS_ERROR = "Please install the 'pandas' package to use this function."
 _NO_DB_TYPES_ERROR = "Please install the 'db-dtypes' package to use this function."
 
@@ -132,7 +138,7 @@ _PANDAS_DTYPE_TO_BQ = {
 class _DownloadState(object):
     """Flag to indicate that a thread should exit early."""
 
-    def __init__(self):
+    def __init__(self, profile=None):
         # No need for a lock because reading/replacing a variable is defined to
         # be an atomic operation in the Python language definition (enforced by
         # the global interpreter lock).
@@ -144,6 +150,8 @@ class _DownloadState(object):
         self.started_workers = 0
         self._finished_workers_lock = threading.Lock()
         self.finished_workers = 0
+        # Optional metrics.DownloadProfile shared with the worker threads.
+        self.profile = profile
 
     def start(self):
         with self._started_workers_lock:
@@ -352,10 +360,10 @@ def bq_to_arrow_array(series, bq_field):
         arrow_type = None
         first = _first_valid(series)
         if first is not None:
-            if series.dtype.name == "geometry" or isinstance(first, _BaseGeometry):
+            if series.dtype.name == "geometry" or _is_geometry(first):
                 arrow_type = pyarrow.binary()
                 # Convert shapey geometry to WKB binary format:
-                series = series.apply(_to_wkb)
+                series = series.apply(_make_to_wkb())
             elif isinstance(first, bytes):
                 arrow_type = pyarrow.binary()
         elif series.dtype.name == "geometry":
@@ -460,7 +468,136 @@ def _first_array_valid(series):
     return valid_item
 
 
-def dataframe_to_bq_schema(dataframe, bq_schema):
+class SchemaInferenceCache:
+    """BigQuery schemas inferred by :func:`dataframe_to_bq_schema`.
+
+    A least recently used cache of schemas, keyed by the names and dtypes of
+    the DataFrame columns and indexes, see :func:`_schema_inference_key`.
+    Schemas are stored as API representations, so that callers changing the
+    returned fields do not change the cached schema.
+
+    Args:
+        max_size: Maximum number of schemas to keep.
+    """
+
+    def __init__(self, max_size: int = _SCHEMA_INFERENCE_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        """Return a copy of the schema inferred for ``key``, if any."""
+        with self._lock:
+            resources = self._entries.get(key)
+            if resources is None:
+                return None
+            self._entries.move_to_end(key)
+        return tuple(
+            schema.SchemaField.from_api_repr(copy.deepcopy(resource))
+            for resource in resources
+        )
+
+    def put(self, key: tuple, fields: Sequence[schema.SchemaField]):
+        """Remember the schema ``fields`` inferred for ``key``."""
+        resources = tuple(copy.deepcopy(field.to_api_repr()) for field in fields)
+        with self._lock:
+            self._entries[key] = resources
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget all schemas."""
+        with self._lock:
+            self._entries.clear()
+
+
+_SCHEMA_INFERENCE_CACHE = SchemaInferenceCache()
+
+# Number of non-null values of each ``object`` column which key the schema
+# cache. Later values are assumed to have the same structure.
+_SCHEMA_KEY_SAMPLE_SIZE = 100
+
+
+def _value_structure(value):
+    """Structure of an ``object`` value which schema inference depends on.
+
+    Returns ``None`` for null values. Mappings are described by their keys
+    and the structure of their values, arrays by the structures of their
+    items, and other values by their type, plus the time zone awareness of
+    datetimes and the digits and exponent of decimals.
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(sorted((str(k), _value_structure(v)) for k, v in value.items())),
+        )
+    if isinstance(value, (list, tuple, numpy.ndarray)):
+        return (list, frozenset(_value_structure(item) for item in value))
+    if value is None or value is pandas.NA or value is pandas.NaT:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, datetime):
+        return (type(value), value.tzinfo is not None)
+    if isinstance(value, decimal.Decimal):
+        digits = value.as_tuple()
+        return (type(value), len(digits.digits), digits.exponent)
+    return type(value)
+
+
+def _object_column_structure(series):
+    """Structures of the first non-null values of an ``object`` column.
+
+    The column is read in chunks until :data:`_SCHEMA_KEY_SAMPLE_SIZE`
+    non-null values are found, so keying a column which is mostly not null
+    costs the same however long it is.
+    """
+    values: List[Any] = []
+    start = 0
+    while len(values) < _SCHEMA_KEY_SAMPLE_SIZE and start < len(series):
+        chunk = series.iloc[start : start + _SCHEMA_KEY_SAMPLE_SIZE].dropna()
+        values.extend(chunk.iloc[: _SCHEMA_KEY_SAMPLE_SIZE - len(values)])
+        start += _SCHEMA_KEY_SAMPLE_SIZE
+    return frozenset(_value_structure(value) for value in values)
+
+
+def _schema_inference_key(dataframe, bq_schema, sample_size):
+    """Key of the schema inferred for ``dataframe`` in the schema cache.
+
+    Columns of ``object`` dtype can hold any Python values, so their key
+    includes the structures of their first non-null values, see
+    :func:`_value_structure`. Returns ``None`` if the DataFrame cannot be
+    keyed, e.g. if it has duplicate column names.
+    """
+    if dataframe.columns.has_duplicates:
+        return None
+
+    columns = []
+    for column, dtype in list_columns_and_indexes(dataframe):
+        if dtype == object:
+            sample = _object_column_structure(get_column_or_index(dataframe, column))
+        else:
+            sample = frozenset()
+        columns.append((column, dtype, sample))
+
+    overrides = tuple(
+        json.dumps(field.to_api_repr(), sort_keys=True)
+        for field in schema._to_schema_fields(bq_schema or [])
+    )
+    key = (tuple(columns), overrides, sample_size, bool(pandas_gbq), bool(pyarrow))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def dataframe_to_bq_schema(dataframe, bq_schema, sample_size=None, use_cache=False):
     """Convert a pandas DataFrame schema to a BigQuery schema.
 
     DEPRECATED: Use
@@ -476,26 +613,60 @@ def dataframe_to_bq_schema(dataframe, bq_schema):
         ]]):
             A BigQuery schema. Use this argument to override the autodetected
             type for some or all of the DataFrame columns.
+        sample_size (Optional[int]):
+            If set, infer the type of ``object`` columns from their first
+            ``sample_size`` values only, instead of converting the whole
+            column. Values past the sample must have the same type. Ignored
+            when ``pandas-gbq`` is installed.
+        use_cache (Optional[bool]):
+            If ``True``, cache schemas by the names and dtypes of the
+            DataFrame columns and indexes, and by the structure of the values
+            of ``object`` columns, so that loading many DataFrames of the
+            same shape only infers the schema once. The cache assumes that
+            ``object`` columns are homogeneous: they are keyed by the
+            structure of their first 100 non-null values, and a DataFrame
+            whose later values have another type or structure may get the
+            schema of an earlier DataFrame. Defaults to ``False``.
 
     Returns:
         Optional[Sequence[google.cloud.bigquery.schema.SchemaField]]:
             The automatically determined schema. Returns None if the type of
             any column cannot be determined.
     """
-    if pandas_gbq is None:
+    if not pandas_gbq:
         warnings.warn(
             "Loading pandas DataFrame into BigQuery will require pandas-gbq "
             "package version 0.26.1 or greater in the future. "
-            f"Tried to import pandas-gbq and got: {pandas_gbq_import_exception}",
+            f"Tried to import pandas-gbq and got: {_lazy_imports.import_error(pandas_gbq)}",
             category=FutureWarning,
         )
-    else:
-        return pandas_gbq.schema.pandas_to_bigquery.dataframe_to_bigquery_fields(
-            dataframe,
-            override_bigquery_fields=bq_schema,
-            index=True,
+
+    key = None
+    if use_cache:
+        key = _schema_inference_key(dataframe, bq_schema, sample_size)
+    if key is not None:
+        cached = _SCHEMA_INFERENCE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    if pandas_gbq:
+        bq_schema_out = (
+            pandas_gbq.schema.pandas_to_bigquery.dataframe_to_bigquery_fields(
+                dataframe,
+                override_bigquery_fields=bq_schema,
+                index=True,
+            )
         )
+    else:
+        bq_schema_out = _infer_bq_schema(dataframe, bq_schema, sample_size)
+
+    if key is not None and bq_schema_out is not None:
+        _SCHEMA_INFERENCE_CACHE.put(key, bq_schema_out)
+    return bq_schema_out
+
 
+def _infer_bq_schema(dataframe, bq_schema, sample_size):
+    """Infer the BigQuery schema of ``dataframe``, see :func:`dataframe_to_bq_schema`."""
     if bq_schema:
         bq_schema = schema._to_schema_fields(bq_schema)
         bq_schema_index = {field.name: field for field in bq_schema}
@@ -520,17 +691,16 @@ def dataframe_to_bq_schema(dataframe, bq_schema):
         bq_type = _PANDAS_DTYPE_TO_BQ.get(dtype.name)
         if bq_type is None:
             sample_data = _first_valid(dataframe_reset_index[column])
-            if (
-                isinstance(sample_data, _BaseGeometry)
-                and sample_data is not None  # Paranoia
-            ):
+            if _is_geometry(sample_data) and sample_data is not None:  # Paranoia
                 bq_type = "GEOGRAPHY"
         if bq_type is not None:
             bq_schema_out.append(schema.SchemaField(column, bq_type))
             continue
 
         # Step 3: try with pyarrow if available
-        bq_field = _get_schema_by_pyarrow(column, dataframe_reset_index[column])
+        bq_field = _get_schema_by_pyarrow(
+            column, dataframe_reset_index[column], sample_size
+        )
         if bq_field is not None:
             bq_schema_out.append(bq_field)
             continue
@@ -556,7 +726,14 @@ def dataframe_to_bq_schema(dataframe, bq_schema):
     return tuple(bq_schema_out)
 
 
-def _get_schema_by_pyarrow(name, series):
+def _is_null_arrow_type(arrow_type):
+    """True if ``arrow_type`` carries no information, e.g. all values are null."""
+    if pyarrow.types.is_list(arrow_type):
+        return pyarrow.types.is_null(arrow_type.value_type)
+    return pyarrow.types.is_null(arrow_type)
+
+
+def _get_schema_by_pyarrow(name, series, sample_size=None):
     """Attempt to detect the type of the given series by leveraging PyArrow's
     type detection capabilities.
 
@@ -569,6 +746,9 @@ def _get_schema_by_pyarrow(name, series):
             the column name of the SchemaField.
         series (pandas.Series):
             The Series data for which to detect the data type.
+        sample_size (Optional[int]):
+            If set, convert only the first ``sample_size`` values, unless
+            they are all null.
     Returns:
         Optional[google.cloud.bigquery.schema.SchemaField]:
             A tuple containing the BigQuery-compatible type string (e.g.,
@@ -581,7 +761,14 @@ def _get_schema_by_pyarrow(name, series):
     if not pyarrow:
         return None
 
-    arrow_table = pyarrow.array(series)
+    arrow_table = None
+    if sample_size is not None and len(series) > sample_size:
+        arrow_table = pyarrow.array(series.iloc[:sample_size])
+        if _is_null_arrow_type(arrow_table.type):
+            arrow_table = None
+    if arrow_table is None:
+        arrow_table = pyarrow.array(series)
+
     if pyarrow.types.is_list(arrow_table.type):
         # `pyarrow.ListType`
         mode = "REPEATED"
@@ -725,23 +912,119 @@ def dataframe_to_parquet(
     )
 
 
-def _row_iterator_page_to_arrow(page, column_names, arrow_types):
+def _json_values_to_arrow(values, field, arrow_type, repeated):
+    """Convert the REST API values of one column to an Arrow array.
+
+    Nested values are decoded column-wise: the items of arrays and the
+    subfields of structs are collected into flat lists, converted to child
+    arrays, and assembled with offsets and validity masks. This avoids
+    building a Python ``list`` or ``dict`` per cell, only for ``pyarrow`` to
+    take it apart again.
+
+    Args:
+        values (List[Any]): The ``"v"`` values of the cells of the column.
+        field (google.cloud.bigquery._helpers.CompiledSchemaField):
+            The field of the column, compiled with
+            :data:`~google.cloud.bigquery._helpers.DATA_FRAME_CELL_DATA_PARSER`.
+        arrow_type (pyarrow.DataType): The Arrow type of the column.
+        repeated (bool): Whether ``values`` are arrays of ``field`` values.
+
+    Returns:
+        pyarrow.Array: The values of the column.
+    """
+    if repeated:
+        offsets = [0]
+        items = []
+        for value in values:
+            if value:
+                items.extend([item["v"] for item in value])
+            offsets.append(len(items))
+        child = _json_values_to_arrow(items, field, arrow_type.value_type, False)
+        return pyarrow.ListArray.from_arrays(
+            pyarrow.array(offsets, type=pyarrow.int32()), child
+        )
+
+    if field.field_type in schema._STRUCT_TYPES:
+        subfields = field.fields
+        columns = [[] for _ in subfields]
+        mask = []
+        for value in values:
+            if value is None:
+                mask.append(True)
+                for column in columns:
+                    column.append(None)
+            else:
+                mask.append(False)
+                for column, cell in zip(columns, value["f"]):
+                    column.append(cell["v"])
+        children = [
+            _json_values_to_arrow(
+                column, subfield, arrow_type[index].type, subfield.is_repeated
+            )
+            for index, (column, subfield) in enumerate(zip(columns, subfields))
+        ]
+        kwargs = {}
+        if any(mask):
+            kwargs["mask"] = pyarrow.array(mask, type=pyarrow.bool_())
+        return pyarrow.StructArray.from_arrays(
+            children, fields=list(arrow_type), **kwargs
+        )
+
+    converter = field.converter
+    return pyarrow.array(
+        [None if value is None else converter(value, field) for value in values],
+        type=arrow_type,
+    )
+
+
+def _is_nested_field(field):
+    return field.is_repeated or field.field_type in schema._STRUCT_TYPES
+
+
+def _row_iterator_page_to_arrow(
+    page, column_names, arrow_types, download_profile=None, compiled_schema=None
+):
+    start_time = time.monotonic()
+
     # Iterate over the page to force the API request to get the page data.
     try:
         next(iter(page))
     except StopIteration:
         pass
 
+    raw_page = getattr(page, "raw_page", None)
     arrays = []
     for column_index, arrow_type in enumerate(arrow_types):
-        arrays.append(pyarrow.array(page._columns[column_index], type=arrow_type))
+        field = compiled_schema[column_index] if compiled_schema else None
+        if (
+            field is not None
+            and arrow_type is not None
+            and isinstance(raw_page, dict)
+            and _is_nested_field(field)
+        ):
+            values = [row["f"][column_index]["v"] for row in raw_page.get("rows", ())]
+            array = _json_values_to_arrow(values, field, arrow_type, field.is_repeated)
+        else:
+            array = pyarrow.array(page._columns[column_index], type=arrow_type)
+        arrays.append(array)
 
     if isinstance(column_names, pyarrow.Schema):
-        return pyarrow.RecordBatch.from_arrays(arrays, schema=column_names)
-    return pyarrow.RecordBatch.from_arrays(arrays, names=column_names)
+        record_batch = pyarrow.RecordBatch.from_arrays(arrays, schema=column_names)
+    else:
+        record_batch = pyarrow.RecordBatch.from_arrays(arrays, names=column_names)
+
+    if download_profile is not None:
+        download_profile.record(
+            metrics.DownloadPhase.ARROW_DECODE,
+            duration=time.monotonic() - start_time,
+            bytes=record_batch.nbytes,
+            rows=record_batch.num_rows,
+            pages=1,
+        )
+    return record_batch
 
 
-def download_arrow_row_iterator(pages, bq_schema, timeout=None):
+def download_arrow_row_iterator(pages, bq_schema, timeout=None, download_profile=None):
     """Use HTTP JSON RowIterator to construct an iterable of RecordBatches.
 
     Args:
@@ -755,6 +1038,8 @@ def download_arrow_row_iterator(pages, bq_schema, timeout=None):
         timeout (Optional[float]):
             The number of seconds to wait for the underlying download to complete.
             If ``None``, wait indefinitely.
+        download_profile (Optional[google.cloud.bigquery.metrics.DownloadProfile]):
+            If set, record the time spent converting pages to Arrow.
 
     Yields:
         :class:`pyarrow.RecordBatch`
@@ -763,20 +1048,27 @@ def download_arrow_row_iterator(pages, bq_schema, timeout=None):
     bq_schema = schema._to_schema_fields(bq_schema)
     column_names = bq_to_arrow_schema(bq_schema) or [field.name for field in bq_schema]
     arrow_types = [bq_to_arrow_data_type(field) for field in bq_schema]
+    compiled_schema = _helpers.DATA_FRAME_CELL_DATA_PARSER.compile_schema(bq_schema)
 
     if timeout is None:
         for page in pages:
-            yield _row_iterator_page_to_arrow(page, column_names, arrow_types)
+            yield _row_iterator_page_to_arrow(
+                page, column_names, arrow_types, download_profile, compiled_schema
+            )
     else:
         start_time = time.monotonic()
         for page in pages:
             if time.monotonic() - start_time > timeout:
                 raise concurrent.futures.TimeoutError()
 
-            yield _row_iterator_page_to_arrow(page, column_names, arrow_types)
+            yield _row_iterator_page_to_arrow(
+                page, column_names, arrow_types, download_profile, compiled_schema
+            )
+
 
+def _row_iterator_page_to_dataframe(page, column_names, dtypes, download_profile=None):
+    start_time = time.monotonic()
 
-def _row_iterator_page_to_dataframe(page, column_names, dtypes):
     # Iterate over the page to force the API request to get the page data.
     try:
         next(iter(page))
@@ -788,10 +1080,21 @@ def _row_iterator_page_to_dataframe(page, column_names, dtypes):
         dtype = dtypes.get(column_name)
         columns[column_name] = pandas.Series(page._columns[column_index], dtype=dtype)
 
-    return pandas.DataFrame(columns, columns=column_names)
+    frame = pandas.DataFrame(columns, columns=column_names)
+
+    if download_profile is not None:
+        download_profile.record(
+            metrics.DownloadPhase.PANDAS_CONVERSION,
+            duration=time.monotonic() - start_time,
+            rows=len(frame),
+            pages=1,
+        )
+    return frame
 
 
-def download_dataframe_row_iterator(pages, bq_schema, dtypes, timeout=None):
+def download_dataframe_row_iterator(
+    pages, bq_schema, dtypes, timeout=None, download_profile=None
+):
     """Use HTTP JSON RowIterator to construct a DataFrame.
 
     Args:
@@ -808,6 +1111,8 @@ def download_dataframe_row_iterator(pages, bq_schema, dtypes, timeout=None):
         timeout (Optional[float]):
             The number of seconds to wait for the underlying download to complete.
             If ``None``, wait indefinitely.
+        download_profile (Optional[google.cloud.bigquery.metrics.DownloadProfile]):
+            If set, record the time spent converting pages to DataFrames.
 
     Yields:
         :class:`pandas.DataFrame`
@@ -818,14 +1123,18 @@ def download_dataframe_row_iterator(pages, bq_schema, dtypes, timeout=None):
 
     if timeout is None:
         for page in pages:
-            yield _row_iterator_page_to_dataframe(page, column_names, dtypes)
+            yield _row_iterator_page_to_dataframe(
+                page, column_names, dtypes, download_profile
+            )
     else:
         start_time = time.monotonic()
         for page in pages:
             if time.monotonic() - start_time > timeout:
                 raise concurrent.futures.TimeoutError()
 
-            yield _row_iterator_page_to_dataframe(page, column_names, dtypes)
+            yield _row_iterator_page_to_dataframe(
+                page, column_names, dtypes, download_profile
+            )
 
 
 def _bqstorage_page_to_arrow(page):
@@ -852,9 +1161,28 @@ def _download_table_bqstorage_stream(
         else:
             rowstream = reader.rows(session)
 
+        profile = download_state.profile
+        read_start = time.monotonic()
         for page in rowstream.pages:
+            if profile is not None:
+                decode_start = time.monotonic()
+                profile.record(
+                    metrics.DownloadPhase.STREAM_READ,
+                    duration=decode_start - read_start,
+                    rows=getattr(page, "num_items", 0),
+                    pages=1,
+                    stream=stream.name,
+                )
+
             item = page_to_item(page)
 
+            if profile is not None:
+                profile.record(
+                    metrics.DownloadPhase.ARROW_DECODE,
+                    duration=time.monotonic() - decode_start,
+                    bytes=getattr(item, "nbytes", 0),
+                )
+
             # Make sure we set a timeout on put() so that we give the worker
             # thread opportunities to shutdown gracefully, for example if the
             # parent thread shuts down or the parent generator object which
@@ -868,6 +1196,8 @@ def _download_table_bqstorage_stream(
                     break
                 except queue.Full:
                     continue
+
+            read_start = time.monotonic()
     finally:
         download_state.finish()
 
@@ -897,6 +1227,7 @@ def _download_table_bqstorage(
     max_stream_count: Optional[int] = None,
     download_state: Optional[_DownloadState] = None,
     timeout: Optional[float] = None,
+    download_profile: Optional[metrics.DownloadProfile] = None,
 ) -> Generator[Any, None, None]:
     """Downloads a BigQuery table using the BigQuery Storage API.
 
@@ -930,6 +1261,9 @@ def _download_table_bqstorage(
         timeout (Optional[float]):
             The number of seconds to wait for the download to complete.
             If None, wait indefinitely.
+        download_profile (Optional[google.cloud.bigquery.metrics.DownloadProfile]):
+            If set, record the time spent creating the read session, reading
+            each stream and decoding pages.
 
     Yields:
         pandas.DataFrame: Pandas DataFrames, one for each chunk of data
@@ -968,7 +1302,7 @@ def _download_table_bqstorage(
     if _ARROW_COMPRESSION_SUPPORT:
         requested_session.read_options.arrow_serialization_options.buffer_compression = (
             # CompressionCodec(1) -> LZ4_FRAME
-            ArrowSerializationOptions.CompressionCodec(1)
+            bigquery_storage.types.ArrowSerializationOptions.CompressionCodec(1)
         )
 
     retry_policy = (
@@ -982,6 +1316,11 @@ def _download_table_bqstorage(
         retry=retry_policy,
         timeout=timeout,
     )
+    if download_profile is not None:
+        download_profile.record(
+            metrics.DownloadPhase.CREATE_READ_SESSION,
+            duration=time.monotonic() - start_time,
+        )
 
     _LOGGER.debug(
         "Started reading table '{}.{}.{}' with BQ Storage API session '{}'.".format(
@@ -999,6 +1338,8 @@ def _download_table_bqstorage(
     # See: https://stackoverflow.com/a/29237343/101923
     if download_state is None:
         download_state = _DownloadState()
+    if download_profile is not None:
+        download_state.profile = download_profile
 
     # Create a queue to collect frames as they are created in each thread.
     #
@@ -1089,6 +1430,7 @@ def download_arrow_bqstorage(
     max_queue_size=_MAX_QUEUE_SIZE_DEFAULT,
     max_stream_count=None,
     timeout=None,
+    download_profile=None,
 ):
     return _download_table_bqstorage(
         project_id,
@@ -1100,6 +1442,7 @@ def download_arrow_bqstorage(
         max_queue_size=max_queue_size,
         max_stream_count=max_stream_count,
         timeout=timeout,
+        download_profile=download_profile,
     )
 
 
@@ -1114,6 +1457,7 @@ def download_dataframe_bqstorage(
     max_queue_size=_MAX_QUEUE_SIZE_DEFAULT,
     max_stream_count=None,
     timeout=None,
+    download_profile=None,
 ):
     page_to_item = functools.partial(_bqstorage_page_to_dataframe, column_names, dtypes)
     return _download_table_bqstorage(
@@ -1126,6 +1470,7 @@ def download_dataframe_bqstorage(
         max_queue_size=max_queue_size,
         max_stream_count=max_stream_count,
         timeout=timeout,
+        download_profile=download_profile,
     )
 
 
@@ -1166,10 +1511,10 @@ def dataframe_to_json_generator(dataframe):
 
 
 def verify_pandas_imports():
-    if pandas is None:
-        raise ValueError(_NO_PANDAS_ERROR) from pandas_import_exception
-    if db_dtypes is None:
-        raise ValueError(_NO_DB_TYPES_ERROR) from db_dtypes_import_exception
+    if not pandas:
+        raise ValueError(_NO_PANDAS_ERROR) from _lazy_imports.import_error(pandas)
+    if not db_dtypes:
+        raise ValueError(_NO_DB_TYPES_ERROR) from _lazy_imports.import_error(db_dtypes)
 
 
 def determine_requested_streams(
@@ -21,20 +21,13 @@ and
 https://github.com/googleapis/python-bigquery-pandas/blob/main/pandas_gbq/schema/pyarrow_to_bigquery.py
 """
 
-from typing import Any
+import functools
+from typing import Any, Dict, Tuple
 
-try:
-    import pyarrow  # type: ignore
-except ImportError:
-    pyarrow = None
+from google.cloud.bigquery import _lazy_imports
 
-try:
-    import db_dtypes  # type: ignore
-
-    db_dtypes_import_exception = None
-except ImportError as exc:
-    db_dtypes = None
-    db_dtypes_import_exception = exc
+pyarrow = _lazy_imports.LazyModule("pyarrow", globals())
+db_dtypes = _lazy_imports.LazyModule("db_dtypes", globals())
 
 
 def pyarrow_datetime():
@@ -59,14 +52,19 @@ def pyarrow_timestamp():
     return pyarrow.timestamp("us", tz="UTC")
 
 
-_BQ_TO_ARROW_SCALARS = {}
-_ARROW_SCALAR_IDS_TO_BQ = {}
+@functools.lru_cache(maxsize=None)
+def _scalar_type_maps() -> Tuple[Dict[str, Any], Dict[Any, str]]:
+    """Build the BigQuery <-> Arrow scalar type maps on first use.
+
+    Returns empty maps if pyarrow is not installed.
+    """
+    if not pyarrow:
+        return {}, {}
 
-if pyarrow:
     # This dictionary is duplicated in bigquery_storage/test/unite/test_reader.py
     # When modifying it be sure to update it there as well.
     # Note(todo!!): type "BIGNUMERIC"'s matching pyarrow type is added in _pandas_helpers.py
-    _BQ_TO_ARROW_SCALARS = {
+    bq_to_arrow_scalars_map = {
         "BOOL": pyarrow.bool_,
         "BOOLEAN": pyarrow.bool_,
         "BYTES": pyarrow.binary,
@@ -89,7 +87,7 @@ if pyarrow:
     }
 
     # DEPRECATED: update pandas_gbq.schema.pyarrow_to_bigquery, instead.
-    _ARROW_SCALAR_IDS_TO_BQ = {
+    arrow_scalar_ids_to_bq_map = {
         # https://arrow.apache.org/docs/python/api/datatypes.html#type-classes
         pyarrow.bool_().id: "BOOL",
         pyarrow.int8().id: "INT64",
@@ -118,10 +116,11 @@ if pyarrow:
         # matched by id.
     }
 
-    _BQ_TO_ARROW_SCALARS["BIGNUMERIC"] = pyarrow_bignumeric
+    bq_to_arrow_scalars_map["BIGNUMERIC"] = pyarrow_bignumeric
     # The exact decimal's scale and precision are not important, as only
     # the type ID matters, and it's the same for all decimal256 instances.
-    _ARROW_SCALAR_IDS_TO_BQ[pyarrow.decimal256(76, scale=38).id] = "BIGNUMERIC"
+    arrow_scalar_ids_to_bq_map[pyarrow.decimal256(76, scale=38).id] = "BIGNUMERIC"
+    return bq_to_arrow_scalars_map, arrow_scalar_ids_to_bq_map
 
 
 def bq_to_arrow_scalars(bq_scalar: str):
@@ -133,7 +132,7 @@ def bq_to_arrow_scalars(bq_scalar: str):
         The Arrow scalar type that the input BigQuery scalar type maps to.
         If it cannot find the BigQuery scalar, return None.
     """
-    return _BQ_TO_ARROW_SCALARS.get(bq_scalar)
+    return _scalar_type_maps()[0].get(bq_scalar)
 
 
 def arrow_scalar_ids_to_bq(arrow_scalar: Any):
@@ -144,4 +143,4 @@ def arrow_scalar_ids_to_bq(arrow_scalar: Any):
         The BigQuery scalar type that the input arrow scalar type maps to.
         If it cannot find the arrow scalar, return None.
     """
-    return _ARROW_SCALAR_IDS_TO_BQ.get(arrow_scalar)
+    return _scalar_type_maps()[1].get(arrow_scalar)
@@ -26,10 +26,11 @@ try:
 except ImportError:
     tqdm = None
 
-try:
-    import tqdm.notebook as tqdm_notebook  # type: ignore
-except ImportError:
-    tqdm_notebook = None
+from google.cloud.bigquery import _lazy_imports
+
+# tqdm.notebook pulls in ipywidgets and IPython, only import it when a
+# notebook progress bar is requested.
+tqdm_notebook = _lazy_imports.LazyModule("tqdm.notebook", globals(), "tqdm_notebook")
 
 if typing.TYPE_CHECKING:  # pragma: NO COVER
     from google.cloud.bigquery import QueryJob
@@ -45,7 +46,7 @@ _PROGRESS_BAR_UPDATE_INTERVAL = 0.5
 
 def get_progress_bar(progress_bar_type, description, total, unit):
     """Construct a tqdm progress bar object, if tqdm is installed."""
-    if tqdm is None or tqdm_notebook is None and progress_bar_type == "tqdm_notebook":
+    if tqdm is None or progress_bar_type == "tqdm_notebook" and not tqdm_notebook:
         if progress_bar_type is not None:
             warnings.warn(_NO_TQDM_ERROR, UserWarning, stacklevel=3)
         return None
@@ -239,16 +239,24 @@ class PandasVersions:
 
 PANDAS_VERSIONS = PandasVersions()
 
-# Since RANGE support in pandas requires specific versions
-# of both pyarrow and pandas, we make this a separate
-# constant instead of as a property of PANDAS_VERSIONS
-# or PYARROW_VERSIONS.
-SUPPORTS_RANGE_PYARROW = (
-    PANDAS_VERSIONS.try_import() is not None
-    and PANDAS_VERSIONS.installed_version >= _MIN_PANDAS_VERSION_RANGE
-    and PYARROW_VERSIONS.try_import() is not None
-    and PYARROW_VERSIONS.installed_version >= _MIN_PYARROW_VERSION_RANGE
-)
+
+def __getattr__(name: str) -> Any:
+    # Since RANGE support in pandas requires specific versions
+    # of both pyarrow and pandas, we make this a separate
+    # constant instead of as a property of PANDAS_VERSIONS
+    # or PYARROW_VERSIONS. It is computed on first access (PEP 562), so
+    # that importing this module does not import pandas and pyarrow.
+    if name == "SUPPORTS_RANGE_PYARROW":
+        supports_range_pyarrow = (
+            PANDAS_VERSIONS.try_import() is not None
+            and PANDAS_VERSIONS.installed_version >= _MIN_PANDAS_VERSION_RANGE
+            and PYARROW_VERSIONS.try_import() is not None
+            and PYARROW_VERSIONS.installed_version >= _MIN_PYARROW_VERSION_RANGE
+        )
+        globals()[name] = supports_range_pyarrow
+        return supports_range_pyarrow
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def extract_runtime_version():
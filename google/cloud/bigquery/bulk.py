@@ -0,0 +1,249 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Report of bulk metadata operations.
+
+:meth:`~google.cloud.bigquery.client.Client.apply_metadata` compares table,
+view and routine definitions with the existing resources, then creates,
+updates and deletes resources concurrently. It returns a
+:class:`BulkReport` with one :class:`BulkResult` per definition and per
+deletion.
+"""
+
+import dataclasses
+from typing import Any, List, Optional, Tuple, Union
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import schema as _schema
+from google.cloud.bigquery.routine import Routine, RoutineReference
+from google.cloud.bigquery.table import Table, TableReference
+
+
+class BulkAction:
+    """Actions of a :class:`BulkResult`."""
+
+    CREATE = "CREATE"
+    """The resource did not exist and was created."""
+
+    UPDATE = "UPDATE"
+    """The resource differed from its definition and was updated."""
+
+    UNCHANGED = "UNCHANGED"
+    """The resource matched its definition."""
+
+    DELETE = "DELETE"
+    """The resource was deleted, or did not exist."""
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkResult:
+    """Outcome of one definition or deletion of a bulk operation."""
+
+    reference: Union[TableReference, RoutineReference]
+    """Reference of the table, view or routine."""
+
+    action: Optional[str]
+    """One of the :class:`BulkAction` values, or ``None`` if the existing
+    resource could not be read."""
+
+    fields: Tuple[str, ...] = ()
+    """Properties which differed from the definition, for updates."""
+
+    resource: Optional[Union[Table, Routine]] = None
+    """The resource returned by the API, if it was created, updated or
+    found unchanged. ``None`` for dry runs and deletions."""
+
+    error: Optional[Exception] = None
+    """The error which prevented the action, if any."""
+
+
+@dataclasses.dataclass
+class BulkReport:
+    """Results of a bulk operation, in the order of its definitions followed
+    by its deletions."""
+
+    results: List[BulkResult]
+    """The result of each definition and deletion."""
+
+    dry_run: bool = False
+    """Whether the actions were only planned, not applied."""
+
+    def _with_action(self, action):
+        return [r for r in self.results if r.action == action and r.error is None]
+
+    @property
+    def created(self) -> List[BulkResult]:
+        """Resources which were created."""
+        return self._with_action(BulkAction.CREATE)
+
+    @property
+    def updated(self) -> List[BulkResult]:
+        """Resources which were updated."""
+        return self._with_action(BulkAction.UPDATE)
+
+    @property
+    def unchanged(self) -> List[BulkResult]:
+        """Resources which matched their definitions."""
+        return self._with_action(BulkAction.UNCHANGED)
+
+    @property
+    def deleted(self) -> List[BulkResult]:
+        """Resources which were deleted."""
+        return self._with_action(BulkAction.DELETE)
+
+    @property
+    def errors(self) -> List[BulkResult]:
+        """Results whose action failed."""
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def ok(self) -> bool:
+        """Whether all actions succeeded."""
+        return not self.errors
+
+
+# Table properties which an update can change. Properties a definition does
+# not set are left as they are.
+_TABLE_UPDATABLE_PROPERTIES = (
+    "clustering_fields",
+    "description",
+    "encryption_configuration",
+    "expires",
+    "external_data_configuration",
+    "friendly_name",
+    "labels",
+    "max_staleness",
+    "mview_query",
+    "require_partition_filter",
+    "resource_tags",
+    "schema",
+    "table_constraints",
+    "time_partitioning",
+    "view_query",
+)
+
+_ROUTINE_UPDATABLE_PROPERTIES = (
+    "arguments",
+    "body",
+    "data_governance_type",
+    "description",
+    "determinism_level",
+    "external_runtime_options",
+    "imported_libraries",
+    "language",
+    "remote_function_options",
+    "return_table_type",
+    "return_type",
+    "type_",
+)
+
+
+def _matches(wanted: Any, existing: Any) -> bool:
+    """Whether an existing resource value matches the value of a definition.
+
+    Keys of mappings which the definition does not set are ignored, as the
+    API fills in defaults for them.
+    """
+    if isinstance(wanted, dict):
+        if not isinstance(existing, dict):
+            return False
+        return all(_matches(value, existing.get(key)) for key, value in wanted.items())
+    return wanted == existing
+
+
+def _table_changes(definition: Table, existing: Table):
+    """Compare a table definition with the existing table.
+
+    Returns:
+        Tuple[List[str], google.cloud.bigquery.table.Table]:
+            The properties to update, and the table to pass to
+            :meth:`~google.cloud.bigquery.client.Client.update_table`.
+
+    Raises:
+        ValueError: If the schema of the definition cannot be applied to the
+            existing table.
+    """
+    fields = []
+    for name in _TABLE_UPDATABLE_PROPERTIES:
+        api_field = Table._PROPERTY_TO_API_FIELD[name]
+        if name == "schema":
+            if not definition.schema:
+                continue
+            schema_diff = _schema.diff(existing.schema, definition.schema)
+            if not schema_diff.is_additive:
+                reasons = "; ".join(
+                    f"{path}: {reason}"
+                    for path, reason in schema_diff.incompatible.items()
+                )
+                raise ValueError(
+                    f"Cannot update the schema of {existing.reference}: {reasons}"
+                )
+            if schema_diff.has_changes:
+                fields.append(name)
+            continue
+        wanted = _helpers._get_sub_prop(definition._properties, api_field)
+        # Tables always have labels, only non-empty labels are managed.
+        if wanted is None or (name == "labels" and not wanted):
+            continue
+        current = _helpers._get_sub_prop(existing._properties, api_field)
+        if name == "labels":
+            changed = wanted != (current or {})
+        else:
+            changed = not _matches(wanted, current)
+        if changed:
+            fields.append(name)
+
+    patch = Table.from_api_repr(_helpers._copy_resource(definition._properties))
+    patch._properties["etag"] = existing.etag
+    if "schema" in fields:
+        patch.schema = _schema.evolve(existing.schema, definition.schema)
+    if "labels" in fields:
+        # Labels missing from a PATCH are kept, remove them explicitly.
+        patch.labels = {
+            **{key: None for key in existing.labels},
+            **definition.labels,
+        }
+    return fields, patch
+
+
+def _routine_changes(definition: Routine, existing: Routine):
+    """Compare a routine definition with the existing routine.
+
+    Routines are updated with a PUT, which replaces the whole resource, so
+    the routine to send is the existing routine with the properties of the
+    definition applied, and all of its properties are sent.
+
+    Returns:
+        Tuple[List[str], List[str], google.cloud.bigquery.routine.Routine]:
+            The properties which differ, the properties to send to
+            :meth:`~google.cloud.bigquery.client.Client.update_routine`, and
+            the routine to pass to it.
+    """
+    patch = Routine.from_api_repr(_helpers._copy_resource(existing._properties))
+    fields = []
+    for name in _ROUTINE_UPDATABLE_PROPERTIES:
+        api_field = Routine._PROPERTY_TO_API_FIELD[name]
+        wanted = definition._properties.get(api_field)
+        if wanted is None:
+            continue
+        if not _matches(wanted, existing._properties.get(api_field)):
+            fields.append(name)
+        patch._properties[api_field] = _helpers._copy_resource(wanted)
+
+    update_fields = [
+        name
+        for name in _ROUTINE_UPDATABLE_PROPERTIES
+        if patch._properties.get(Routine._PROPERTY_TO_API_FIELD[name]) is not None
+    ]
+    return fields, update_fields, patch
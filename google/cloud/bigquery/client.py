@@ -18,7 +18,9 @@ from __future__ import absolute_import
 from __future__ import annotations
 from __future__ import division
 
+import collections
 from collections import abc as collections_abc
+import concurrent.futures
 import copy
 import datetime
 import functools
@@ -29,6 +31,8 @@ import json
 import math
 import os
 import tempfile
+import threading
+import time
 import typing
 from typing import (
     Any,
@@ -36,6 +40,7 @@ from typing import (
     Dict,
     IO,
     Iterable,
+    Iterator,
     Mapping,
     List,
     Optional,
@@ -61,22 +66,18 @@ import google.cloud._helpers  # type: ignore
 from google.cloud import exceptions  # pytype: disable=import-error
 from google.cloud.client import ClientWithProject  # type: ignore  # pytype: disable=import-error
 
-try:
-    from google.cloud.bigquery_storage_v1.services.big_query_read.client import (
-        DEFAULT_CLIENT_INFO as DEFAULT_BQSTORAGE_CLIENT_INFO,
-    )
-except ImportError:
-    DEFAULT_BQSTORAGE_CLIENT_INFO = None  # type: ignore
-
 
 from google.auth.credentials import Credentials
 from google.cloud.bigquery._http import Connection
 from google.cloud.bigquery import _job_helpers
+from google.cloud.bigquery import _lazy_imports
 from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery import _versions_helpers
+from google.cloud.bigquery import bulk
 from google.cloud.bigquery import enums
 from google.cloud.bigquery import exceptions as bq_exceptions
 from google.cloud.bigquery import job
+from google.cloud.bigquery import metrics
 from google.cloud.bigquery._helpers import _get_sub_prop
 from google.cloud.bigquery._helpers import _record_field_to_json
 from google.cloud.bigquery._helpers import _str_or_none
@@ -119,7 +120,10 @@ from google.cloud.bigquery.retry import (
 )
 from google.cloud.bigquery.routine import Routine
 from google.cloud.bigquery.routine import RoutineReference
+from google.cloud.bigquery.schema import FrozenSchema
 from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.schema import diff as _diff_schema
+from google.cloud.bigquery.schema import evolve as _evolve_schema
 from google.cloud.bigquery.table import _table_arg_to_table
 from google.cloud.bigquery.table import _table_arg_to_table_ref
 from google.cloud.bigquery.table import Table
@@ -127,9 +131,11 @@ from google.cloud.bigquery.table import TableListItem
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import RowIterator
 
-pyarrow = _versions_helpers.PYARROW_VERSIONS.try_import()
-pandas = (
-    _versions_helpers.PANDAS_VERSIONS.try_import()
+pyarrow = _lazy_imports.LazyModule(
+    "pyarrow", globals(), loader=_versions_helpers.PYARROW_VERSIONS.try_import
+)
+pandas = _lazy_imports.LazyModule(
+    "pandas", globals(), loader=_versions_helpers.PANDAS_VERSIONS.try_import
 )  # mypy check fails because pandas import is outside module, there are type: ignore comments related to this
 
 
@@ -163,6 +169,26 @@ _LIST_ROWS_FROM_QUERY_RESULTS_FIELDS = "jobReference,totalRows,pageToken,rows"
 # https://github.com/googleapis/python-bigquery/issues/438
 _MIN_GET_QUERY_RESULTS_TIMEOUT = 120
 
+# Dry runs are cheap for the backend, but each is a full round trip.
+_MAX_ESTIMATE_WORKERS = 8
+
+# Each dataset is listed with its own sequence of page requests.
+_MAX_LIST_TABLES_WORKERS = 8
+
+# Matches the default size of the connection pool of the HTTP session, so
+# that concurrent get calls reuse its connections.
+_MAX_GET_WORKERS = 10
+
+# Each definition of apply_metadata() is a get call and at most one write.
+_MAX_APPLY_METADATA_WORKERS = 8
+
+# A crawl makes one tables.get call per table, which are short requests.
+_MAX_CRAWL_WORKERS = 16
+
+# How many times evolve_table_schema() re-reads a table which another writer
+# changed between the read and the update.
+_MAX_SCHEMA_EVOLUTION_ATTEMPTS = 5
+
 TIMEOUT_HEADER = "X-Server-Timeout"
 
 
@@ -228,6 +254,10 @@ class Client(ClientWithProject):
             Sets the default job creation mode used by query methods such as
             query_and_wait().  For lightweight queries, JOB_CREATION_OPTIONAL is
             generally recommended.
+        metrics_hook (Optional[google.cloud.bigquery.metrics.MetricsHook]):
+            Hook notified after each REST API attempt and each resumable
+            upload request, for example a
+            :class:`~google.cloud.bigquery.metrics.HistogramCollector`.
 
     Raises:
         google.auth.exceptions.DefaultCredentialsError:
@@ -251,6 +281,7 @@ class Client(ClientWithProject):
             Union[google.api_core.client_options.ClientOptions, Dict[str, Any]]
         ] = None,
         default_job_creation_mode: Optional[str] = None,
+        metrics_hook: Optional[metrics.MetricsHook] = None,
     ) -> None:
         if client_options is None:
             client_options = {}
@@ -286,6 +317,8 @@ class Client(ClientWithProject):
         self._location = location
         self._default_load_job_config = copy.deepcopy(default_load_job_config)
         self.default_job_creation_mode = default_job_creation_mode
+        self.metrics_hook = metrics_hook
+        self._query_estimate_cache = _job_helpers.QueryEstimateCache()
 
         # Use property setter so validation can run.
         self.default_query_job_config = default_query_job_config
@@ -304,6 +337,18 @@ class Client(ClientWithProject):
     def default_job_creation_mode(self, value: Optional[str]):
         self._default_job_creation_mode = value
 
+    @property
+    def metrics_hook(self) -> Optional[metrics.MetricsHook]:
+        """Hook notified after each REST API attempt and upload request.
+
+        See :mod:`google.cloud.bigquery.metrics`. Set to ``None`` to disable.
+        """
+        return self._metrics_hook
+
+    @metrics_hook.setter
+    def metrics_hook(self, value: Optional[metrics.MetricsHook]):
+        self._metrics_hook = value
+
     @property
     def default_query_job_config(self) -> Optional[QueryJobConfig]:
         """Default ``QueryJobConfig`` or ``None``.
@@ -466,6 +511,8 @@ class Client(ClientWithProject):
         retry: retries.Retry = DEFAULT_RETRY,
         timeout: TimeoutType = DEFAULT_TIMEOUT,
         page_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        raw: bool = False,
     ) -> page_iterator.Iterator:
         """List datasets for the project associated with this client.
 
@@ -497,6 +544,14 @@ class Client(ClientWithProject):
                 before using ``retry``.
             page_size (Optional[int]):
                 Maximum number of datasets to return per page.
+            fields (Optional[Sequence[str]]):
+                Fields of each dataset resource to return, for example
+                ``["labels"]``, using the partial response syntax of the
+                API. ``datasetReference`` is always included. Defaults to all fields
+                returned by the list call.
+            raw (Optional[bool]):
+                If ``True``, yield the resource dictionaries returned by the
+                API instead of wrapping them in :class:`~google.cloud.bigquery.dataset.DatasetListItem` objects.
 
         Returns:
             google.api_core.page_iterator.Iterator:
@@ -512,6 +567,10 @@ class Client(ClientWithProject):
             # TODO: consider supporting a dict of label -> value for filter,
             # and converting it into a string here.
             extra_params["filter"] = filter
+        if fields is not None:
+            extra_params["fields"] = _list_fields_param(
+                "datasets", "datasetReference", fields
+            )
         path = "/projects/%s/datasets" % (project,)
 
         span_attributes = {"path": path}
@@ -530,7 +589,7 @@ class Client(ClientWithProject):
             client=self,
             api_request=api_request,
             path=path,
-            item_to_value=_item_to_dataset,
+            item_to_value=_item_to_resource if raw else _item_to_dataset,
             items_key="datasets",
             page_token=page_token,
             max_results=max_results,
@@ -584,9 +643,7 @@ class Client(ClientWithProject):
             "google.cloud.bigquery_storage.BigQueryReadClient"
         ] = None,
         client_options: Optional[google.api_core.client_options.ClientOptions] = None,
-        client_info: Optional[
-            "google.api_core.gapic_v1.client_info.ClientInfo"
-        ] = DEFAULT_BQSTORAGE_CLIENT_INFO,
+        client_info: Optional["google.api_core.gapic_v1.client_info.ClientInfo"] = None,
     ) -> Optional["google.cloud.bigquery_storage.BigQueryReadClient"]:
         """Create a BigQuery Storage API client using this client's credentials.
 
@@ -599,7 +656,8 @@ class Client(ClientWithProject):
                 if one is created.
             client_info:
                 The client info used with a new BigQuery Storage client
-                instance if one is created.
+                instance if one is created. Defaults to the BigQuery Storage
+                library's own client info.
 
         Returns:
             A BigQuery Storage API client.
@@ -621,6 +679,11 @@ class Client(ClientWithProject):
             )
             return None
 
+        if client_info is None:
+            from google.cloud.bigquery_storage_v1.services.big_query_read.client import (
+                DEFAULT_CLIENT_INFO as client_info,
+            )
+
         if bqstorage_client is None:  # pragma: NO COVER
             bqstorage_client = bigquery_storage.BigQueryReadClient(
                 credentials=self._credentials,
@@ -851,6 +914,15 @@ class Client(ClientWithProject):
         kwargs = _add_server_timeout_header(headers, kwargs)
         call = functools.partial(self._connection.api_request, **kwargs)
 
+        if self._metrics_hook is not None:
+            call = metrics.instrument_call(
+                call,
+                self._metrics_hook,
+                method=kwargs.get("method"),
+                path=kwargs.get("path"),
+                operation=span_name,
+            )
+
         if retry:
             call = retry(call)
 
@@ -927,6 +999,56 @@ class Client(ClientWithProject):
         )
         return Dataset.from_api_repr(api_response)
 
+    def get_datasets(
+        self,
+        dataset_refs: Iterable[Union[DatasetReference, str]],
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+        dataset_view: Optional[DatasetView] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Union[Dataset, core_exceptions.GoogleAPICallError]]:
+        """Fetch several datasets, with concurrent get calls.
+
+        See :meth:`get_dataset`, which is called for each dataset.
+
+        Args:
+            dataset_refs (Iterable[Union[ \
+                google.cloud.bigquery.dataset.DatasetReference, \
+                str, \
+            ]]):
+                References to the datasets to fetch from the BigQuery API.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry each RPC.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+            dataset_view (Optional[google.cloud.bigquery.enums.DatasetView]):
+                Specifies the view that determines which dataset information is
+                returned. See :meth:`get_dataset`.
+            max_workers (Optional[int]):
+                Maximum number of get calls in flight. Defaults to one per
+                dataset, up to 10.
+
+        Returns:
+            List[Union[ \
+                google.cloud.bigquery.dataset.Dataset, \
+                google.api_core.exceptions.GoogleAPICallError, \
+            ]]:
+                The datasets, in the order of ``dataset_refs``. The error of
+                each dataset which could not be fetched, such as
+                :class:`~google.api_core.exceptions.NotFound`, takes its place.
+        """
+        dataset_refs = [
+            DatasetReference.from_string(ref, default_project=self.project)
+            if isinstance(ref, str)
+            else ref
+            for ref in dataset_refs
+        ]
+        get_dataset = functools.partial(
+            self.get_dataset, retry=retry, timeout=timeout, dataset_view=dataset_view
+        )
+        return _get_each(get_dataset, dataset_refs, max_workers)
+
     def get_iam_policy(
         self,
         table: Union[Table, TableReference, TableListItem, str],
@@ -1217,6 +1339,52 @@ class Client(ClientWithProject):
         )
         return Table.from_api_repr(api_response)
 
+    def get_tables(
+        self,
+        tables: Iterable[Union[Table, TableReference, TableListItem, str]],
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+        max_workers: Optional[int] = None,
+    ) -> List[Union[Table, core_exceptions.GoogleAPICallError]]:
+        """Fetch several tables, with concurrent get calls.
+
+        See :meth:`get_table`, which is called for each table. Use it to look
+        up the schemas of many tables, for example before loading data into
+        them, in about the time of one request.
+
+        Args:
+            tables (Iterable[Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.table.TableReference, \
+                google.cloud.bigquery.table.TableListItem, \
+                str, \
+            ]]):
+                References to the tables to fetch from the BigQuery API.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry each RPC.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+            max_workers (Optional[int]):
+                Maximum number of get calls in flight. Defaults to one per
+                table, up to 10.
+
+        Returns:
+            List[Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.api_core.exceptions.GoogleAPICallError, \
+            ]]:
+                The tables, in the order of ``tables``. The error of each
+                table which could not be fetched, such as
+                :class:`~google.api_core.exceptions.NotFound`, takes its place.
+        """
+        table_refs = [
+            _table_arg_to_table_ref(table, default_project=self.project)
+            for table in tables
+        ]
+        get_table = functools.partial(self.get_table, retry=retry, timeout=timeout)
+        return _get_each(get_table, table_refs, max_workers)
+
     def update_dataset(
         self,
         dataset: Dataset,
@@ -1522,6 +1690,105 @@ class Client(ClientWithProject):
         )
         return Table.from_api_repr(api_response)
 
+    def evolve_table_schema(
+        self,
+        table: Union[Table, TableReference, TableListItem, str],
+        new_fields: Sequence[Union[SchemaField, Mapping[str, Any]]],
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+    ) -> Table:
+        """Apply the additive changes of ``new_fields`` to a table's schema.
+
+        Adds the fields and ``RECORD`` subfields of ``new_fields`` missing
+        from the table schema, and relaxes ``REQUIRED`` fields which are
+        ``NULLABLE`` in ``new_fields``, see
+        :func:`google.cloud.bigquery.schema.diff`. The table is only updated
+        if its schema lacks any of these changes, so loaders can call this
+        before every load without writing the table metadata each time.
+
+        The update is guarded by the table's ETag. If another writer changed
+        the table in the meantime, the table is read again and the changes
+        still missing are applied to the new schema.
+
+        .. code-block:: python
+
+            table = client.evolve_table_schema(
+                "my_dataset.my_table",
+                [
+                    bigquery.SchemaField("id", "INT64"),
+                    bigquery.SchemaField("comment", "STRING"),
+                ],
+            )
+
+        Args:
+            table (Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.table.TableReference, \
+                google.cloud.bigquery.table.TableListItem, \
+                str, \
+            ]):
+                The table to change. A
+                :class:`~google.cloud.bigquery.table.Table` fetched with
+                :meth:`get_table` is used as is, other references are fetched
+                first.
+            new_fields (Sequence[Union[ \
+                google.cloud.bigquery.schema.SchemaField, \
+                Mapping[str, Any] \
+            ]]):
+                The schema of the data to write to the table.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPCs.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+
+        Returns:
+            google.cloud.bigquery.table.Table:
+                The table with the evolved schema, ``table`` itself if no
+                change was needed.
+
+        Raises:
+            ValueError:
+                If ``new_fields`` changes a field in a way that cannot be
+                applied to an existing table, such as changing its type.
+            google.api_core.exceptions.PreconditionFailed:
+                If the table kept changing while its schema was updated.
+        """
+        if isinstance(table, Table) and table.etag is not None:
+            current = table
+        else:
+            current = self.get_table(table, retry=retry, timeout=timeout)
+
+        attempts = 1
+        while True:
+            changes = _diff_schema(current.schema, new_fields)
+            if not changes.is_additive:
+                reasons = ", ".join(
+                    f"{path}: {reason}" for path, reason in changes.incompatible.items()
+                )
+                raise ValueError(
+                    f"Cannot evolve the schema of table {current.reference}, "
+                    f"incompatible changes: {reasons}"
+                )
+            if not changes.has_changes:
+                return current
+
+            updated = Table(
+                current.reference, schema=_evolve_schema(current.schema, new_fields)
+            )
+            updated._properties["etag"] = current.etag
+            try:
+                return self.update_table(
+                    updated, ["schema"], retry=retry, timeout=timeout
+                )
+            except core_exceptions.PreconditionFailed:
+                if attempts >= _MAX_SCHEMA_EVOLUTION_ATTEMPTS:
+                    raise
+                attempts += 1
+                current = self.get_table(
+                    current.reference, retry=retry, timeout=timeout
+                )
+
     def list_models(
         self,
         dataset: Union[Dataset, DatasetReference, DatasetListItem, str],
@@ -1684,6 +1951,8 @@ class Client(ClientWithProject):
         retry: retries.Retry = DEFAULT_RETRY,
         timeout: TimeoutType = DEFAULT_TIMEOUT,
         page_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        raw: bool = False,
     ) -> page_iterator.Iterator:
         """List tables in the dataset.
 
@@ -1718,6 +1987,14 @@ class Client(ClientWithProject):
             page_size (Optional[int]):
                 Maximum number of tables to return per page.
                 Defaults to a value set by the API.
+            fields (Optional[Sequence[str]]):
+                Fields of each table resource to return, for example
+                ``["type"]``, using the partial response syntax of the
+                API. ``tableReference`` is always included. Defaults to all fields
+                returned by the list call.
+            raw (Optional[bool]):
+                If ``True``, yield the resource dictionaries returned by the
+                API instead of wrapping them in :class:`~google.cloud.bigquery.table.TableListItem` objects.
 
         Returns:
             google.api_core.page_iterator.Iterator:
@@ -1726,6 +2003,11 @@ class Client(ClientWithProject):
                 within the requested dataset.
         """
         dataset = self._dataset_from_arg(dataset)
+        extra_params: Dict[str, Any] = {}
+        if fields is not None:
+            extra_params["fields"] = _list_fields_param(
+                "tables", "tableReference", fields
+            )
         path = "%s/tables" % dataset.path
         span_attributes = {"path": path}
 
@@ -1743,15 +2025,375 @@ class Client(ClientWithProject):
             client=self,
             api_request=api_request,
             path=path,
-            item_to_value=_item_to_table,
+            item_to_value=_item_to_resource if raw else _item_to_table,
             items_key="tables",
             page_token=page_token,
             max_results=max_results,
+            extra_params=extra_params,
             page_size=page_size,
         )
         result.dataset = dataset  # type: ignore
         return result
 
+    def list_tables_in_datasets(
+        self,
+        datasets: Iterable[Union[Dataset, DatasetReference, DatasetListItem, str]],
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+        page_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        raw: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Iterable[Union[TableListItem, Dict[str, Any]]]:
+        """List the tables of several datasets, with concurrent list calls.
+
+        See :meth:`list_tables`, which is called for each dataset. The tables
+        of each dataset are listed in a worker thread, and yielded dataset by
+        dataset, in the order of ``datasets``.
+
+        Args:
+            datasets (Iterable[Union[ \
+                google.cloud.bigquery.dataset.Dataset, \
+                google.cloud.bigquery.dataset.DatasetReference, \
+                google.cloud.bigquery.dataset.DatasetListItem, \
+                str, \
+            ]]):
+                References to the datasets whose tables to list.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPCs.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+            page_size (Optional[int]):
+                Maximum number of tables to return per page.
+            fields (Optional[Sequence[str]]):
+                Fields of each table resource to return. See
+                :meth:`list_tables`.
+            raw (Optional[bool]):
+                If ``True``, yield the table resource dictionaries instead of
+                :class:`~google.cloud.bigquery.table.TableListItem` objects.
+            max_workers (Optional[int]):
+                Maximum number of datasets listed at a time. Defaults to one
+                per dataset, up to 8.
+
+        Returns:
+            Iterable[Union[google.cloud.bigquery.table.TableListItem, Dict]]:
+                The tables of all datasets.
+        """
+        datasets = [self._dataset_from_arg(dataset) for dataset in datasets]
+        if max_workers is None:
+            max_workers = max(1, min(len(datasets), _MAX_LIST_TABLES_WORKERS))
+
+        def list_dataset_tables(dataset):
+            return list(
+                self.list_tables(
+                    dataset,
+                    retry=retry,
+                    timeout=timeout,
+                    page_size=page_size,
+                    fields=fields,
+                    raw=raw,
+                )
+            )
+
+        return itertools.chain.from_iterable(
+            _map_in_order(list_dataset_tables, datasets, max_workers)
+        )
+
+    def crawl_metadata(
+        self,
+        project: Optional[str] = None,
+        datasets: Optional[
+            Iterable[Union[Dataset, DatasetReference, DatasetListItem, str]]
+        ] = None,
+        max_workers: Optional[int] = None,
+        max_requests_per_second: Optional[float] = None,
+        modified_since: Optional[datetime.datetime] = None,
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+    ) -> Iterator[Table]:
+        """Fetch the metadata of all tables of several datasets concurrently.
+
+        The tables of each dataset are listed, and each table is fetched
+        with :meth:`get_table`, on a thread pool. Tables are yielded as soon
+        as they are fetched, so not in any particular order. Datasets and
+        tables which are deleted during the crawl are skipped.
+
+        Args:
+            project (Optional[str]):
+                Project whose datasets to crawl, if ``datasets`` is not
+                passed, and default project of dataset IDs passed as strings.
+                Defaults to the client's project.
+            datasets (Optional[Iterable[Union[ \
+                google.cloud.bigquery.dataset.Dataset, \
+                google.cloud.bigquery.dataset.DatasetReference, \
+                google.cloud.bigquery.dataset.DatasetListItem, \
+                str, \
+            ]]]):
+                Datasets to crawl. Defaults to all datasets of ``project``.
+            max_workers (Optional[int]):
+                Maximum number of API requests in flight. Defaults to 16.
+            max_requests_per_second (Optional[float]):
+                If set, space the list and get requests of the crawl so that
+                no more than this many start each second.
+            modified_since (Optional[datetime.datetime]):
+                If set, only yield the tables whose
+                :attr:`~google.cloud.bigquery.table.Table.modified` time is
+                later, for incremental crawls. If the datetime has no time
+                zone assumes UTC time. The list API does not return
+                modification times, so the other tables are still fetched.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry each RPC.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+
+        Returns:
+            Iterator[google.cloud.bigquery.table.Table]:
+                The crawled tables.
+        """
+        if project is None:
+            project = self.project
+        if datasets is None:
+            datasets = self.list_datasets(project, retry=retry, timeout=timeout)
+        dataset_refs = []
+        for dataset in datasets:
+            if isinstance(dataset, str):
+                dataset = DatasetReference.from_string(dataset, default_project=project)
+            dataset_refs.append(self._dataset_from_arg(dataset))
+        if max_workers is None:
+            max_workers = _MAX_CRAWL_WORKERS
+        if modified_since is not None and modified_since.tzinfo is None:
+            modified_since = modified_since.replace(tzinfo=datetime.timezone.utc)
+        throttle = (
+            _RequestThrottle(max_requests_per_second)
+            if max_requests_per_second
+            else None
+        )
+
+        def list_dataset_tables(dataset):
+            iterator = self.list_tables(dataset, retry=retry, timeout=timeout)
+            references = []
+            if throttle is not None:
+                throttle.wait()
+            try:
+                for page in iterator.pages:
+                    references.extend(table.reference for table in page)
+                    if iterator.next_page_token is None:
+                        break
+                    if throttle is not None:
+                        throttle.wait()
+            except core_exceptions.NotFound:
+                # The dataset was deleted since it was listed.
+                return []
+            return references
+
+        def get_table(table_ref):
+            if throttle is not None:
+                throttle.wait()
+            try:
+                return self.get_table(table_ref, retry=retry, timeout=timeout)
+            except core_exceptions.NotFound:
+                return None
+
+        return _crawl_tables(
+            list_dataset_tables, get_table, dataset_refs, max_workers, modified_since
+        )
+
+    def apply_metadata(
+        self,
+        definitions: Iterable[Union[Table, Routine]],
+        deletes: Iterable[
+            Union[Table, TableReference, TableListItem, Routine, RoutineReference, str]
+        ] = (),
+        dry_run: bool = False,
+        max_workers: Optional[int] = None,
+        max_requests_per_second: Optional[float] = None,
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+    ) -> bulk.BulkReport:
+        """Create, update and delete many tables, views and routines.
+
+        Each definition is compared with the existing resource: missing
+        resources are created, and resources which differ from their
+        definition are updated, with only the changed properties. Properties
+        which a definition does not set are left as they are, and so are the
+        labels of table definitions without labels. Updates are conditional
+        on the ETag of the resource which was compared.
+
+        Definitions are applied concurrently. A view can depend on another
+        table or view of the same call, so creations and updates which fail
+        with :class:`~google.api_core.exceptions.NotFound` are retried after
+        the others, for as long as the previous round created or updated some
+        resources.
+
+        Args:
+            definitions (Iterable[Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.routine.Routine, \
+            ]]):
+                The tables, views and routines as they should be.
+            deletes (Iterable[Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.table.TableReference, \
+                google.cloud.bigquery.table.TableListItem, \
+                google.cloud.bigquery.routine.Routine, \
+                google.cloud.bigquery.routine.RoutineReference, \
+                str, \
+            ]]):
+                Tables, views and routines to delete, if they exist. Strings
+                are table IDs.
+            dry_run (Optional[bool]):
+                If ``True``, only compare the definitions with the existing
+                resources, and report the actions without applying them.
+            max_workers (Optional[int]):
+                Maximum number of definitions and deletions applied at a
+                time. Defaults to 8.
+            max_requests_per_second (Optional[float]):
+                If set, space the API requests so that no more than this many
+                start each second.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry each RPC. The default retries rate limit errors.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+
+        Returns:
+            google.cloud.bigquery.bulk.BulkReport:
+                The result of each definition and deletion. Errors are
+                reported per resource instead of being raised.
+
+        Raises:
+            TypeError:
+                If a definition is not a ``Table`` or a ``Routine``.
+        """
+        tasks = []
+        for definition in definitions:
+            if not isinstance(definition, (Table, Routine)):
+                raise TypeError(
+                    "definitions must be Table or Routine objects, got {!r}".format(
+                        definition
+                    )
+                )
+            tasks.append(definition)
+        for resource in deletes:
+            if isinstance(resource, Routine):
+                resource = resource.reference
+            elif not isinstance(resource, RoutineReference):
+                resource = _table_arg_to_table_ref(
+                    resource, default_project=self.project
+                )
+            tasks.append(resource)
+        if not tasks:
+            return bulk.BulkReport([], dry_run=dry_run)
+        if max_workers is None:
+            max_workers = min(len(tasks), _MAX_APPLY_METADATA_WORKERS)
+        throttle = (
+            _RequestThrottle(max_requests_per_second)
+            if max_requests_per_second
+            else None
+        )
+
+        def call(method, *args, **kwargs):
+            if throttle is not None:
+                throttle.wait()
+            return method(*args, retry=retry, timeout=timeout, **kwargs)
+
+        def apply_definition(definition):
+            is_table = isinstance(definition, Table)
+            action = None
+            fields: Sequence[str] = ()
+            try:
+                try:
+                    existing = call(
+                        self.get_table if is_table else self.get_routine,
+                        definition.reference,
+                    )
+                except core_exceptions.NotFound:
+                    action = bulk.BulkAction.CREATE
+                    resource = None
+                    if not dry_run:
+                        resource = call(
+                            self.create_table if is_table else self.create_routine,
+                            definition,
+                        )
+                    return bulk.BulkResult(definition.reference, action, (), resource)
+
+                if is_table:
+                    fields, patch = bulk._table_changes(definition, existing)
+                    update_fields = fields
+                else:
+                    fields, update_fields, patch = bulk._routine_changes(
+                        definition, existing
+                    )
+                if not fields:
+                    action = bulk.BulkAction.UNCHANGED
+                    resource = existing
+                else:
+                    action = bulk.BulkAction.UPDATE
+                    resource = None
+                    if not dry_run:
+                        resource = call(
+                            self.update_table if is_table else self.update_routine,
+                            patch,
+                            update_fields,
+                        )
+                return bulk.BulkResult(
+                    definition.reference, action, tuple(fields), resource
+                )
+            except (core_exceptions.GoogleAPICallError, ValueError) as exc:
+                return bulk.BulkResult(
+                    definition.reference, action, tuple(fields), error=exc
+                )
+
+        def apply_delete(reference):
+            try:
+                if not dry_run:
+                    call(
+                        self.delete_routine
+                        if isinstance(reference, RoutineReference)
+                        else self.delete_table,
+                        reference,
+                        not_found_ok=True,
+                    )
+            except core_exceptions.GoogleAPICallError as exc:
+                return bulk.BulkResult(reference, bulk.BulkAction.DELETE, error=exc)
+            return bulk.BulkResult(reference, bulk.BulkAction.DELETE)
+
+        def apply(task):
+            if isinstance(task, (Table, Routine)):
+                return apply_definition(task)
+            return apply_delete(task)
+
+        writes = (bulk.BulkAction.CREATE, bulk.BulkAction.UPDATE)
+
+        def needs_retry(result):
+            return result.action in writes and isinstance(
+                result.error, core_exceptions.NotFound
+            )
+
+        def applied_any(round_results):
+            return any(
+                result.action in writes and result.error is None
+                for result in round_results
+            )
+
+        results = list(_map_in_order(apply, tasks, max_workers))
+
+        # Retry what may depend on resources created or updated by the
+        # previous round, until a round applies none.
+        round_results = results
+        pending = [index for index, result in enumerate(results) if needs_retry(result)]
+        while pending and applied_any(round_results):
+            round_results = list(
+                _map_in_order(apply, [tasks[index] for index in pending], max_workers)
+            )
+            for index, result in zip(pending, round_results):
+                results[index] = result
+            pending = [index for index in pending if needs_retry(results[index])]
+
+        return bulk.BulkReport(results, dry_run=dry_run)
+
     def delete_dataset(
         self,
         dataset: Union[Dataset, DatasetReference, DatasetListItem, str],
@@ -1900,7 +2542,7 @@ class Client(ClientWithProject):
                 Defaults to ``False``. If ``True``, ignore "not found" errors
                 when deleting the job.
         """
-        extra_params = {}
+        extra_params: Dict[str, Any] = {}
 
         project, location, job_id = _extract_job_reference(
             job_id, project=project, location=location
@@ -2389,6 +3031,9 @@ class Client(ClientWithProject):
         min_creation_time: Optional[datetime.datetime] = None,
         max_creation_time: Optional[datetime.datetime] = None,
         page_size: Optional[int] = None,
+        projection: str = "full",
+        fields: Optional[Sequence[str]] = None,
+        raw: bool = False,
     ) -> page_iterator.Iterator:
         """List jobs for the project associated with this client.
 
@@ -2436,6 +3081,19 @@ class Client(ClientWithProject):
                 no time zone assumes UTC time.
             page_size (Optional[int]):
                 Maximum number of jobs to return per page.
+            projection (Optional[str]):
+                How much of each job to return, ``"full"`` (the default) or
+                ``"minimal"``, which omits the job configuration. Jobs listed
+                without their configuration are returned as
+                :class:`~google.cloud.bigquery.job.UnknownJob`.
+            fields (Optional[Sequence[str]]):
+                Fields of each job resource to return, for example
+                ``["status"]``, using the partial response syntax of the
+                API. ``jobReference`` is always included. Defaults to all fields
+                returned by the list call.
+            raw (Optional[bool]):
+                If ``True``, yield the resource dictionaries returned by the
+                API instead of wrapping them in job objects.
 
         Returns:
             google.api_core.page_iterator.Iterator:
@@ -2453,13 +3111,15 @@ class Client(ClientWithProject):
             "maxCreationTime": _str_or_none(
                 google.cloud._helpers._millis_from_datetime(max_creation_time)
             ),
-            "projection": "full",
+            "projection": projection,
             "parentJobId": parent_job,
         }
 
         extra_params = {
             param: value for param, value in extra_params.items() if value is not None
         }
+        if fields is not None:
+            extra_params["fields"] = _list_fields_param("jobs", "jobReference", fields)
 
         if project is None:
             project = self.project
@@ -2482,7 +3142,7 @@ class Client(ClientWithProject):
             client=self,
             api_request=api_request,
             path=path,
-            item_to_value=_item_to_job,
+            item_to_value=_item_to_resource if raw else _item_to_job,
             items_key="jobs",
             page_token=page_token,
             max_results=max_results,
@@ -2699,6 +3359,8 @@ class Client(ClientWithProject):
         job_config: Optional[LoadJobConfig] = None,
         parquet_compression: str = "snappy",
         timeout: ResumableTimeoutType = DEFAULT_TIMEOUT,
+        schema_sample_size: Optional[int] = None,
+        cache_schema: bool = False,
     ) -> job.LoadJob:
         """Upload the contents of a table from a pandas DataFrame.
 
@@ -2784,6 +3446,18 @@ class Client(ClientWithProject):
 
                 Can also be passed as a tuple (connect_timeout, read_timeout).
                 See :meth:`requests.Session.request` documentation for details.
+            schema_sample_size (Optional[int]):
+                If set, detect the type of ``object`` dtype columns missing
+                from the schema from their first ``schema_sample_size``
+                values only, instead of converting the whole column. All
+                values of such a column must have the same type. Defaults to
+                ``None``, converting whole columns.
+            cache_schema (Optional[bool]):
+                If ``True``, reuse the schema detected for earlier DataFrames
+                of the same shape, i.e. with the same columns, dtypes and
+                structure of the first 100 non-null values of ``object``
+                columns. Later values of ``object`` columns must have the
+                same structure. Defaults to ``False``.
 
         Returns:
             google.cloud.bigquery.job.LoadJob: A new load job.
@@ -2826,7 +3500,7 @@ class Client(ClientWithProject):
                 )
             )
 
-        if pyarrow is None and new_job_config.source_format == job.SourceFormat.PARQUET:
+        if new_job_config.source_format == job.SourceFormat.PARQUET and not pyarrow:
             # pyarrow is now the only supported parquet engine.
             raise ValueError("This method requires pyarrow to be installed")
 
@@ -2864,7 +3538,10 @@ class Client(ClientWithProject):
                 ]
 
         new_job_config.schema = _pandas_helpers.dataframe_to_bq_schema(
-            dataframe, new_job_config.schema
+            dataframe,
+            new_job_config.schema,
+            sample_size=schema_sample_size,
+            use_cache=cache_schema,
         )
 
         if not new_job_config.schema:
@@ -3099,8 +3776,18 @@ class Client(ClientWithProject):
             stream, metadata, num_retries, timeout, project=project
         )
 
+        if self._metrics_hook is None:
+            while not upload.finished:
+                response = upload.transmit_next_chunk(transport, timeout=timeout)
+            return response
+
+        chunk_index = 0
         while not upload.finished:
-            response = upload.transmit_next_chunk(transport, timeout=timeout)
+            bytes_before = upload.bytes_uploaded
+            with metrics.UploadChunkTimer(self._metrics_hook, chunk_index) as timer:
+                response = upload.transmit_next_chunk(transport, timeout=timeout)
+                timer.finish(response, upload.bytes_uploaded - bytes_before)
+            chunk_index += 1
 
         return response
 
@@ -3164,14 +3851,26 @@ class Client(ClientWithProject):
                 max_retries=num_retries
             )
 
-        upload.initiate(
-            transport,
-            stream,
-            metadata,
-            _GENERIC_CONTENT_TYPE,
-            stream_final=False,
-            timeout=timeout,
-        )
+        if self._metrics_hook is None:
+            upload.initiate(
+                transport,
+                stream,
+                metadata,
+                _GENERIC_CONTENT_TYPE,
+                stream_final=False,
+                timeout=timeout,
+            )
+        else:
+            with metrics.UploadChunkTimer(self._metrics_hook, -1) as timer:
+                response = upload.initiate(
+                    transport,
+                    stream,
+                    metadata,
+                    _GENERIC_CONTENT_TYPE,
+                    stream_final=False,
+                    timeout=timeout,
+                )
+                timer.finish(response, 0)
 
         return upload, transport
 
@@ -3602,6 +4301,193 @@ class Client(ClientWithProject):
         else:
             raise ValueError(f"Got unexpected value for api_method: {repr(api_method)}")
 
+    def estimate_query(
+        self,
+        query: str,
+        job_config: Optional[QueryJobConfig] = None,
+        location: Optional[str] = None,
+        project: Optional[str] = None,
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+        use_cache: bool = True,
+        cache: Optional[_job_helpers.QueryEstimateCache] = None,
+    ) -> job.QueryJob:
+        """Estimate the cost of a query with a dry run, reusing earlier dry
+        runs of the same query.
+
+        An earlier dry run is reused if it had the same SQL, project,
+        location and job configuration, including the query parameters, and
+        none of the tables it references was modified since. Checking that
+        costs one ``tables.get`` request per referenced table, made
+        concurrently, instead of a new dry-run job.
+
+        Args:
+            query (str):
+                SQL query to estimate.
+            job_config (Optional[google.cloud.bigquery.job.QueryJobConfig]):
+                Extra configuration options for the dry run, merged with the
+                client's ``default_query_job_config``. ``dry_run`` is always
+                set.
+            location (Optional[str]):
+                Location where to run the dry run. Defaults to the client's
+                location.
+            project (Optional[str]):
+                Project ID of the project of where to run the dry run.
+                Defaults to the client's project.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPCs.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+            use_cache (Optional[bool]):
+                If ``False``, always make a new dry run. Its result is still
+                cached. Defaults to ``True``.
+            cache (Optional[google.cloud.bigquery._job_helpers.QueryEstimateCache]):
+                The cache of dry runs, for example to share it between
+                clients. Defaults to a cache owned by this client.
+
+        Returns:
+            google.cloud.bigquery.job.QueryJob:
+                The dry-run job, for example with
+                :attr:`~google.cloud.bigquery.job.QueryJob.total_bytes_processed`
+                set. The job may be shared with other callers, do not modify
+                it.
+
+        Raises:
+            TypeError:
+                If ``job_config`` is not an instance of
+                :class:`~google.cloud.bigquery.job.QueryJobConfig`
+                class.
+        """
+        if project is None:
+            project = self.project
+
+        if location is None:
+            location = self.location
+
+        if job_config is not None:
+            _verify_job_config_type(job_config, QueryJobConfig)
+
+        job_config = _job_helpers.job_config_with_defaults(
+            job_config, self._default_query_job_config
+        )
+        job_config = copy.deepcopy(job_config) if job_config else QueryJobConfig()
+        job_config.dry_run = True
+
+        if cache is None:
+            cache = self._query_estimate_cache
+        key = _job_helpers.query_estimate_cache_key(
+            query, job_config, project, location
+        )
+        if use_cache:
+            entry = cache.get(key)
+            if entry is not None:
+                query_job, as_of = entry
+                if self._referenced_tables_unchanged(query_job, as_of, retry, timeout):
+                    return query_job
+                cache.discard(key)
+
+        as_of = datetime.datetime.now(datetime.timezone.utc)
+        query_job = self.query(
+            query,
+            job_config=job_config,
+            location=location,
+            project=project,
+            retry=retry,
+            timeout=timeout,
+        )
+        # Prefer the server's clock, which also sets the tables' modified time.
+        if query_job.created is not None:
+            as_of = min(as_of, query_job.created)
+        cache.put(key, query_job, as_of)
+        return query_job
+
+    def _referenced_tables_unchanged(self, query_job, as_of, retry, timeout) -> bool:
+        """Whether no table referenced by the dry run ``query_job`` was
+        modified after ``as_of``.
+
+        Tables which cannot be fetched, for example because they were
+        deleted, count as modified. The tables are fetched concurrently.
+        """
+        table_refs = query_job.referenced_tables
+        if not table_refs:
+            return True
+
+        def unchanged(table_ref):
+            try:
+                table = self.get_table(table_ref, retry=retry, timeout=timeout)
+            except core_exceptions.GoogleAPICallError:
+                return False
+            return table.modified is not None and table.modified <= as_of
+
+        if len(table_refs) == 1:
+            return unchanged(table_refs[0])
+        max_workers = min(len(table_refs), _MAX_ESTIMATE_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return all(pool.map(unchanged, table_refs))
+
+    def estimate_queries(
+        self,
+        queries: Sequence[str],
+        job_config: Optional[QueryJobConfig] = None,
+        location: Optional[str] = None,
+        project: Optional[str] = None,
+        retry: retries.Retry = DEFAULT_RETRY,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+        use_cache: bool = True,
+        cache: Optional[_job_helpers.QueryEstimateCache] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[job.QueryJob]:
+        """Estimate the costs of several queries, with concurrent dry runs.
+
+        See :meth:`estimate_query`, which is called for each query.
+
+        Args:
+            queries (Sequence[str]):
+                SQL queries to estimate.
+            job_config (Optional[google.cloud.bigquery.job.QueryJobConfig]):
+                Extra configuration options for the dry runs.
+            location (Optional[str]):
+                Location where to run the dry runs.
+            project (Optional[str]):
+                Project ID of the project of where to run the dry runs.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPCs.
+            timeout (Optional[float]):
+                The number of seconds to wait for the underlying HTTP transport
+                before using ``retry``.
+            use_cache (Optional[bool]):
+                If ``False``, always make new dry runs.
+            cache (Optional[google.cloud.bigquery._job_helpers.QueryEstimateCache]):
+                The cache of dry runs. Defaults to a cache owned by this
+                client.
+            max_workers (Optional[int]):
+                Maximum number of dry runs in flight. Defaults to one per
+                query, up to 8.
+
+        Returns:
+            List[google.cloud.bigquery.job.QueryJob]:
+                The dry-run jobs, in the order of ``queries``.
+        """
+        queries = list(queries)
+        if not queries:
+            return []
+        if max_workers is None:
+            max_workers = min(len(queries), _MAX_ESTIMATE_WORKERS)
+
+        estimate = functools.partial(
+            self.estimate_query,
+            job_config=job_config,
+            location=location,
+            project=project,
+            retry=retry,
+            timeout=timeout,
+            use_cache=use_cache,
+            cache=cache,
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(estimate, queries))
+
     def query_and_wait(
         self,
         query,
@@ -4324,14 +5210,16 @@ class Client(ClientWithProject):
         )
         return row_iterator
 
-    def _schema_from_json_file_object(self, file_obj):
+    def _schema_from_json_file_object(self, file_obj, frozen=False):
         """Helper function for schema_from_json that takes a
         file object that describes a table schema.
 
         Returns:
-             List of schema field objects.
+             List of schema field objects, or a frozen schema.
         """
         json_data = json.load(file_obj)
+        if frozen:
+            return FrozenSchema._from_owned_api_repr(json_data)
         return [SchemaField.from_api_repr(field) for field in json_data]
 
     def _schema_to_json_file_object(self, schema_list, file_obj):
@@ -4340,19 +5228,32 @@ class Client(ClientWithProject):
         """
         json.dump(schema_list, file_obj, indent=2, sort_keys=True)
 
-    def schema_from_json(self, file_or_path: "PathType") -> List[SchemaField]:
+    def schema_from_json(
+        self, file_or_path: "PathType", frozen: bool = False
+    ) -> Union[List[SchemaField], FrozenSchema]:
         """Takes a file object or file path that contains json that describes
         a table schema.
 
+        Args:
+            file_or_path (Union[str, IO]):
+                The JSON file, or its path.
+            frozen (Optional[bool]):
+                If ``True``, return a
+                :class:`~google.cloud.bigquery.schema.FrozenSchema`, which
+                builds its fields lazily and is hashed once. Use it for very
+                wide schemas, or to key caches by schema. Defaults to
+                ``False``.
+
         Returns:
-            List[SchemaField]:
-                List of :class:`~google.cloud.bigquery.schema.SchemaField` objects.
+            Union[List[SchemaField], FrozenSchema]:
+                List of :class:`~google.cloud.bigquery.schema.SchemaField`
+                objects, or a frozen schema if ``frozen`` is ``True``.
         """
         if isinstance(file_or_path, io.IOBase):
-            return self._schema_from_json_file_object(file_or_path)
+            return self._schema_from_json_file_object(file_or_path, frozen)
 
         with open(file_or_path) as file_obj:
-            return self._schema_from_json_file_object(file_obj)
+            return self._schema_from_json_file_object(file_obj, frozen)
 
     def schema_to_json(
         self, schema_list: Sequence[SchemaField], destination: "PathType"
@@ -4363,7 +5264,11 @@ class Client(ClientWithProject):
 
         Destination is a file path or a file object.
         """
-        json_schema_list = [f.to_api_repr() for f in schema_list]
+        if isinstance(schema_list, FrozenSchema):
+            # Avoid building the fields of the frozen schema.
+            json_schema_list = schema_list.to_api_repr()
+        else:
+            json_schema_list = [f.to_api_repr() for f in schema_list]
 
         if isinstance(destination, io.IOBase):
             return self._schema_to_json_file_object(json_schema_list, destination)
@@ -4379,6 +5284,20 @@ class Client(ClientWithProject):
 
 
 # pylint: disable=unused-argument
+def _item_to_resource(iterator, resource):
+    """Return a JSON resource of a list call as-is.
+
+    Args:
+        iterator (google.api_core.page_iterator.Iterator): The iterator that is currently in use.
+
+        resource (Dict): An item of the page.
+
+    Returns:
+        Dict: The next resource in the page.
+    """
+    return resource
+
+
 def _item_to_project(iterator, resource):
     """Convert a JSON project to the native object.
 
@@ -4466,6 +5385,127 @@ def _item_to_table(iterator, resource):
     return TableListItem(resource)
 
 
+def _list_fields_param(items_key, reference_key, fields):
+    """Build the ``fields`` partial response parameter of a list call.
+
+    Args:
+        items_key (str): The key of the items in the list response.
+        reference_key (str): The key of the reference of each item.
+        fields (Sequence[str]): The fields of each item to return.
+
+    Returns:
+        str: The parameter, selecting the page token and the item fields.
+    """
+    item_fields = dict.fromkeys([reference_key, *fields])
+    return "nextPageToken,{}({})".format(items_key, ",".join(item_fields))
+
+
+def _map_in_order(function, items, max_workers):
+    """Call a function on items in a thread pool, yielding results in order.
+
+    At most ``max_workers`` calls are in flight, so that items are not all
+    submitted up front when the results are consumed slowly.
+    """
+    items = iter(items)
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending: collections.deque = collections.deque()
+    try:
+        for item in itertools.islice(items, max_workers):
+            pending.append(pool.submit(function, item))
+        while pending:
+            result = pending.popleft().result()
+            for item in itertools.islice(items, 1):
+                pending.append(pool.submit(function, item))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def _get_each(get, refs, max_workers):
+    """Call a get method for each reference, on a thread pool.
+
+    Returns:
+        List: The results in the order of ``refs``, with the API errors in
+        place of the resources which could not be fetched.
+    """
+    if not refs:
+        return []
+    if max_workers is None:
+        max_workers = min(len(refs), _MAX_GET_WORKERS)
+
+    def get_or_error(ref):
+        try:
+            return get(ref)
+        except core_exceptions.GoogleAPICallError as exc:
+            return exc
+
+    return list(_map_in_order(get_or_error, refs, max_workers))
+
+
+def _crawl_tables(list_tables, get_table, datasets, max_workers, modified_since):
+    """Run the list and get calls of a metadata crawl on a thread pool.
+
+    Table references waiting to be fetched are queued, so that at most
+    ``2 * max_workers`` get calls are submitted at a time.
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    list_futures = {pool.submit(list_tables, dataset) for dataset in datasets}
+    get_futures: set = set()
+    table_refs: collections.deque = collections.deque()
+    try:
+        while list_futures or get_futures or table_refs:
+            while table_refs and len(get_futures) < 2 * max_workers:
+                get_futures.add(pool.submit(get_table, table_refs.popleft()))
+            done, _ = concurrent.futures.wait(
+                list_futures | get_futures,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                if future in list_futures:
+                    list_futures.remove(future)
+                    table_refs.extend(future.result())
+                    continue
+                get_futures.remove(future)
+                table = future.result()
+                if table is None:
+                    continue
+                if (
+                    modified_since is not None
+                    and table.modified is not None
+                    and table.modified <= modified_since
+                ):
+                    continue
+                yield table
+    finally:
+        for future in list_futures | get_futures:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+class _RequestThrottle(object):
+    """Space out requests made from several threads to a maximum rate.
+
+    Args:
+        requests_per_second (float): Maximum rate of requests.
+    """
+
+    def __init__(self, requests_per_second):
+        self._interval = 1.0 / requests_per_second
+        self._lock = threading.Lock()
+        self._next_time = time.monotonic()
+
+    def wait(self):
+        """Block until the next request may start."""
+        with self._lock:
+            now = time.monotonic()
+            start_time = max(now, self._next_time)
+            self._next_time = start_time + self._interval
+        if start_time > now:
+            time.sleep(start_time - now)
+
+
 def _extract_job_reference(job, project=None, location=None):
     """Extract fully-qualified job reference from a job-like object.
 
@@ -16,7 +16,6 @@
 
 from __future__ import absolute_import
 
-import copy
 import json
 
 import typing
@@ -556,7 +555,7 @@ class AccessEntry(object):
         Returns:
             Dict[str, object]: Access entry represented as an API resource
         """
-        resource = copy.deepcopy(self._properties)
+        resource = _helpers._copy_resource(self._properties)
         return resource
 
     @classmethod
@@ -1054,7 +1053,7 @@ class Dataset(object):
         project_id = resource["datasetReference"]["projectId"]
         dataset_id = resource["datasetReference"]["datasetId"]
         dataset = cls(DatasetReference(project_id, dataset_id))
-        dataset._properties = copy.deepcopy(resource)
+        dataset._properties = _helpers._copy_resource(resource)
         return dataset
 
     def to_api_repr(self) -> dict:
@@ -1063,7 +1062,7 @@ class Dataset(object):
         Returns:
             Dict[str, object]: The dataset represented as an API resource
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     def _build_resource(self, filter_fields):
         """Generate a resource for ``update``."""
@@ -408,6 +408,30 @@ def bigquery_scalar_type(value):
     Returns:
         Optional[str]: The BigQuery scalar type name.
     """
+    value_type = type(value)
+    try:
+        return _SCALAR_TYPES_BY_PYTHON_TYPE[value_type]
+    except KeyError:
+        pass
+
+    scalar_type = _infer_scalar_type(value)
+    if scalar_type not in _VALUE_DEPENDENT_SCALAR_TYPES:
+        _SCALAR_TYPES_BY_PYTHON_TYPE[value_type] = scalar_type
+    return scalar_type
+
+
+# Memoized results of _infer_scalar_type(), for Python types all of whose
+# values map to the same BigQuery type.
+_SCALAR_TYPES_BY_PYTHON_TYPE: typing.Dict[type, typing.Optional[str]] = {}
+
+# Types inferred from the value rather than just its Python type, for example
+# from the time zone of a datetime.
+_VALUE_DEPENDENT_SCALAR_TYPES = frozenset(
+    ("NUMERIC", "BIGNUMERIC", "DATETIME", "TIMESTAMP")
+)
+
+
+def _infer_scalar_type(value):
     if isinstance(value, bool):
         return "BOOL"
     elif isinstance(value, numbers.Integral):
@@ -461,25 +485,31 @@ def array_like(value):
     )
 
 
-def to_bq_table_rows(rows_iterable):
-    """Convert table rows to BigQuery table Row instances.
+def record_batches_to_bq_table_rows(record_batches):
+    """Convert Arrow record batches to BigQuery table Row instances.
+
+    Each record batch is converted a column at a time, which is much faster
+    than converting the values of every row one by one. All rows share a
+    single field-to-index mapping.
 
     Args:
-        rows_iterable (Iterable[Mapping]):
-            An iterable of row data items to convert to ``Row`` instances.
+        record_batches (Iterable[pyarrow.RecordBatch]):
+            Record batches, all with the same schema.
 
     Returns:
         Iterable[google.cloud.bigquery.table.Row]
     """
+    keys_to_index = None
 
-    def to_table_row(row):
-        # NOTE: We fetch ARROW values, thus we need to convert them to Python
-        # objects with as_py().
-        values = tuple(value.as_py() for value in row.values())
-        keys_to_index = {key: i for i, key in enumerate(row.keys())}
-        return table.Row(values, keys_to_index)
+    for record_batch in record_batches:
+        if keys_to_index is None:
+            keys_to_index = {
+                name: i for i, name in enumerate(record_batch.schema.names)
+            }
 
-    return (to_table_row(row_data) for row_data in rows_iterable)
+        columns = [column.to_pylist() for column in record_batch.columns]
+        for values in zip(*columns):
+            yield table.Row(values, keys_to_index)
 
 
 def raise_on_closed(
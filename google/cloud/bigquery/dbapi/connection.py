@@ -14,11 +14,15 @@
 
 """Connection for the Google BigQuery DB-API."""
 
+import threading
+import warnings
 import weakref
 
 from google.cloud import bigquery
 from google.cloud.bigquery.dbapi import cursor
+from google.cloud.bigquery.dbapi import exceptions
 from google.cloud.bigquery.dbapi import _helpers
+import google.cloud.exceptions  # type: ignore
 
 
 @_helpers.raise_on_closed("Operating on a closed connection.")
@@ -39,6 +43,25 @@ class Connection(object):
             Prefer the BigQuery Storage client over the REST client. If Storage
             client isn't available, fall back to the REST client. Defaults to
             ``True``.
+        max_stream_count (Optional[int]):
+            Maximum number of BigQuery Storage API read streams that cursors
+            read in parallel, in background threads. Defaults to ``1``, a
+            single stream read in the calling thread. If ``0``, the server
+            picks the number of streams. Results of queries with an
+            ``ORDER BY`` clause are always read from a single stream, to
+            preserve the order of the rows.
+        executemany_batch_size (Optional[int]):
+            Maximum number of parameter sets that
+            :meth:`~google.cloud.bigquery.dbapi.Cursor.executemany` combines
+            into a single multi-row ``INSERT ... VALUES`` job. Defaults to
+            ``None``, one job per parameter set. Other statements always run
+            one job per parameter set.
+        use_session (Optional[bool]):
+            Run all queries of the connection's cursors in one BigQuery
+            session, so that temporary tables, variables and other session
+            state are shared between statements. The session is created by
+            the first query and aborted by :meth:`close`. Defaults to
+            ``False``, each query runs on its own.
     """
 
     def __init__(
@@ -46,6 +69,9 @@ class Connection(object):
         client=None,
         bqstorage_client=None,
         prefer_bqstorage_client=True,
+        max_stream_count=1,
+        executemany_batch_size=None,
+        use_session=False,
     ):
         if client is None:
             client = bigquery.Client()
@@ -67,6 +93,11 @@ class Connection(object):
 
         self._client = client
         self._bqstorage_client = bqstorage_client
+        self._max_stream_count = max_stream_count
+        self._executemany_batch_size = executemany_batch_size
+        self._use_session = use_session
+        self._session_id = None
+        self._session_lock = threading.Lock()
 
         self._closed = False
         self._cursors_created = weakref.WeakSet()
@@ -78,6 +109,7 @@ class Connection(object):
         closed, only those created by the connection instance itself.
         """
         self._closed = True
+        self._abort_session()
 
         if self._owns_client:
             self._client.close()
@@ -90,6 +122,56 @@ class Connection(object):
             if not cursor_._closed:
                 cursor_.close()
 
+    def _get_session_id(self):
+        """Return the ID of the connection's BigQuery session, creating the
+        session on first use.
+
+        Returns:
+            Optional[str]:
+                The session ID, or ``None`` if the connection does not use a
+                session.
+
+        Raises:
+            google.cloud.bigquery.dbapi.DatabaseError:
+                If the session could not be created.
+        """
+        if not self._use_session:
+            return None
+
+        with self._session_lock:
+            if self._session_id is None:
+                job_config = bigquery.QueryJobConfig(create_session=True)
+                try:
+                    query_job = self._client.query("SELECT 1", job_config=job_config)
+                    query_job.result()
+                except google.cloud.exceptions.GoogleCloudError as exc:
+                    raise exceptions.DatabaseError(exc)
+                self._session_id = query_job.session_info.session_id
+        return self._session_id
+
+    def _abort_session(self):
+        """Abort the connection's BigQuery session, if one was created."""
+        with self._session_lock:
+            session_id, self._session_id = self._session_id, None
+        if session_id is None:
+            return
+
+        job_config = bigquery.QueryJobConfig(
+            connection_properties=[
+                bigquery.ConnectionProperty("session_id", session_id)
+            ]
+        )
+        try:
+            self._client.query_and_wait(
+                "CALL BQ.ABORT_SESSION()", job_config=job_config
+            )
+        except google.cloud.exceptions.GoogleCloudError as exc:
+            # The session expires on its own, there is no need to fail close().
+            warnings.warn(
+                f"Could not abort BigQuery session {session_id}: {exc}",
+                category=RuntimeWarning,
+            )
+
     def commit(self):
         """No-op, but for consistency raise an error if connection is closed."""
 
@@ -104,7 +186,14 @@ class Connection(object):
         return new_cursor
 
 
-def connect(client=None, bqstorage_client=None, prefer_bqstorage_client=True):
+def connect(
+    client=None,
+    bqstorage_client=None,
+    prefer_bqstorage_client=True,
+    max_stream_count=1,
+    executemany_batch_size=None,
+    use_session=False,
+):
     """Construct a DB-API connection to Google BigQuery.
 
     Args:
@@ -121,8 +210,34 @@ def connect(client=None, bqstorage_client=None, prefer_bqstorage_client=True):
             Prefer the BigQuery Storage client over the REST client. If Storage
             client isn't available, fall back to the REST client. Defaults to
             ``True``.
+        max_stream_count (Optional[int]):
+            Maximum number of BigQuery Storage API read streams that cursors
+            read in parallel, in background threads. Defaults to ``1``, a
+            single stream read in the calling thread. If ``0``, the server
+            picks the number of streams. Results of queries with an
+            ``ORDER BY`` clause are always read from a single stream, to
+            preserve the order of the rows.
+        executemany_batch_size (Optional[int]):
+            Maximum number of parameter sets that
+            :meth:`~google.cloud.bigquery.dbapi.Cursor.executemany` combines
+            into a single multi-row ``INSERT ... VALUES`` job. Defaults to
+            ``None``, one job per parameter set. Other statements always run
+            one job per parameter set.
+        use_session (Optional[bool]):
+            Run all queries of the connection's cursors in one BigQuery
+            session, so that temporary tables, variables and other session
+            state are shared between statements. The session is created by
+            the first query and aborted by :meth:`Connection.close`. Defaults to
+            ``False``, each query runs on its own.
 
     Returns:
         google.cloud.bigquery.dbapi.Connection: A new DB-API connection to BigQuery.
     """
-    return Connection(client, bqstorage_client, prefer_bqstorage_client)
+    return Connection(
+        client,
+        bqstorage_client,
+        prefer_bqstorage_client,
+        max_stream_count,
+        executemany_batch_size,
+        use_session,
+    )
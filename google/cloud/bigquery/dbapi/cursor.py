@@ -18,22 +18,42 @@ from __future__ import annotations
 
 import collections
 from collections import abc as collections_abc
+import copy
+import functools
+import importlib.util
 import re
+import time
+import types
 from typing import Optional
 
-try:
-    from google.cloud.bigquery_storage import ArrowSerializationOptions
-except ImportError:
-    _ARROW_COMPRESSION_SUPPORT = False
-else:
-    # Having BQ Storage available implies that pyarrow >=1.0.0 is available, too.
-    _ARROW_COMPRESSION_SUPPORT = True
-
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery import job
+from google.cloud.bigquery import metrics
 from google.cloud.bigquery.dbapi import _helpers
 from google.cloud.bigquery.dbapi import exceptions
+from google.cloud.bigquery.job.query import _contains_order_by
+from google.cloud.bigquery.query import ConnectionProperty
 import google.cloud.exceptions  # type: ignore
 
+# Having BQ Storage available implies that pyarrow >=1.0.0 is available, too.
+# The package is imported by _bqstorage_fetch, only when it is used.
+_ARROW_COMPRESSION_SUPPORT = (
+    importlib.util.find_spec("google.cloud.bigquery_storage") is not None
+)
+
+
+# Number of distinct operations whose parsed placeholders are cached.
+_PREPARED_OPERATION_CACHE_SIZE = 1024
+
+# BigQuery limit on the number of parameters of a single query, which bounds
+# the number of rows executemany() inserts per job.
+_MAX_QUERY_PARAMETERS = 10000
+
+# An INSERT statement up to the opening parenthesis of its last VALUES row.
+_INSERT_VALUES_RE = re.compile(
+    r"\s*INSERT\b.*\bVALUES\s*(?=\()", re.IGNORECASE | re.DOTALL
+)
+
 
 # Per PEP 249: A 7-item sequence containing information describing one result
 # column. The first two items (name and type_code) are mandatory, the other
@@ -74,8 +94,20 @@ class Cursor(object):
         # default to None, allowing the backend to automatically determine the
         # most appropriate size.
         self.arraysize = None
+        # Opt-in google.cloud.bigquery.metrics.DownloadProfile, which records
+        # a per-phase timing breakdown of fetching the results.
+        self.download_profile = None
+        # Maximum number of BigQuery Storage API streams read in parallel, see
+        # google.cloud.bigquery.dbapi.Connection.
+        self.max_stream_count = connection._max_stream_count
+        # Maximum number of parameter sets executemany() combines into one
+        # multi-row INSERT, see google.cloud.bigquery.dbapi.Connection.
+        self.executemany_batch_size = connection._executemany_batch_size
         self._query_data = None
         self._query_rows = None
+        self._pending_job = None
+        self._preserve_order = False
+        self._bqstorage_download = None
         self._closed = False
 
     @property
@@ -86,6 +118,9 @@ class Cursor(object):
         .. note::
             If the last ``execute*()`` call was ``executemany()``, this is the
             last job created by ``executemany()``."""
+        if self._pending_job is not None:
+            return self._pending_job
+
         rows = self._query_rows
 
         if rows is None:
@@ -103,8 +138,15 @@ class Cursor(object):
 
     def close(self):
         """Mark the cursor as closed, preventing its further use."""
+        self._stop_bqstorage_download()
         self._closed = True
 
+    def _stop_bqstorage_download(self):
+        """Stop the background threads reading the previous results, if any."""
+        download, self._bqstorage_download = self._bqstorage_download, None
+        if download is not None:
+            download.close()
+
     def _set_description(self, schema):
         """Set description from schema.
 
@@ -190,11 +232,93 @@ class Cursor(object):
             formatted_operation, parameters, job_id, job_config, parameter_types
         )
 
+    def execute_async(self, operation, parameters=None, job_id=None, job_config=None):
+        """Start executing a database operation, without waiting for it to
+        finish.
+
+        Use :meth:`poll` to check whether the operation has finished. The
+        ``fetch*()`` methods wait for it to finish, then stream the results
+        page by page, as they are read. ``description`` and ``rowcount`` are
+        set once the operation has finished and ``poll()`` returned ``True``
+        or a ``fetch*()`` method was called.
+
+        Submitting operations from several cursors runs them concurrently.
+
+        Args:
+            operation (str): A Google BigQuery query string.
+
+            parameters (Union[Mapping[str, Any], Sequence[Any]]):
+                (Optional) dictionary or sequence of parameter values.
+
+            job_id (str | None):
+                (Optional and discouraged) The job ID to use when creating
+                the query job.
+
+            job_config (google.cloud.bigquery.job.QueryJobConfig):
+                (Optional) Extra configuration options for the query job.
+        """
+        formatted_operation, parameter_types = _format_operation(operation, parameters)
+        self._execute(
+            formatted_operation,
+            parameters,
+            job_id,
+            job_config,
+            parameter_types,
+            wait=False,
+        )
+
+    def poll(self):
+        """Check whether the operation started by :meth:`execute_async` has
+        finished.
+
+        Returns:
+            bool:
+                ``True`` if the results of the last ``execute*()`` call can
+                be fetched without waiting for the query to finish.
+
+        Raises:
+            google.cloud.bigquery.dbapi.DatabaseError: if the query failed.
+        """
+        query_job = self._pending_job
+        if query_job is None:
+            return True
+
+        try:
+            done = query_job.done()
+        except google.cloud.exceptions.GoogleCloudError as exc:
+            self._pending_job = None
+            raise exceptions.DatabaseError(exc)
+
+        if done:
+            self._wait_for_pending_job()
+        return done
+
+    def _wait_for_pending_job(self):
+        """Wait for the query started by execute_async(), if any, to finish."""
+        query_job, self._pending_job = self._pending_job, None
+        if query_job is None:
+            return
+
+        try:
+            rows = query_job.result(page_size=self.arraysize)
+        except google.cloud.exceptions.GoogleCloudError as exc:
+            raise exceptions.DatabaseError(exc)
+
+        self._set_query_rows(rows, query_job.dry_run)
+
     def _execute(
-        self, formatted_operation, parameters, job_id, job_config, parameter_types
+        self,
+        formatted_operation,
+        parameters,
+        job_id,
+        job_config,
+        parameter_types,
+        wait=True,
     ):
+        self._stop_bqstorage_download()
         self._query_data = None
         self._query_results = None
+        self._pending_job = None
         client = self.connection._client
 
         # The DB-API uses the pyformat formatting, since the way BigQuery does
@@ -206,9 +330,24 @@ class Cursor(object):
         config = job_config or job.QueryJobConfig()
         config.query_parameters = query_parameters
 
-        # Start the query and wait for the query to finish.
+        session_id = self.connection._get_session_id()
+        if session_id is not None:
+            config = job_config = _attach_session(config, session_id)
+
+        self._preserve_order = bool(_contains_order_by(formatted_operation))
+
+        # Start the query and, unless called by execute_async(), wait for the
+        # query to finish.
         try:
-            if job_id is not None:
+            if not wait:
+                self._query_rows = None
+                self.description = None
+                self.rowcount = -1
+                self._pending_job = client.query(
+                    formatted_operation, job_config=config, job_id=job_id
+                )
+                return
+            elif job_id is not None:
                 rows = client.query(
                     formatted_operation,
                     job_config=job_config,
@@ -225,10 +364,15 @@ class Cursor(object):
         except google.cloud.exceptions.GoogleCloudError as exc:
             raise exceptions.DatabaseError(exc)
 
+        self._set_query_rows(rows, config.dry_run)
+
+    def _set_query_rows(self, rows, dry_run):
+        """Make ``rows`` the results of the last ``execute*()`` call."""
         self._query_rows = rows
+        rows.download_profile = self.download_profile
         self._set_description(rows.schema)
 
-        if config.dry_run:
+        if dry_run:
             self.rowcount = 0
         else:
             self._set_rowcount(rows)
@@ -236,6 +380,11 @@ class Cursor(object):
     def executemany(self, operation, seq_of_parameters):
         """Prepare and execute a database operation multiple times.
 
+        If ``executemany_batch_size`` is set and ``operation`` is an
+        ``INSERT ... VALUES (...)`` statement, up to that many parameter sets
+        are inserted by each job, with a multi-row ``VALUES`` clause.
+        ``rowcount`` is the total over all jobs.
+
         Args:
             operation (str): A Google BigQuery query string.
 
@@ -252,11 +401,34 @@ class Cursor(object):
             formatted_operation, parameter_types = _format_operation(
                 operation, seq_of_parameters[0]
             )
-            for parameters in seq_of_parameters:
-                self._execute(
-                    formatted_operation, parameters, None, None, parameter_types
+
+            insert_parts = None
+            if self.executemany_batch_size and self.executemany_batch_size > 1:
+                insert_parts = _split_insert_values(
+                    formatted_operation, seq_of_parameters[0]
+                )
+
+            if insert_parts is not None:
+                parameters_per_row = max(1, len(seq_of_parameters[0]))
+                batch_size = min(
+                    self.executemany_batch_size,
+                    max(1, _MAX_QUERY_PARAMETERS // parameters_per_row),
                 )
-                rowcount += self.rowcount
+                for start in range(0, len(seq_of_parameters), batch_size):
+                    self._execute(
+                        *_format_insert_batch(
+                            insert_parts,
+                            seq_of_parameters[start : start + batch_size],
+                            parameter_types,
+                        )
+                    )
+                    rowcount += self.rowcount
+            else:
+                for parameters in seq_of_parameters:
+                    self._execute(
+                        formatted_operation, parameters, None, None, parameter_types
+                    )
+                    rowcount += self.rowcount
 
             self.rowcount = rowcount
 
@@ -269,6 +441,7 @@ class Cursor(object):
             # Already started fetching the data.
             return
 
+        self._wait_for_pending_job()
         rows = self._query_rows
         if rows is None:
             raise exceptions.InterfaceError(
@@ -280,8 +453,8 @@ class Cursor(object):
             bqstorage_client,
             create_bqstorage_client=False,
         ):
-            rows_iterable = self._bqstorage_fetch(bqstorage_client)
-            self._query_data = _helpers.to_bq_table_rows(rows_iterable)
+            record_batches = self._bqstorage_fetch(bqstorage_client)
+            self._query_data = _helpers.record_batches_to_bq_table_rows(record_batches)
             return
 
         self._query_data = iter(rows)
@@ -299,15 +472,26 @@ class Cursor(object):
                 A client tha know how to talk to the BigQuery Storage API.
 
         Returns:
-            Iterable[Mapping]:
-                A sequence of rows, represented as dictionaries.
+            Iterable[pyarrow.RecordBatch]:
+                The rows of the query results, one record batch per page.
         """
+        table_reference = self._query_rows._table
+
+        if self.max_stream_count != 1:
+            self._bqstorage_download = _pandas_helpers.download_arrow_bqstorage(
+                table_reference.project,
+                table_reference,
+                bqstorage_client,
+                preserve_order=self._preserve_order,
+                max_stream_count=self.max_stream_count,
+                download_profile=self.download_profile,
+            )
+            return self._bqstorage_download
+
         # Hitting this code path with a BQ Storage client instance implies that
         # bigquery_storage can indeed be imported here without errors.
         from google.cloud import bigquery_storage
 
-        table_reference = self._query_rows._table
-
         requested_session = bigquery_storage.types.ReadSession(
             table=table_reference.to_bqstorage(),
             data_format=bigquery_storage.types.DataFormat.ARROW,
@@ -315,17 +499,24 @@ class Cursor(object):
 
         if _ARROW_COMPRESSION_SUPPORT:
             requested_session.read_options.arrow_serialization_options.buffer_compression = (
-                ArrowSerializationOptions.CompressionCodec.LZ4_FRAME
+                bigquery_storage.ArrowSerializationOptions.CompressionCodec.LZ4_FRAME
             )
 
+        start_time = time.monotonic()
         read_session = bqstorage_client.create_read_session(
             parent="projects/{}".format(table_reference.project),
             read_session=requested_session,
-            # a single stream only, as DB API is not well-suited for multithreading
+            # A single stream, read in the calling thread. See max_stream_count
+            # for reading multiple streams in parallel.
             max_stream_count=1,
             retry=None,
             timeout=None,
         )
+        if self.download_profile is not None:
+            self.download_profile.record(
+                metrics.DownloadPhase.CREATE_READ_SESSION,
+                duration=time.monotonic() - start_time,
+            )
 
         if not read_session.streams:
             return iter([])  # empty table, nothing to read
@@ -333,8 +524,12 @@ class Cursor(object):
         stream_name = read_session.streams[0].name
         read_rows_stream = bqstorage_client.read_rows(stream_name)
 
-        rows_iterable = read_rows_stream.rows(read_session)
-        return rows_iterable
+        pages = read_rows_stream.rows(read_session).pages
+        if self.download_profile is not None:
+            return _profile_bqstorage_record_batches(
+                pages, stream_name, self.download_profile
+            )
+        return (page.to_arrow() for page in pages)
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -410,6 +605,112 @@ class Cursor(object):
         self._try_fetch()
         return list(self._query_data)
 
+    def _start_columnar_fetch(self):
+        """Hand the results of the last ``execute*()`` call over to one of
+        the ``fetch_*`` methods returning columnar data.
+
+        Returns:
+            google.cloud.bigquery.table.RowIterator: The query results.
+        """
+        self._wait_for_pending_job()
+        rows = self._query_rows
+        if rows is None:
+            raise exceptions.InterfaceError(
+                "No query results: execute() must be called before fetch."
+            )
+        if self._query_data is not None:
+            raise exceptions.InterfaceError(
+                "Columnar results must be fetched before any rows are fetched "
+                "with fetchone(), fetchmany() or fetchall()."
+            )
+
+        # The columnar result consumes all the rows.
+        self._query_data = iter(())
+        return rows
+
+    def fetch_record_batches(self):
+        """Fetch the results of the last ``execute*()`` call as a stream of
+        Arrow record batches.
+
+        The BigQuery Storage API is used if the connection has a BigQuery
+        Storage client and the results are large enough, reading up to
+        ``max_stream_count`` streams in parallel.
+
+        .. note::
+            Must be called before any rows are fetched with ``fetchone()``,
+            ``fetchmany()`` or ``fetchall()``. Afterwards, those return no
+            more rows.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: The query results.
+
+        Raises:
+            google.cloud.bigquery.dbapi.InterfaceError:
+                if called before ``execute()`` or after rows were fetched.
+        """
+        rows = self._start_columnar_fetch()
+        self._bqstorage_download = rows.to_arrow_iterable(
+            bqstorage_client=self.connection._bqstorage_client,
+            max_stream_count=self.max_stream_count,
+        )
+        return self._bqstorage_download
+
+    def fetch_arrow_table(self):
+        """Fetch the results of the last ``execute*()`` call as an Arrow table.
+
+        Same as :meth:`google.cloud.bigquery.table.RowIterator.to_arrow`,
+        using the BigQuery Storage client of the connection, if any.
+
+        .. note::
+            Must be called before any rows are fetched with ``fetchone()``,
+            ``fetchmany()`` or ``fetchall()``. Afterwards, those return no
+            more rows.
+
+        Returns:
+            pyarrow.Table: The query results.
+
+        Raises:
+            google.cloud.bigquery.dbapi.InterfaceError:
+                if called before ``execute()`` or after rows were fetched.
+        """
+        rows = self._start_columnar_fetch()
+        return rows.to_arrow(
+            bqstorage_client=self.connection._bqstorage_client,
+            create_bqstorage_client=False,
+        )
+
+    def fetch_df(self, **kwargs):
+        """Fetch the results of the last ``execute*()`` call as a pandas
+        DataFrame.
+
+        Same as :meth:`google.cloud.bigquery.table.RowIterator.to_dataframe`,
+        using the BigQuery Storage client of the connection, if any.
+
+        .. note::
+            Must be called before any rows are fetched with ``fetchone()``,
+            ``fetchmany()`` or ``fetchall()``. Afterwards, those return no
+            more rows.
+
+        Args:
+            kwargs:
+                Passed to
+                :meth:`~google.cloud.bigquery.table.RowIterator.to_dataframe`,
+                for example ``dtypes`` or ``geography_as_object``.
+
+        Returns:
+            pandas.DataFrame: The query results.
+
+        Raises:
+            google.cloud.bigquery.dbapi.InterfaceError:
+                if called before ``execute()`` or after rows were fetched.
+        """
+        rows = self._start_columnar_fetch()
+        return rows.to_dataframe(
+            bqstorage_client=self.connection._bqstorage_client,
+            create_bqstorage_client=False,
+            **kwargs,
+        )
+
     def setinputsizes(self, sizes):
         """No-op, but for consistency raise an error if cursor is closed."""
 
@@ -421,6 +722,202 @@ class Cursor(object):
         return iter(self._query_data)
 
 
+def _attach_session(config, session_id):
+    """Return a copy of ``config`` which runs its query in the session
+    ``session_id``, or ``config`` itself if it already names a session.
+
+    The caller's config is left as it is, so that it does not carry the
+    session to other connections, or past the end of the session.
+    """
+    connection_properties = config.connection_properties
+    if any(prop.key == "session_id" for prop in connection_properties):
+        return config
+    config = copy.deepcopy(config)
+    config.connection_properties = list(connection_properties) + [
+        ConnectionProperty("session_id", session_id)
+    ]
+    return config
+
+
+def _profile_bqstorage_record_batches(pages, stream_name, download_profile):
+    """Yield record batches from BigQuery Storage API stream pages, recording
+    the time spent waiting for and decoding each page in ``download_profile``.
+    """
+    read_start = time.monotonic()
+    for page in pages:
+        decode_start = time.monotonic()
+        download_profile.record(
+            metrics.DownloadPhase.STREAM_READ,
+            duration=decode_start - read_start,
+            rows=page.num_items,
+            pages=1,
+            stream=stream_name,
+        )
+        record_batch = page.to_arrow()
+        download_profile.record(
+            metrics.DownloadPhase.ARROW_DECODE,
+            duration=time.monotonic() - decode_start,
+            bytes=record_batch.nbytes,
+        )
+        yield record_batch
+        read_start = time.monotonic()
+
+
+def _find_insert_values_row(operation):
+    """Find the row of an ``INSERT ... VALUES (...)`` statement.
+
+    Args:
+        operation (str): A formatted Google BigQuery query string.
+
+    Returns:
+        Optional[Tuple[int, int]]:
+            The start and end of the parenthesized row, or ``None`` if
+            ``operation`` is not an ``INSERT`` of a single ``VALUES`` row.
+    """
+    match = _INSERT_VALUES_RE.match(operation)
+    if match is None:
+        return None
+
+    start = match.end()
+    depth = 0
+    quote = None
+    index = start
+    while index < len(operation):
+        char = operation[index]
+        if quote is not None:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"`":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                end = index + 1
+                if operation[end:].strip() not in ("", ";"):
+                    return None
+                return start, end
+        index += 1
+
+    return None
+
+
+def _split_insert_values(operation, parameters):
+    """Split an ``INSERT ... VALUES (...)`` statement around its row.
+
+    Args:
+        operation (str): A formatted Google BigQuery query string.
+
+        parameters (Union[Mapping[str, Any], Sequence[Any]]):
+            The first set of parameter values.
+
+    Returns:
+        Optional[Tuple[str, str, str]]:
+            The statement before the row, the row and the rest of the
+            statement, or ``None`` if the statement is not an ``INSERT`` of
+            a single row whose placeholders are all in the row.
+    """
+    row_span = _find_insert_values_row(operation)
+    if row_span is None:
+        return None
+
+    start, end = row_span
+    head, row, tail = operation[:start], operation[start:end], operation[end:]
+    if isinstance(parameters, collections_abc.Mapping):
+        placeholders = [_named_placeholder(name) for name in parameters]
+    else:
+        placeholders = ["?"]
+    if any(p in head or p in tail for p in placeholders):
+        return None
+
+    return head, row, tail
+
+
+def _named_placeholder(name):
+    return "@`{}`".format(name.replace("`", r"\`"))
+
+
+def _format_insert_batch(insert_parts, seq_of_parameters, parameter_types):
+    """Combine several parameter sets into one multi-row ``INSERT``.
+
+    Named parameters of the ``index``-th row are renamed to
+    ``name__index``, positional parameters are concatenated.
+
+    Args:
+        insert_parts (Tuple[str, str, str]):
+            The statement split by :func:`_split_insert_values`.
+
+        seq_of_parameters (Sequence[Union[Mapping[str, Any], Sequence[Any]]]):
+            The parameter sets to insert.
+
+        parameter_types (Optional[Union[Mapping[str, str], Sequence[str]]]):
+            The parameter types of a single row, ``None`` if it has no
+            parameters.
+
+    Returns:
+        Tuple[str, Union[Mapping[str, Any], Sequence[Any]], None, None, \
+        Union[Mapping[str, str], Sequence[str]]]:
+            The arguments of ``Cursor._execute()`` for the combined statement.
+
+    Raises:
+        google.cloud.bigquery.dbapi.ProgrammingError:
+            if the parameter sets do not all have the same parameters.
+    """
+    head, row, tail = insert_parts
+    first = seq_of_parameters[0]
+    if parameter_types is None:
+        parameter_types = ()
+
+    if isinstance(first, collections_abc.Mapping):
+        # Rename all placeholders of a row in one pass, so that a renamed
+        # placeholder is never renamed again, e.g. ``a`` to ``a__0`` and
+        # then, for a parameter named ``a__0``, to ``a__0__0``.
+        placeholders = {_named_placeholder(name): name for name in first}
+        placeholder_re = re.compile(
+            "|".join(
+                re.escape(placeholder)
+                for placeholder in sorted(placeholders, key=len, reverse=True)
+            )
+        )
+        rows = []
+        parameters = {}
+        types = {}
+        for index, row_parameters in enumerate(seq_of_parameters):
+            if row_parameters.keys() != first.keys():
+                raise exceptions.ProgrammingError(
+                    "All parameter sets of executemany() must have the same names."
+                )
+            if placeholders:
+                rows.append(
+                    placeholder_re.sub(
+                        lambda match: _named_placeholder(
+                            f"{placeholders[match.group()]}__{index}"
+                        ),
+                        row,
+                    )
+                )
+            else:
+                rows.append(row)
+            for name, value in row_parameters.items():
+                row_name = f"{name}__{index}"
+                parameters[row_name] = value
+                if name in parameter_types:
+                    types[row_name] = parameter_types[name]
+    else:
+        if any(len(values) != len(first) for values in seq_of_parameters):
+            raise exceptions.ProgrammingError(
+                "All parameter sets of executemany() must have the same length."
+            )
+        rows = [row] * len(seq_of_parameters)
+        parameters = [value for values in seq_of_parameters for value in values]
+        types = list(parameter_types) * len(seq_of_parameters)
+
+    return head + ", ".join(rows) + tail, parameters, None, None, types
+
+
 def _format_operation_list(operation, parameters):
     """Formats parameters in operation in the way BigQuery expects.
 
@@ -430,7 +927,8 @@ def _format_operation_list(operation, parameters):
     Args:
         operation (str): A Google BigQuery query string.
 
-        parameters (Sequence[Any]): Sequence of parameter values.
+        parameters (Sequence[Any]):
+            Sequence of parameter values. Only its length is used.
 
     Returns:
         str: A formatted query string.
@@ -457,7 +955,7 @@ def _format_operation_dict(operation, parameters):
     Args:
         operation (str): A Google BigQuery query string.
 
-        parameters (Mapping[str, Any]): Dictionary of parameter values.
+        parameters (Iterable[str]): Names of the parameters.
 
     Returns:
         str: A formatted query string.
@@ -467,10 +965,7 @@ def _format_operation_dict(operation, parameters):
             if a parameter used in the operation is not found in the
             ``parameters`` argument.
     """
-    formatted_params = {}
-    for name in parameters:
-        escaped_name = name.replace("`", r"\`")
-        formatted_params[name] = "@`{}`".format(escaped_name)
+    formatted_params = {name: _named_placeholder(name) for name in parameters}
 
     try:
         return operation % formatted_params
@@ -488,7 +983,10 @@ def _format_operation(operation, parameters):
             Optional parameter values.
 
     Returns:
-        str: A formatted query string.
+        Tuple[str, Union[Mapping[str, str], Sequence[Optional[str]], None]]:
+            A formatted query string and the parameter types declared in
+            ``operation``. The parameter types are shared between calls and
+            must not be modified.
 
     Raises:
         google.cloud.bigquery.dbapi.ProgrammingError:
@@ -498,16 +996,49 @@ def _format_operation(operation, parameters):
     if parameters is None or len(parameters) == 0:
         return operation.replace("%%", "%"), None  # Still do percent de-escaping.
 
+    # Only the parameter names, or the number of parameters, affect the
+    # formatted operation, so the parsed operation can be reused.
+    if isinstance(parameters, collections_abc.Mapping):
+        return _prepare_operation(operation, tuple(parameters))
+    return _prepare_operation(operation, len(parameters))
+
+
+@functools.lru_cache(maxsize=_PREPARED_OPERATION_CACHE_SIZE)
+def _prepare_operation(operation, parameter_names_or_count):
+    """Parse and format an operation, see :func:`_format_operation`.
+
+    Args:
+        operation (str): A Google BigQuery query string.
+
+        parameter_names_or_count (Union[Tuple[str, ...], int]):
+            The names of named parameters, or the number of positional
+            parameters.
+
+    Returns:
+        Tuple[str, Union[Mapping[str, str], Tuple[Optional[str], ...]]]:
+            A formatted query string and the declared parameter types.
+    """
     operation, parameter_types = _extract_types(operation)
     if parameter_types is None:
         raise exceptions.ProgrammingError(
             f"Parameters were provided, but {repr(operation)} has no placeholders."
         )
 
-    if isinstance(parameters, collections_abc.Mapping):
-        return _format_operation_dict(operation, parameters), parameter_types
+    if isinstance(parameter_names_or_count, tuple):
+        formatted_operation = _format_operation_dict(
+            operation, parameter_names_or_count
+        )
+    else:
+        formatted_operation = _format_operation_list(
+            operation, range(parameter_names_or_count)
+        )
 
-    return _format_operation_list(operation, parameters), parameter_types
+    # Cached results are shared, make sure they are not modified.
+    if isinstance(parameter_types, dict):
+        parameter_types = types.MappingProxyType(parameter_types)
+    else:
+        parameter_types = tuple(parameter_types)
+    return formatted_operation, parameter_types
 
 
 def _extract_types(
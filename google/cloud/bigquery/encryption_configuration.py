@@ -14,7 +14,7 @@
 
 """Define class for the custom encryption configuration."""
 
-import copy
+from google.cloud.bigquery import _helpers
 
 
 class EncryptionConfiguration(object):
@@ -56,7 +56,7 @@ class EncryptionConfiguration(object):
                 An encryption configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
     def to_api_repr(self):
@@ -67,7 +67,7 @@ class EncryptionConfiguration(object):
             Dict[str, object]:
                 Encryption configuration as represented as an API resource
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     def __eq__(self, other):
         if not isinstance(other, EncryptionConfiguration):
@@ -21,7 +21,6 @@
 from __future__ import absolute_import, annotations
 
 import base64
-import copy
 import typing
 from typing import Any, Dict, FrozenSet, Iterable, Optional, Union
 
@@ -168,7 +167,7 @@ class BigtableColumn(object):
             Dict[str, Any]:
                 A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: dict) -> "BigtableColumn":
@@ -185,7 +184,7 @@ class BigtableColumn(object):
             external_config.BigtableColumn: Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
 
@@ -270,7 +269,7 @@ class BigtableColumnFamily(object):
             Dict[str, Any]:
                 A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: dict) -> "BigtableColumnFamily":
@@ -288,7 +287,7 @@ class BigtableColumnFamily(object):
                 Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
 
@@ -351,7 +350,7 @@ class BigtableOptions(object):
             Dict[str, Any]:
                 A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: dict) -> "BigtableOptions":
@@ -368,7 +367,7 @@ class BigtableOptions(object):
             BigtableOptions: Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
 
@@ -535,7 +534,7 @@ class CSVOptions(object):
         Returns:
             Dict[str, Any]: A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: dict) -> "CSVOptions":
@@ -552,7 +551,7 @@ class CSVOptions(object):
             CSVOptions: Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
 
@@ -598,7 +597,7 @@ class GoogleSheetsOptions(object):
         Returns:
             Dict[str, Any]: A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: dict) -> "GoogleSheetsOptions":
@@ -615,7 +614,7 @@ class GoogleSheetsOptions(object):
             GoogleSheetsOptions: Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
 
@@ -696,7 +695,7 @@ class HivePartitioningOptions(object):
         Returns:
             Dict[str, Any]: A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: dict) -> "HivePartitioningOptions":
@@ -713,7 +712,7 @@ class HivePartitioningOptions(object):
             HivePartitioningOptions: Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
 
@@ -1103,7 +1102,7 @@ class ExternalConfig(object):
             Dict[str, Any]:
                 A dictionary in the format used by the BigQuery API.
         """
-        config = copy.deepcopy(self._properties)
+        config = _helpers._copy_resource(self._properties)
         return config
 
     @classmethod
@@ -1121,7 +1120,7 @@ class ExternalConfig(object):
             ExternalConfig: Configuration parsed from ``resource``.
         """
         config = cls(resource["sourceFormat"])
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
 
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 from typing import Dict, Optional, Union
 
+from google.cloud.bigquery import _helpers
+
 
 class AvroOptions:
     """Options if source format is set to AVRO."""
@@ -55,7 +56,7 @@ class AvroOptions:
                 Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
     def to_api_repr(self) -> dict:
@@ -65,7 +66,7 @@ class AvroOptions:
             Dict[str, bool]:
                 A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
 
 class ParquetOptions:
@@ -134,7 +135,7 @@ class ParquetOptions:
                 Configuration parsed from ``resource``.
         """
         config = cls()
-        config._properties = copy.deepcopy(resource)
+        config._properties = _helpers._copy_resource(resource)
         return config
 
     def to_api_repr(self) -> dict:
@@ -144,4 +145,4 @@ class ParquetOptions:
             Dict[str, bool]:
                 A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
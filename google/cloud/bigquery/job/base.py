@@ -157,7 +157,7 @@ class _JobReference(object):
 
     def _to_api_repr(self):
         """Returns the API resource representation of the job reference."""
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def _from_api_repr(cls, resource):
@@ -371,7 +371,23 @@ class _JobConfig(object):
         Returns:
             Dict: A dictionary in the format used by the BigQuery API.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
+
+    def __deepcopy__(self, memo):
+        """Copy the config, copying its resource with ``_copy_resource``.
+
+        Job configs are copied for every job the client starts, so the
+        generic ``copy.deepcopy`` machinery is avoided for the resource.
+        """
+        new_config = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new_config
+        for name, value in self.__dict__.items():
+            if name == "_properties":
+                value = _helpers._copy_resource(value)
+            else:
+                value = copy.deepcopy(value, memo)
+            object.__setattr__(new_config, name, value)
+        return new_config
 
     def _fill_from_default(self, default_job_config=None):
         """Merge this job config with a default job config.
@@ -404,7 +420,7 @@ class _JobConfig(object):
         # positive here.
         new_job_config = self.__class__()  # pytype: disable=missing-parameter
 
-        default_job_properties = copy.deepcopy(default_job_config._properties)
+        default_job_properties = _helpers._copy_resource(default_job_config._properties)
         for key in self._properties:
             if key != self._job_type:
                 default_job_properties[key] = self._properties[key]
@@ -789,7 +805,7 @@ class _AsyncJob(google.api_core.future.polling.PollingFuture):
 
     def to_api_repr(self):
         """Generate a resource for the job."""
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     _build_resource = to_api_repr  # backward-compatibility alias
 
@@ -15,7 +15,6 @@
 """Classes for query jobs."""
 
 import concurrent.futures
-import copy
 import re
 import time
 import typing
@@ -58,11 +57,6 @@ from google.cloud.bigquery.job.base import _AsyncJob
 from google.cloud.bigquery.job.base import _JobConfig
 from google.cloud.bigquery.job.base import _JobReference
 
-try:
-    import pandas  # type: ignore
-except ImportError:
-    pandas = None
-
 if typing.TYPE_CHECKING:  # pragma: NO COVER
     # Assumption: type checks are only used by library developers and CI environments
     # that have all optional dependencies installed, thus no conditional imports.
@@ -340,12 +334,12 @@ class ScriptOptions:
                 ScriptOptions sample parsed from ``resource``.
         """
         entry = cls()
-        entry._properties = copy.deepcopy(resource)
+        entry._properties = _helpers._copy_resource(resource)
         return entry
 
     def to_api_repr(self) -> Dict[str, Any]:
         """Construct the API resource representation."""
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @property
     def statement_timeout_ms(self) -> Union[int, None]:
@@ -855,7 +849,7 @@ class QueryJobConfig(_JobConfig):
         Returns:
             Dict: A dictionary in the format used by the BigQuery API.
         """
-        resource = copy.deepcopy(self._properties)
+        resource = _helpers._copy_resource(self._properties)
         # Query parameters have an addition property associated with them
         # to indicate if the query is using named or positional parameters.
         query_parameters = resource.get("query", {}).get("queryParameters")
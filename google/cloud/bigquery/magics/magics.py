@@ -28,6 +28,7 @@ import ast
 import copy
 import functools
 import sys
+import threading
 import time
 import warnings
 from concurrent import futures
@@ -45,8 +46,10 @@ from google.api_core.exceptions import NotFound
 import google.auth  # type: ignore
 from google.cloud import bigquery
 import google.cloud.bigquery.dataset
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery import _versions_helpers
 from google.cloud.bigquery import exceptions
+from google.cloud.bigquery._job_helpers import QueryEstimateCache
 from google.cloud.bigquery.dbapi import _helpers
 from google.cloud.bigquery.magics import line_arg_parser as lap
 
@@ -73,6 +76,7 @@ class Context(object):
         self._bigquery_client_options = client_options.ClientOptions()
         self._bqstorage_client_options = client_options.ClientOptions()
         self._progress_bar_type = "tqdm_notebook"
+        self._query_estimate_cache = QueryEstimateCache()
 
     @property
     def credentials(self):
@@ -235,6 +239,182 @@ else:
     context = Context()
 
 
+class BackgroundQuery(object):
+    """Results of a ``%%bigquery --async`` cell, downloaded in a background
+    thread.
+
+    The cell binds a ``BackgroundQuery`` to its destination variable and
+    returns immediately. The rows are downloaded a page at a time, and
+    :attr:`dataframe` holds the pages downloaded so far.
+
+    Args:
+        query_job (Optional[google.cloud.bigquery.job.QueryJob]):
+            The query job, ``None`` for a table preview.
+        get_rows (Callable[[], google.cloud.bigquery.table.RowIterator]):
+            Waits for the query to finish and returns its results.
+        bqstorage_client
+            (Optional[:class:`~google.cloud.bigquery_storage.BigQueryReadClient`]):
+            A client for the BigQuery Storage API.
+        on_done (Callable[[], None]):
+            Called in the background thread once the download has ended.
+    """
+
+    def __init__(self, query_job, get_rows, bqstorage_client, on_done):
+        self.query_job = query_job
+        self._get_rows = get_rows
+        self._bqstorage_client = bqstorage_client
+        self._on_done = on_done
+        self._frames = []
+        self._total_rows = None
+        self._exception = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._download, daemon=True)
+
+    def _start(self):
+        self._thread.start()
+
+    def _download(self):
+        try:
+            rows = self._get_rows()
+            with self._lock:
+                self._total_rows = rows.total_rows
+            for frame in rows.to_dataframe_iterable(
+                bqstorage_client=self._bqstorage_client
+            ):
+                with self._lock:
+                    self._frames.append(frame)
+                if self._cancelled:
+                    break
+        except Exception as exc:
+            self._exception = exc
+        finally:
+            self._on_done()
+            self._done.set()
+
+    @property
+    def dataframe(self):
+        """pandas.DataFrame: The rows downloaded so far."""
+        pandas = _versions_helpers.PANDAS_VERSIONS.try_import(raise_if_error=True)
+        with self._lock:
+            frames = list(self._frames)
+        if not frames:
+            return pandas.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pandas.concat(frames, ignore_index=True)
+
+    @property
+    def rows_downloaded(self):
+        """int: The number of rows downloaded so far."""
+        with self._lock:
+            return sum(len(frame) for frame in self._frames)
+
+    @property
+    def total_rows(self):
+        """Optional[int]: The number of rows in the results, ``None`` until
+        the query has finished."""
+        with self._lock:
+            return self._total_rows
+
+    def done(self):
+        """bool: ``True`` once the download has finished, failed or been
+        cancelled."""
+        return self._done.is_set()
+
+    def exception(self, timeout=None):
+        """Wait for the download to end and return its error, if any.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, forever if ``None``.
+
+        Returns:
+            Optional[Exception]: The error which stopped the download.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the download did not end in ``timeout`` seconds.
+        """
+        if not self._done.wait(timeout):
+            raise futures.TimeoutError()
+        return self._exception
+
+    def result(self, timeout=None):
+        """Wait for the download to end and return all rows.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, forever if ``None``.
+
+        Returns:
+            pandas.DataFrame: The query results.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the download did not end in ``timeout`` seconds.
+            Exception: The error which stopped the download.
+        """
+        exception = self.exception(timeout=timeout)
+        if exception is not None:
+            raise exception
+        return self.dataframe
+
+    def cancel(self):
+        """Stop the download after the current page, and cancel the query
+        job if it is still running."""
+        self._cancelled = True
+        if self.query_job is not None and not self.query_job.done():
+            self.query_job.cancel()
+
+    def __repr__(self):
+        if self._exception is not None:
+            state = "failed: {}".format(self._exception)
+        elif self.done():
+            state = "done"
+        else:
+            state = "running"
+        total_rows = self.total_rows
+        return "<BackgroundQuery {}, {} of {} rows downloaded>".format(
+            state,
+            self.rows_downloaded,
+            "?" if total_rows is None else total_rows,
+        )
+
+
+def _start_background_query(
+    destination_var, query_job, get_rows, bqstorage_client, close_transports
+):
+    """Download the results of a ``--async`` cell in a background thread.
+
+    Args:
+        destination_var (str):
+            The name of the IPython session variable for the
+            :class:`BackgroundQuery`.
+        query_job (Optional[google.cloud.bigquery.job.QueryJob]):
+            The query job, ``None`` for a table preview.
+        get_rows (Callable[[], google.cloud.bigquery.table.RowIterator]):
+            Waits for the query to finish and returns its results.
+        bqstorage_client
+            (Optional[:class:`~google.cloud.bigquery_storage.BigQueryReadClient`]):
+            A client for the BigQuery Storage API.
+        close_transports (Callable[[], None]):
+            Closes the clients, called once the download has ended.
+
+    Returns:
+        BackgroundQuery: The started background download.
+    """
+    background_query = BackgroundQuery(
+        query_job, get_rows, bqstorage_client, close_transports
+    )
+    IPython.get_ipython().push({destination_var: background_query})
+    background_query._start()
+    print(
+        f"Downloading results in the background, see the '{destination_var}' "
+        "variable."
+    )
+    return background_query
+
+
 def _handle_error(error, destination_var=None):
     """Process a query execution error.
 
@@ -283,12 +463,20 @@ def _run_query(client, query, job_config=None):
         Query complete after 2.07s
         'bf633912-af2c-4780-b568-5d868058632b'
     """
+    if job_config and job_config.dry_run:
+        # Share the dry runs of --dry_run cells between the clients of all
+        # cells, but give each cell its own copy of the shared job.
+        query_job = client.estimate_query(
+            query, job_config=job_config, cache=context._query_estimate_cache
+        )
+        # to_api_repr() omits the statistics, copy the whole resource.
+        return bigquery.QueryJob.from_api_repr(
+            copy.deepcopy(query_job._properties), client
+        )
+
     start_time = time.perf_counter()
     query_job = client.query(query, job_config=job_config)
 
-    if job_config and job_config.dry_run:
-        return query_job
-
     print(f"Executing query with job ID: {query_job.job_id}")
 
     while True:
@@ -469,6 +657,37 @@ def _create_dataset_if_necessary(client, dataset_id):
         "Defaults to location set in query setting in console."
     ),
 )
+@magic_arguments.argument(
+    "--to_arrow",
+    action="store_true",
+    default=False,
+    help=(
+        "Return the query results as a pyarrow.Table instead of a "
+        "pandas.DataFrame. Install the ``pyarrow`` package to use this feature."
+    ),
+)
+@magic_arguments.argument(
+    "--to_parquet",
+    type=str,
+    default=None,
+    help=(
+        "Write the query results to this parquet file, one record batch at a "
+        "time, instead of returning them. The output is the file path. "
+        "Install the ``pyarrow`` package to use this feature."
+    ),
+)
+@magic_arguments.argument(
+    "--async",
+    dest="run_async",
+    action="store_true",
+    default=False,
+    help=(
+        "Run the query and download its results in a background thread, "
+        "without blocking the notebook. The destination variable is bound "
+        "immediately to a BackgroundQuery, which collects the downloaded "
+        "pages. Requires a destination variable."
+    ),
+)
 def _cell_magic(line, query):
     """Underlying function for bigquery cell magic
 
@@ -481,7 +700,9 @@ def _cell_magic(line, query):
         query (str): SQL query to run
 
     Returns:
-        pandas.DataFrame: the query results.
+        Union[pandas.DataFrame, pyarrow.Table, str]:
+            the query results, or the path of the parquet file they were
+            written to.
     """
     # The built-in parser does not recognize Python structures such as dicts, thus
     # we extract the "--params" option and inteprpret it separately.
@@ -511,6 +732,12 @@ def _cell_magic(line, query):
             "Storage API is already used by default.",
             category=DeprecationWarning,
         )
+    if args.to_arrow and args.to_parquet:
+        raise ValueError("Use either --to_arrow or --to_parquet, not both.")
+    if args.run_async and not args.destination_var:
+        raise ValueError("--async requires a destination variable.")
+    if args.run_async and (args.to_arrow or args.to_parquet):
+        raise ValueError("--async cannot be used with --to_arrow or --to_parquet.")
     use_bqstorage_api = not args.use_rest_api
     location = args.location
 
@@ -560,6 +787,8 @@ def _cell_magic(line, query):
     )
 
     close_transports = functools.partial(_close_transports, client, bqstorage_client)
+    # A background download closes the transports itself, once it has ended.
+    background_query = None
 
     try:
         if args.max_results:
@@ -600,16 +829,34 @@ def _cell_magic(line, query):
         # Any query that does not contain whitespace (aside from leading and trailing whitespace)
         # is assumed to be a table id
         if not re.search(r"\s", query):
+            if args.run_async:
+                background_query = _start_background_query(
+                    args.destination_var,
+                    None,
+                    functools.partial(client.list_rows, query, max_results=max_results),
+                    bqstorage_client,
+                    close_transports,
+                )
+                return
+
             try:
                 rows = client.list_rows(query, max_results=max_results)
             except Exception as ex:
                 _handle_error(ex, args.destination_var)
                 return
 
-            result = rows.to_dataframe(
-                bqstorage_client=bqstorage_client,
-                create_bqstorage_client=False,
-            )
+            if args.to_parquet:
+                result = _write_parquet(rows, args.to_parquet, bqstorage_client)
+            elif args.to_arrow:
+                result = rows.to_arrow(
+                    bqstorage_client=bqstorage_client,
+                    create_bqstorage_client=False,
+                )
+            else:
+                result = rows.to_dataframe(
+                    bqstorage_client=bqstorage_client,
+                    create_bqstorage_client=False,
+                )
             if args.destination_var:
                 IPython.get_ipython().push({args.destination_var: result})
                 return
@@ -646,6 +893,27 @@ def _cell_magic(line, query):
             value = int(args.maximum_bytes_billed)
             job_config.maximum_bytes_billed = value
 
+        if args.run_async and not args.dry_run:
+            try:
+                query_job = client.query(query, job_config=job_config)
+            except Exception as ex:
+                _handle_error(ex, args.destination_var)
+                return
+
+            print(f"Executing query with job ID: {query_job.job_id}")
+            if max_results:
+                get_rows = functools.partial(query_job.result, max_results=max_results)
+            else:
+                get_rows = query_job.result
+            background_query = _start_background_query(
+                args.destination_var,
+                query_job,
+                get_rows,
+                None if max_results else bqstorage_client,
+                close_transports,
+            )
+            return
+
         try:
             query_job = _run_query(client, query, job_config=job_config)
         except Exception as ex:
@@ -668,15 +936,27 @@ def _cell_magic(line, query):
 
         progress_bar = context.progress_bar_type or args.progress_bar_type
 
+        # The first rows are read from the first results page over REST,
+        # without the overhead of starting a BigQuery Storage API session.
         if max_results:
-            result = query_job.result(max_results=max_results).to_dataframe(
-                bqstorage_client=None,
+            results = query_job.result(max_results=max_results)
+            download_client = None
+        else:
+            results = query_job
+            download_client = bqstorage_client
+
+        if args.to_parquet:
+            rows = results if max_results else query_job.result()
+            result = _write_parquet(rows, args.to_parquet, download_client)
+        elif args.to_arrow:
+            result = results.to_arrow(
+                bqstorage_client=download_client,
                 create_bqstorage_client=False,
                 progress_bar_type=progress_bar,
             )
         else:
-            result = query_job.to_dataframe(
-                bqstorage_client=bqstorage_client,
+            result = results.to_dataframe(
+                bqstorage_client=download_client,
                 create_bqstorage_client=False,
                 progress_bar_type=progress_bar,
             )
@@ -686,7 +966,48 @@ def _cell_magic(line, query):
         else:
             return result
     finally:
-        close_transports()
+        if background_query is None:
+            close_transports()
+
+
+def _write_parquet(rows, path, bqstorage_client):
+    """Write query results to a parquet file, one record batch at a time.
+
+    Args:
+        rows (google.cloud.bigquery.table.RowIterator): The query results.
+        path (str): The parquet file to write.
+        bqstorage_client
+            (Optional[:class:`~google.cloud.bigquery_storage.BigQueryReadClient`]):
+            A client for the BigQuery Storage API. If ``None``, the results
+            are downloaded with the REST API.
+
+    Returns:
+        str: The path of the parquet file.
+    """
+    _versions_helpers.PYARROW_VERSIONS.try_import(raise_if_error=True)
+    import pyarrow
+    import pyarrow.parquet
+
+    writer = None
+    num_rows = 0
+    try:
+        for record_batch in rows.to_arrow_iterable(bqstorage_client=bqstorage_client):
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(path, record_batch.schema)
+            writer.write_batch(record_batch)
+            num_rows += record_batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        arrow_schema = _pandas_helpers.bq_to_arrow_schema(rows.schema)
+        pyarrow.parquet.write_table(
+            (arrow_schema or pyarrow.schema([])).empty_table(), path
+        )
+
+    print(f"Wrote {num_rows} rows to {path}")
+    return path
 
 
 def _split_args_line(line):
@@ -0,0 +1,546 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lightweight request metrics hooks for the BigQuery client.
+
+Unlike :mod:`google.cloud.bigquery.opentelemetry_tracing`, these hooks have no
+third-party dependencies. Pass a :class:`MetricsHook` to
+:class:`~google.cloud.bigquery.client.Client` (or set
+:attr:`~google.cloud.bigquery.client.Client.metrics_hook`) to be notified
+after every REST API attempt and every resumable upload chunk.
+"""
+
+import bisect
+import contextlib
+import dataclasses
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Default upper bounds, in seconds, of the latency histogram buckets."""
+
+# Collections whose following path segment is a resource ID. Used to turn a
+# request path into a low-cardinality template suitable as a metric label.
+_PATH_PLACEHOLDERS = {
+    "projects": "{project}",
+    "datasets": "{dataset}",
+    "tables": "{table}",
+    "jobs": "{job}",
+    "queries": "{job}",
+    "models": "{model}",
+    "routines": "{routine}",
+    "rowAccessPolicies": "{policy}",
+}
+
+_last_response = threading.local()
+
+
+@dataclasses.dataclass(frozen=True)
+class RequestMetric:
+    """Measurements for a single attempt of a REST API call."""
+
+    method: Optional[str]
+    """HTTP method, such as ``GET`` or ``POST``."""
+
+    operation: Optional[str]
+    """Logical API method name, such as ``BigQuery.getTable``."""
+
+    path_template: Optional[str]
+    """Request path with resource IDs replaced by placeholders."""
+
+    attempt: int
+    """1-based attempt number within the enclosing retry loop."""
+
+    duration: float
+    """Wall-clock duration of the attempt, in seconds."""
+
+    status_code: Optional[int]
+    """HTTP status code of the response, if one was received."""
+
+    response_bytes: Optional[int]
+    """Size of the response body in bytes, if one was received."""
+
+    error_reason: Optional[str]
+    """Reason the attempt failed, or ``None`` if it succeeded."""
+
+    retry_reason: Optional[str]
+    """Failure reason of the previous attempt, if this attempt is a retry."""
+
+
+@dataclasses.dataclass(frozen=True)
+class UploadChunkMetric:
+    """Measurements for a single resumable upload request."""
+
+    chunk_index: int
+    """0-based index of the chunk. The upload initiation request is ``-1``."""
+
+    duration: float
+    """Wall-clock duration of the request, in seconds."""
+
+    bytes_sent: int
+    """Number of payload bytes sent by this request."""
+
+    status_code: Optional[int]
+    """HTTP status code of the response, if one was received."""
+
+    error_reason: Optional[str]
+    """Reason the request failed, or ``None`` if it succeeded."""
+
+
+class MetricsHook:
+    """Base class for client metrics hooks.
+
+    Subclasses override whichever methods they are interested in. Hooks are
+    called synchronously on the thread making the request, so they should be
+    cheap and must be thread-safe. Exceptions raised by a hook are logged and
+    otherwise ignored.
+    """
+
+    def on_request(self, metric: RequestMetric) -> None:
+        """Called after each REST API attempt.
+
+        Args:
+            metric (google.cloud.bigquery.metrics.RequestMetric):
+                Measurements for the attempt.
+        """
+
+    def on_upload_chunk(self, metric: UploadChunkMetric) -> None:
+        """Called after each resumable upload request.
+
+        Args:
+            metric (google.cloud.bigquery.metrics.UploadChunkMetric):
+                Measurements for the request.
+        """
+
+
+class _Histogram:
+    """Bucketed histogram with per-bucket (non-cumulative) counts.
+
+    Not thread-safe on its own; callers must hold a lock.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class HistogramCollector(MetricsHook):
+    """In-memory metrics hook aggregating latency histograms and counters.
+
+    Request metrics are keyed on ``(operation, path_template)``, so the
+    number of series stays bounded regardless of how many resources are
+    accessed. Use :meth:`snapshot` to scrape the aggregated values, for
+    example from a metrics endpoint in your service.
+
+    Args:
+        buckets (Optional[Sequence[float]]):
+            Upper bounds, in seconds, of the latency histogram buckets.
+            Defaults to :data:`DEFAULT_LATENCY_BUCKETS`.
+    """
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None):
+        self._buckets = tuple(
+            sorted(DEFAULT_LATENCY_BUCKETS if buckets is None else buckets)
+        )
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+        self._uploads: Dict[str, Any] = self._new_upload_series()
+
+    def _new_request_series(self) -> Dict[str, Any]:
+        return {
+            "latency": _Histogram(self._buckets),
+            "attempts": 0,
+            "retries": 0,
+            "errors": 0,
+            "response_bytes": 0,
+            "status_codes": {},
+            "retry_reasons": {},
+        }
+
+    def _new_upload_series(self) -> Dict[str, Any]:
+        return {
+            "latency": _Histogram(self._buckets),
+            "requests": 0,
+            "errors": 0,
+            "bytes_sent": 0,
+            "status_codes": {},
+        }
+
+    def on_request(self, metric: RequestMetric) -> None:
+        key = (metric.operation, metric.path_template)
+        with self._lock:
+            series = self._requests.get(key)
+            if series is None:
+                series = self._requests[key] = self._new_request_series()
+            series["latency"].observe(metric.duration)
+            series["attempts"] += 1
+            if metric.error_reason is not None:
+                series["errors"] += 1
+            if metric.response_bytes:
+                series["response_bytes"] += metric.response_bytes
+            if metric.status_code is not None:
+                codes = series["status_codes"]
+                codes[metric.status_code] = codes.get(metric.status_code, 0) + 1
+            if metric.retry_reason is not None:
+                series["retries"] += 1
+                reasons = series["retry_reasons"]
+                reasons[metric.retry_reason] = reasons.get(metric.retry_reason, 0) + 1
+
+    def on_upload_chunk(self, metric: UploadChunkMetric) -> None:
+        with self._lock:
+            series = self._uploads
+            series["latency"].observe(metric.duration)
+            series["requests"] += 1
+            series["bytes_sent"] += metric.bytes_sent
+            if metric.error_reason is not None:
+                series["errors"] += 1
+            if metric.status_code is not None:
+                codes = series["status_codes"]
+                codes[metric.status_code] = codes.get(metric.status_code, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of the aggregated metrics.
+
+        Returns:
+            Dict[str, Any]:
+                A JSON-serializable mapping with a ``requests`` list (one entry
+                per ``(operation, path_template)`` series) and an ``uploads``
+                entry for resumable upload requests.
+        """
+
+        def copy_series(series):
+            result = dict(series)
+            result["latency"] = series["latency"].to_dict()
+            result["status_codes"] = dict(series["status_codes"])
+            if "retry_reasons" in series:
+                result["retry_reasons"] = dict(series["retry_reasons"])
+            return result
+
+        with self._lock:
+            requests = []
+            for (operation, path_template), series in self._requests.items():
+                entry = copy_series(series)
+                entry["operation"] = operation
+                entry["path_template"] = path_template
+                requests.append(entry)
+            uploads = copy_series(self._uploads)
+        return {"requests": requests, "uploads": uploads}
+
+    def reset(self) -> None:
+        """Discard all aggregated metrics."""
+        with self._lock:
+            self._requests = {}
+            self._uploads = self._new_upload_series()
+
+
+def path_template(path: Optional[str]) -> Optional[str]:
+    """Replace resource IDs in a REST API path with placeholders.
+
+    For example, ``/projects/my-project/datasets/ds/tables/t:getIamPolicy``
+    becomes ``/projects/{project}/datasets/{dataset}/tables/{table}:getIamPolicy``.
+
+    Args:
+        path (Optional[str]): A REST API request path.
+
+    Returns:
+        Optional[str]: The path template.
+    """
+    if not path:
+        return path
+
+    segments = path.split("/")
+    for index in range(1, len(segments)):
+        placeholder = _PATH_PLACEHOLDERS.get(segments[index - 1])
+        if placeholder is None:
+            continue
+        _, colon, verb = segments[index].partition(":")
+        segments[index] = placeholder + colon + verb
+    return "/".join(segments)
+
+
+def _error_reason(exc: BaseException) -> str:
+    """Extract a short, low-cardinality reason string from an exception."""
+    errors = getattr(exc, "errors", None)
+    if errors:
+        first = errors[0]
+        if isinstance(first, dict) and first.get("reason"):
+            return first["reason"]
+    return type(exc).__name__
+
+
+def _record_response(response) -> None:
+    """Remember the status and size of the latest response on this thread."""
+    content = getattr(response, "content", None)
+    size = len(content) if isinstance(content, (bytes, bytearray)) else None
+    _last_response.value = (getattr(response, "status_code", None), size)
+
+
+def _reset_response() -> None:
+    _last_response.value = None
+
+
+def _get_response() -> Tuple[Optional[int], Optional[int]]:
+    """Return ``(status_code, size)`` of the latest response on this thread."""
+    value = getattr(_last_response, "value", None)
+    return value if value is not None else (None, None)
+
+
+def _notify(hook: MetricsHook, method_name: str, metric) -> None:
+    try:
+        getattr(hook, method_name)(metric)
+    except Exception:  # pragma: NO COVER
+        _LOGGER.exception("BigQuery metrics hook %r raised an exception.", hook)
+
+
+def instrument_call(
+    call: Callable[[], Any],
+    hook: MetricsHook,
+    method: Optional[str] = None,
+    path: Optional[str] = None,
+    operation: Optional[str] = None,
+) -> Callable[[], Any]:
+    """Wrap an API request so that ``hook`` observes each attempt.
+
+    The returned callable is meant to be wrapped by a retry object, so that
+    every retry attempt is measured separately.
+    """
+    template = path_template(path)
+    state = {"attempt": 0, "retry_reason": None}
+
+    def instrumented(*args, **kwargs):
+        state["attempt"] += 1
+        _reset_response()
+        error_reason = None
+        error_code = None
+        start = time.monotonic()
+        try:
+            return call(*args, **kwargs)
+        except Exception as exc:
+            error_reason = _error_reason(exc)
+            error_code = getattr(exc, "code", None)
+            raise
+        finally:
+            duration = time.monotonic() - start
+            status_code, response_bytes = _get_response()
+            if status_code is None and isinstance(error_code, int):
+                status_code = error_code
+            _notify(
+                hook,
+                "on_request",
+                RequestMetric(
+                    method=method,
+                    operation=operation,
+                    path_template=template,
+                    attempt=state["attempt"],
+                    duration=duration,
+                    status_code=status_code,
+                    response_bytes=response_bytes,
+                    error_reason=error_reason,
+                    retry_reason=state["retry_reason"],
+                ),
+            )
+            state["retry_reason"] = error_reason
+
+    return instrumented
+
+
+class UploadChunkTimer:
+    """Context manager reporting one resumable upload request to ``hook``.
+
+    Call :meth:`finish` with the response once the request succeeds. If the
+    block raises instead, the failure is reported and the error propagates.
+    """
+
+    def __init__(self, hook: MetricsHook, chunk_index: int):
+        self._hook = hook
+        self._chunk_index = chunk_index
+        self._status_code: Optional[int] = None
+        self._bytes_sent = 0
+        self._start = 0.0
+
+    def __enter__(self) -> "UploadChunkTimer":
+        self._start = time.monotonic()
+        return self
+
+    def finish(self, response, bytes_sent: int) -> None:
+        self._status_code = getattr(response, "status_code", None)
+        self._bytes_sent = bytes_sent
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        error_reason = None
+        if exc_value is not None:
+            error_reason = _error_reason(exc_value)
+            code = getattr(exc_value, "code", None)
+            if isinstance(code, int):
+                self._status_code = code
+        _notify(
+            self._hook,
+            "on_upload_chunk",
+            UploadChunkMetric(
+                chunk_index=self._chunk_index,
+                duration=time.monotonic() - self._start,
+                bytes_sent=self._bytes_sent,
+                status_code=self._status_code,
+                error_reason=error_reason,
+            ),
+        )
+
+
+class DownloadPhase:
+    """Names of the phases recorded in a :class:`DownloadProfile`."""
+
+    GET_PAGE = "get_page"
+    """Waiting for ``tabledata.list`` / ``jobs.getQueryResults`` pages."""
+
+    CREATE_READ_SESSION = "create_read_session"
+    """Creating the BigQuery Storage API read session."""
+
+    STREAM_READ = "stream_read"
+    """Waiting for pages from BigQuery Storage API read streams."""
+
+    ARROW_DECODE = "arrow_decode"
+    """Decoding downloaded pages into Arrow record batches, rows or, for
+    BigQuery Storage API DataFrame downloads, DataFrames."""
+
+    PANDAS_CONVERSION = "pandas_conversion"
+    """Converting Arrow data into a :class:`pandas.DataFrame`."""
+
+
+@dataclasses.dataclass
+class DownloadStats:
+    """Accumulated measurements for a download phase or stream."""
+
+    duration: float = 0.0
+    """Total wall-clock time, in seconds. Summed across threads."""
+
+    bytes: int = 0
+    """Total bytes received or produced."""
+
+    rows: int = 0
+    """Total number of rows processed."""
+
+    pages: int = 0
+    """Total number of pages (or record batches) processed."""
+
+
+class DownloadProfile:
+    """Opt-in per-phase timing breakdown of a result download.
+
+    Assign an instance to
+    :attr:`~google.cloud.bigquery.table.RowIterator.download_profile` (or
+    :attr:`~google.cloud.bigquery.dbapi.Cursor.download_profile`) before
+    downloading rows, then inspect :attr:`phases` and :attr:`streams`. The
+    same profile may be reused to accumulate several downloads.
+
+    Durations of phases which run in background threads, such as
+    :attr:`DownloadPhase.STREAM_READ`, are summed across threads and may
+    exceed the total wall-clock time of the download.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases: Dict[str, DownloadStats] = {}
+        """Mapping from :class:`DownloadPhase` name to its statistics."""
+
+        self.streams: Dict[str, DownloadStats] = {}
+        """Mapping from BigQuery Storage API stream name to its statistics."""
+
+    def record(
+        self,
+        phase: str,
+        duration: float = 0.0,
+        bytes: int = 0,
+        rows: int = 0,
+        pages: int = 0,
+        stream: Optional[str] = None,
+    ) -> None:
+        """Add measurements to ``phase`` (and ``stream``, if given).
+
+        This method is thread-safe.
+        """
+        with self._lock:
+            targets = [self.phases.setdefault(phase, DownloadStats())]
+            if stream is not None:
+                targets.append(self.streams.setdefault(stream, DownloadStats()))
+            for stats in targets:
+                stats.duration += duration
+                stats.bytes += bytes
+                stats.rows += rows
+                stats.pages += pages
+
+    @contextlib.contextmanager
+    def time(self, phase: str, stream: Optional[str] = None) -> Iterator[Dict]:
+        """Time the ``with`` block and record it under ``phase``.
+
+        Yields a dictionary in which the block may set ``bytes``, ``rows``
+        and ``pages`` counts to record alongside the duration.
+        """
+        counts: Dict[str, int] = {}
+        start = time.monotonic()
+        try:
+            yield counts
+        finally:
+            self.record(
+                phase, duration=time.monotonic() - start, stream=stream, **counts
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the recorded statistics as a JSON-serializable mapping."""
+        with self._lock:
+            return {
+                "phases": {
+                    name: dataclasses.asdict(stats)
+                    for name, stats in self.phases.items()
+                },
+                "streams": {
+                    name: dataclasses.asdict(stats)
+                    for name, stats in self.streams.items()
+                },
+            }
+
+    def __repr__(self):
+        return "DownloadProfile({!r})".format(self.to_dict())
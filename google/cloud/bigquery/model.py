@@ -18,7 +18,6 @@
 
 from __future__ import annotations  # type: ignore
 
-import copy
 import datetime
 import typing
 from typing import Any, Dict, Optional, Sequence, Union
@@ -324,7 +323,7 @@ class Model:
             Model parsed from ``resource``.
         """
         this = cls(None)
-        resource = copy.deepcopy(resource)
+        resource = _helpers._copy_resource(resource)
         this._properties = resource
         return this
 
@@ -341,7 +340,7 @@ class Model:
         Returns:
             Model reference represented as an API resource
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
 
 class ModelReference:
@@ -425,7 +424,7 @@ class ModelReference:
         Returns:
             Model reference represented as an API resource.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     def _key(self):
         """Unique key for this model.
@@ -500,7 +499,7 @@ class TransformColumn:
             Transform column feature parsed from ``resource``.
         """
         this = cls({})
-        resource = copy.deepcopy(resource)
+        resource = _helpers._copy_resource(resource)
         this._properties = resource
         return this
 
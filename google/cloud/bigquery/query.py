@@ -15,7 +15,6 @@
 """BigQuery query processing."""
 
 from collections import OrderedDict
-import copy
 import datetime
 import decimal
 from typing import Any, cast, Optional, Dict, Union
@@ -690,7 +689,7 @@ class ArrayQueryParameter(_AbstractQueryParameter):
             "parameterType": resource["parameterType"]["arrayType"]
         }
         for array_value in resource["parameterValue"]["arrayValues"]:
-            struct_resource = copy.deepcopy(resource_template)
+            struct_resource = _helpers._copy_resource(resource_template)
             struct_resource["parameterValue"] = array_value
             struct_value = StructQueryParameter.from_api_repr(struct_resource)
             converted.append(struct_value)
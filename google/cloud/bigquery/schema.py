@@ -15,7 +15,11 @@
 """Schemas for BigQuery tables / queries."""
 
 from __future__ import annotations
+import collections.abc
+import copy
 import enum
+import hashlib
+import json
 import typing
 from typing import Any, cast, Dict, Iterable, Optional, Union, Sequence
 
@@ -276,7 +280,8 @@ class SchemaField(object):
         Returns:
             google.cloud.bigquery.schema.SchemaField: The ``SchemaField`` object.
         """
-        placeholder = cls("this_will_be_replaced", "PLACEHOLDER")
+        # Skip __init__, which would build properties only to replace them.
+        placeholder = cls.__new__(cls)
 
         # The API would return a string despite we send an integer. To ensure
         # success of resending received schema, we convert string to integer
@@ -533,6 +538,9 @@ def _build_schema_resource(fields):
     Returns:
         Sequence[Dict]: Mappings describing the schema of the supplied fields.
     """
+    if isinstance(fields, FrozenSchema):
+        return fields.to_api_repr()
+
     if isinstance(fields, Sequence):
         # Input is a Sequence (e.g. a list): Process and return a list of SchemaFields
         return [field.to_api_repr() for field in fields]
@@ -577,6 +585,399 @@ def _to_schema_fields(schema):
         raise TypeError("Schema must be a Sequence (e.g. a list) or None.")
 
 
+def _resource_key(resource):
+    """Return the equality key of a field resource.
+
+    The key has the components of :meth:`SchemaField._key`, with the keys of
+    the subfields in place of the subfields, and is read straight from the
+    resource, without building fields.
+    """
+    get = resource.get
+    field_type = get("type")
+    if field_type is not None:
+        field_type = field_type.upper()
+        if field_type == "STRING" or field_type == "BYTES":
+            max_length = _helpers._int_or_none(get("maxLength"))
+            if max_length is not None:
+                field_type = f"{field_type}({max_length})"
+        elif field_type.endswith("NUMERIC"):
+            precision = _helpers._int_or_none(get("precision"))
+            if precision is not None:
+                scale = _helpers._int_or_none(get("scale"))
+                if scale is not None:
+                    field_type = f"{field_type}({precision}, {scale})"
+                else:
+                    field_type = f"{field_type}({precision})"
+
+    policy_tags = get("policyTags")
+    if policy_tags is not None:
+        policy_tags = tuple(sorted(policy_tags.get("names", ())))
+
+    # The API returns the precision as a string, SchemaField reads an int.
+    timestamp_precision = get("timestampPrecision")
+    try:
+        timestamp_precision = int(timestamp_precision)
+    except (TypeError, ValueError):
+        pass
+
+    return (
+        get("name", ""),
+        field_type,
+        (get("mode") or "NULLABLE").upper(),
+        get("defaultValueExpression"),
+        get("description"),
+        tuple(_resource_key(subfield) for subfield in get("fields", ())),
+        policy_tags,
+        timestamp_precision,
+    )
+
+
+class FrozenSchema(collections.abc.Sequence):
+    """An immutable table schema, cheap to compare, hash and load.
+
+    A frozen schema keeps the API representation of its fields and builds
+    :class:`SchemaField` objects lazily, the first time each one is used.
+    Comparing and hashing it reads the representation directly, without
+    building fields. It is hashed once, by its :attr:`fingerprint`, so it can
+    key caches, and two frozen schemas whose fingerprints are known compare
+    in constant time, however many fields they have.
+
+    A frozen schema is equal to another frozen schema, or to a sequence of
+    fields, if their fields are pairwise equal as :class:`SchemaField`
+    compares them.
+
+    The fields are built once and shared by all readers of the schema, so
+    callers must not change them. Changing them leaves the schema, its
+    equality and its fingerprint as they are, but other readers see the
+    changes.
+
+    Args:
+        fields (Sequence[Union[SchemaField, Mapping[str, Any]]]):
+            The fields of the schema. They are copied.
+    """
+
+    __slots__ = ("_resources", "_fields", "_keys", "_fingerprint", "_compiled")
+
+    def __init__(self, fields: Sequence[Union[SchemaField, Dict[str, Any]]] = ()):
+        self._set_resources(
+            [
+                copy.deepcopy(
+                    field.to_api_repr() if isinstance(field, SchemaField) else field
+                )
+                for field in fields
+            ]
+        )
+
+    def _set_resources(self, resources):
+        self._resources = tuple(resources)
+        self._fields: list = [None] * len(self._resources)
+        self._keys: Optional[tuple] = None
+        self._fingerprint: Optional[str] = None
+        self._compiled: Dict[Any, tuple] = {}
+
+    @classmethod
+    def from_api_repr(cls, resources: Sequence[Dict[str, Any]]) -> "FrozenSchema":
+        """Build a frozen schema from the API representation of its fields."""
+        return cls(resources)
+
+    @classmethod
+    def _from_owned_api_repr(cls, resources):
+        """Build a frozen schema from resources nothing else refers to, such
+        as freshly decoded JSON, without copying them."""
+        frozen = cls.__new__(cls)
+        frozen._set_resources(resources)
+        return frozen
+
+    def to_api_repr(self) -> typing.List[Dict[str, Any]]:
+        """Return a copy of the API representation of the fields."""
+        return copy.deepcopy(list(self._resources))
+
+    @property
+    def fingerprint(self) -> str:
+        """str: A stable digest of the schema, e.g. to key persistent caches.
+
+        Equal frozen schemas have the same fingerprint, in any process.
+        """
+        if self._fingerprint is None:
+            encoded = json.dumps(self._field_keys(), separators=(",", ":")).encode(
+                "utf-8"
+            )
+            self._fingerprint = hashlib.sha256(encoded).hexdigest()
+        return self._fingerprint
+
+    def _field_keys(self):
+        """The equality keys of the fields, read from the resources so that
+        changes to the built fields cannot affect them."""
+        if self._keys is None:
+            self._keys = tuple(_resource_key(resource) for resource in self._resources)
+        return self._keys
+
+    def compile(self, parser=None) -> tuple:
+        """Return the fields compiled for decoding rows with ``parser``.
+
+        Args:
+            parser (Optional[google.cloud.bigquery._helpers.CellDataParser]):
+                The parser of the rows, defaults to the parser of
+                :class:`~google.cloud.bigquery.table.Row` values.
+
+        Returns:
+            Tuple[google.cloud.bigquery._helpers.CompiledSchemaField, ...]:
+                The compiled fields, built once per parser.
+        """
+        if parser is None:
+            parser = _helpers.CELL_DATA_PARSER
+        compiled = self._compiled.get(parser)
+        if compiled is None:
+            compiled = self._compiled[parser] = parser.compile_schema(self)
+        return compiled
+
+    def _field(self, index):
+        field = self._fields[index]
+        if field is None:
+            # Build the field from a copy, so that changing it leaves the
+            # schema, its hash and its fingerprint as they are.
+            field = SchemaField.from_api_repr(copy.deepcopy(self._resources[index]))
+            self._fields[index] = field
+        return field
+
+    def __len__(self):
+        return len(self._resources)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._field(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("schema index out of range")
+        return self._field(index)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenSchema):
+            if self is other:
+                return True
+            if len(self) != len(other):
+                return False
+            # Compare digests once both are known, they are cheaper.
+            if self._fingerprint is not None and other._fingerprint is not None:
+                return self._fingerprint == other._fingerprint
+            return self._field_keys() == other._field_keys()
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return (
+                len(self) == len(other)
+                and all(isinstance(field, SchemaField) for field in other)
+                and self._field_keys()
+                == tuple(_resource_key(field._properties) for field in other)
+            )
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __repr__(self):
+        return (
+            f"FrozenSchema(<{len(self)} fields, fingerprint {self.fingerprint[:12]}>)"
+        )
+
+
+class SchemaDiff(object):
+    """Changes from the schema of an existing table to a new schema.
+
+    Returned by :func:`diff`. Fields are identified by their path: the names
+    of the field and of its parent ``RECORD`` fields, joined with ``"."``.
+
+    Attributes:
+        added (Tuple[str, ...]):
+            Fields of the new schema which the old schema lacks.
+        relaxed (Tuple[str, ...]):
+            Fields changed from ``REQUIRED`` to ``NULLABLE``.
+        incompatible (Dict[str, str]):
+            Fields whose change cannot be applied to an existing table,
+            mapped to the reason.
+    """
+
+    def __init__(self, added=(), relaxed=(), incompatible=None):
+        self.added = tuple(added)
+        self.relaxed = tuple(relaxed)
+        self.incompatible = dict(incompatible or {})
+
+    @property
+    def is_additive(self) -> bool:
+        """bool: Whether all changes can be applied to an existing table."""
+        return not self.incompatible
+
+    @property
+    def has_changes(self) -> bool:
+        """bool: Whether the table schema needs to change for the new schema."""
+        return bool(self.added or self.relaxed or self.incompatible)
+
+    def __eq__(self, other):
+        if not isinstance(other, SchemaDiff):
+            return NotImplemented
+        return (
+            self.added == other.added
+            and self.relaxed == other.relaxed
+            and self.incompatible == other.incompatible
+        )
+
+    def __repr__(self):
+        return (
+            f"SchemaDiff(added={self.added!r}, relaxed={self.relaxed!r}, "
+            f"incompatible={self.incompatible!r})"
+        )
+
+
+def _standard_type(field):
+    # Compare legacy and GoogleSQL spellings of a type as equal. Fields
+    # without a type, such as unknown DataFrame columns, match any type.
+    field_type = field._properties.get("type")
+    if field_type is None:
+        return None
+    field_type = field_type.upper()
+    return LEGACY_TO_STANDARD_TYPES.get(field_type, field_type)
+
+
+def _diff_fields(old_fields, new_fields, prefix, result):
+    old_by_name = {field.name.lower(): field for field in old_fields}
+
+    for new_field in new_fields:
+        path = prefix + new_field.name
+        old_field = old_by_name.get(new_field.name.lower())
+
+        if old_field is None:
+            if new_field.mode == "REQUIRED":
+                result.incompatible[path] = "cannot add a REQUIRED field"
+            else:
+                result.added += (path,)
+            continue
+
+        old_type = _standard_type(old_field)
+        new_type = _standard_type(new_field)
+        if old_type is not None and new_type is not None and old_type != new_type:
+            result.incompatible[
+                path
+            ] = f"type changed from {old_field.field_type} to {new_field.field_type}"
+            continue
+
+        if old_type == StandardSqlTypeNames.RANGE:
+            old_element = old_field.range_element_type
+            new_element = new_field.range_element_type
+            if (
+                old_element is not None
+                and new_element is not None
+                and old_element.element_type != new_element.element_type
+            ):
+                result.incompatible[path] = (
+                    f"range element type changed from {old_element.element_type} "
+                    f"to {new_element.element_type}"
+                )
+                continue
+
+        if old_field.mode != new_field.mode:
+            if old_field.mode == "REQUIRED" and new_field.mode == "NULLABLE":
+                result.relaxed += (path,)
+            else:
+                result.incompatible[
+                    path
+                ] = f"mode changed from {old_field.mode} to {new_field.mode}"
+                continue
+
+        if old_type == StandardSqlTypeNames.STRUCT:
+            _diff_fields(old_field.fields, new_field.fields, path + ".", result)
+
+
+def diff(
+    old: Sequence[Union[SchemaField, Dict[str, Any]]],
+    new: Sequence[Union[SchemaField, Dict[str, Any]]],
+) -> SchemaDiff:
+    """Compare the schema of an existing table with a new schema.
+
+    Fields are matched by name, ignoring case, as BigQuery does. Fields of
+    ``old`` which ``new`` lacks are not changes: rows written with the new
+    schema leave them ``NULL``. Types are compared by their GoogleSQL name,
+    e.g. ``INTEGER`` and ``INT64`` are the same type, and ``RANGE`` fields
+    by their element type, too.
+
+    Args:
+        old (Sequence[Union[SchemaField, Mapping[str, Any]]]):
+            The schema of the existing table.
+        new (Sequence[Union[SchemaField, Mapping[str, Any]]]):
+            The schema of the data to write, for example from
+            :func:`google.cloud.bigquery._pandas_helpers.dataframe_to_bq_schema`.
+
+    Returns:
+        google.cloud.bigquery.schema.SchemaDiff:
+            The added, relaxed and incompatible fields of ``new``, including
+            subfields of ``RECORD`` fields.
+    """
+    result = SchemaDiff()
+    _diff_fields(_to_schema_fields(old), _to_schema_fields(new), "", result)
+    return result
+
+
+def _evolve_fields(old_fields, new_fields):
+    """Apply the additive changes of ``new_fields`` to ``old_fields``.
+
+    Returns the API representation of the evolved fields: the fields of
+    ``old_fields`` in their order, relaxed and with added subfields, followed
+    by the fields only in ``new_fields``. Incompatible changes are ignored.
+    """
+    new_by_name = {field.name.lower(): field for field in new_fields}
+    old_names = set()
+    resources = []
+
+    for old_field in old_fields:
+        name = old_field.name.lower()
+        old_names.add(name)
+        # Copy, to_api_repr() returns the field's own resource.
+        resource = dict(old_field.to_api_repr())
+        new_field = new_by_name.get(name)
+
+        if new_field is not None:
+            if old_field.mode == "REQUIRED" and new_field.mode == "NULLABLE":
+                resource["mode"] = "NULLABLE"
+            if _standard_type(
+                old_field
+            ) == StandardSqlTypeNames.STRUCT and _standard_type(new_field) in (
+                StandardSqlTypeNames.STRUCT,
+                None,
+            ):
+                resource["fields"] = _evolve_fields(old_field.fields, new_field.fields)
+        resources.append(resource)
+
+    for new_field in new_fields:
+        if new_field.name.lower() not in old_names and new_field.mode != "REQUIRED":
+            resources.append(dict(new_field.to_api_repr()))
+
+    return resources
+
+
+def evolve(
+    old: Sequence[Union[SchemaField, Dict[str, Any]]],
+    new: Sequence[Union[SchemaField, Dict[str, Any]]],
+) -> typing.List[SchemaField]:
+    """Apply the additive changes from ``old`` to ``new``, see :func:`diff`.
+
+    Args:
+        old (Sequence[Union[SchemaField, Mapping[str, Any]]]):
+            The schema of the existing table.
+        new (Sequence[Union[SchemaField, Mapping[str, Any]]]):
+            The schema of the data to write.
+
+    Returns:
+        List[google.cloud.bigquery.schema.SchemaField]:
+            The fields of ``old``, with the added fields and subfields of
+            ``new`` appended and ``REQUIRED`` fields relaxed to ``NULLABLE``.
+            Incompatible changes are not applied.
+    """
+    resources = _evolve_fields(_to_schema_fields(old), _to_schema_fields(new))
+    return [SchemaField.from_api_repr(resource) for resource in resources]
+
+
 class PolicyTagList(object):
     """Define Policy Tags for a column.
 
@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import typing
 from typing import Any, Dict, Iterable, List, Optional
 
+from google.cloud.bigquery import _helpers
 from google.cloud.bigquery.enums import StandardSqlTypeNames
 
 
@@ -156,7 +156,7 @@ class StandardSqlDataType:
 
     def to_api_repr(self) -> Dict[str, Any]:
         """Construct the API resource representation of this SQL data type."""
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: Dict[str, Any]):
@@ -262,7 +262,7 @@ class StandardSqlField:
 
     def to_api_repr(self) -> Dict[str, Any]:
         """Construct the API resource representation of this SQL field."""
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: Dict[str, Any]):
@@ -313,7 +313,7 @@ class StandardSqlStructType:
 
     def to_api_repr(self) -> Dict[str, Any]:
         """Construct the API resource representation of this SQL struct type."""
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: Dict[str, Any]) -> "StandardSqlStructType":
@@ -362,7 +362,7 @@ class StandardSqlTableType:
 
     def to_api_repr(self) -> Dict[str, Any]:
         """Construct the API resource representation of this SQL table type."""
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     @classmethod
     def from_api_repr(cls, resource: Dict[str, Any]) -> "StandardSqlTableType":
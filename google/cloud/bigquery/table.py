@@ -20,49 +20,22 @@ import copy
 import datetime
 import functools
 import operator
+import time
 import typing
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Sequence
 
 import warnings
 
-try:
-    import pandas  # type: ignore
-except ImportError:
-    pandas = None
-
-try:
-    import pyarrow  # type: ignore
-except ImportError:
-    pyarrow = None
-
-try:
-    import db_dtypes  # type: ignore
-except ImportError:
-    db_dtypes = None
-
-try:
-    import geopandas  # type: ignore
-except ImportError:
-    geopandas = None
-finally:
-    _COORDINATE_REFERENCE_SYSTEM = "EPSG:4326"
-
-try:
-    import shapely  # type: ignore
-    from shapely import wkt  # type: ignore
-except ImportError:
-    shapely = None
-else:
-    _read_wkt = wkt.loads
-
 import google.api_core.exceptions
 from google.api_core.page_iterator import HTTPIterator
 
 import google.cloud._helpers  # type: ignore
 from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _lazy_imports
 from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery import _versions_helpers
 from google.cloud.bigquery import exceptions as bq_exceptions
+from google.cloud.bigquery import metrics
 from google.cloud.bigquery._tqdm_helpers import get_progress_bar
 from google.cloud.bigquery.encryption_configuration import EncryptionConfiguration
 from google.cloud.bigquery.enums import DefaultPandasDTypes
@@ -73,6 +46,15 @@ from google.cloud.bigquery.schema import _parse_schema_resource
 from google.cloud.bigquery.schema import _to_schema_fields
 from google.cloud.bigquery import external_config
 
+# Optional dependencies are imported on first use, see _lazy_imports.
+pandas = _lazy_imports.LazyModule("pandas", globals())
+pyarrow = _lazy_imports.LazyModule("pyarrow", globals())
+db_dtypes = _lazy_imports.LazyModule("db_dtypes", globals())
+geopandas = _lazy_imports.LazyModule("geopandas", globals())
+shapely = _lazy_imports.LazyModule("shapely", globals())
+
+_COORDINATE_REFERENCE_SYSTEM = "EPSG:4326"
+
 if typing.TYPE_CHECKING:  # pragma: NO COVER
     # Unconditionally import optional dependencies again to tell pytype that
     # they are not None, avoiding false "no attribute" errors.
@@ -321,7 +303,7 @@ class TableReference(_TableBase):
         Returns:
             Dict[str, object]: Table reference represented as an API resource
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     def to_bqstorage(self) -> str:
         """Construct a BigQuery Storage API representation of this table.
@@ -1251,7 +1233,7 @@ class Table(_TableBase):
         Returns:
             Dict[str, object]: Table represented as an API resource
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
     def to_bqstorage(self) -> str:
         """Construct a BigQuery Storage API representation of this table.
@@ -1503,7 +1485,7 @@ class TableListItem(_TableBase):
         Returns:
             Dict[str, object]: Table represented as an API resource
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
 
 def _row_from_mapping(mapping, schema):
@@ -1842,6 +1824,7 @@ class RowIterator(HTTPIterator):
         self._page_size = page_size
         self._preserve_order = False
         self._schema = schema
+        self._compiled_schemas: Dict[Any, tuple] = {}
         self._selected_fields = selected_fields
         self._table = table
         self._total_rows = total_rows
@@ -1857,6 +1840,27 @@ class RowIterator(HTTPIterator):
         self._job_created = created
         self._job_started = started
         self._job_ended = ended
+        self._download_profile: Optional[metrics.DownloadProfile] = None
+
+    @property
+    def download_profile(self) -> Optional[metrics.DownloadProfile]:
+        """Opt-in per-phase timing breakdown of row downloads.
+
+        If set, page requests, BigQuery Storage API reads and the
+        conversions performed by :meth:`to_arrow`, :meth:`to_dataframe` and
+        related methods are recorded in this profile. Defaults to ``None``.
+
+        .. code-block:: python
+
+            rows.download_profile = bigquery.metrics.DownloadProfile()
+            df = rows.to_dataframe()
+            print(rows.download_profile.to_dict())
+        """
+        return self._download_profile
+
+    @download_profile.setter
+    def download_profile(self, value: Optional[metrics.DownloadProfile]):
+        self._download_profile = value
 
     @property
     def _billing_project(self) -> Optional[str]:
@@ -2020,6 +2024,11 @@ class RowIterator(HTTPIterator):
                 response[self._next_token] = self._first_page_response[self._next_token]
 
             self._first_page_response = None
+            if self._download_profile is not None:
+                # Cached with the query response, so there's no wait to time.
+                self._download_profile.record(
+                    metrics.DownloadPhase.GET_PAGE, rows=len(rows), pages=1
+                )
             return response
 
         params = self._get_query_params()
@@ -2034,9 +2043,21 @@ class RowIterator(HTTPIterator):
             if self.page_number and "startIndex" in params:
                 del params_copy["startIndex"]
 
-        return self.api_request(
-            method=self._HTTP_METHOD, path=self.path, query_params=params_copy
-        )
+        profile = self._download_profile
+        if profile is None:
+            return self.api_request(
+                method=self._HTTP_METHOD, path=self.path, query_params=params_copy
+            )
+
+        with profile.time(metrics.DownloadPhase.GET_PAGE) as counts:
+            metrics._reset_response()
+            response = self.api_request(
+                method=self._HTTP_METHOD, path=self.path, query_params=params_copy
+            )
+            counts["bytes"] = metrics._get_response()[1] or 0
+            counts["rows"] = len(response.get(self._items_key, ()))
+            counts["pages"] = 1
+        return response
 
     @property
     def schema(self):
@@ -2044,6 +2065,14 @@ class RowIterator(HTTPIterator):
         columns to be read from the table."""
         return list(self._schema)
 
+    def _compiled_schema(self, parser):
+        """The schema, compiled once per iterator for ``parser``."""
+        compiled_schema = self._compiled_schemas.get(parser)
+        if compiled_schema is None:
+            compiled_schema = parser.compile_schema(self._schema)
+            self._compiled_schemas[parser] = compiled_schema
+        return compiled_schema
+
     @property
     def total_rows(self):
         """int: The total number of rows in the table or query results."""
@@ -2150,12 +2179,14 @@ class RowIterator(HTTPIterator):
             max_queue_size=max_queue_size,
             max_stream_count=max_stream_count,
             timeout=timeout,
+            download_profile=self._download_profile,
         )
         tabledata_list_download = functools.partial(
             _pandas_helpers.download_arrow_row_iterator,
             iter(self.pages),
             self.schema,
             timeout=timeout,
+            download_profile=self._download_profile,
         )
         return self._to_page_iterable(
             bqstorage_download,
@@ -2228,7 +2259,7 @@ class RowIterator(HTTPIterator):
 
         .. versionadded:: 1.17.0
         """
-        if pyarrow is None:
+        if not pyarrow:
             raise ValueError(_NO_PYARROW_ERROR)
 
         self._maybe_warn_max_results(bqstorage_client)
@@ -2363,6 +2394,7 @@ class RowIterator(HTTPIterator):
             max_queue_size=max_queue_size,
             max_stream_count=max_stream_count,
             timeout=timeout,
+            download_profile=self._download_profile,
         )
         tabledata_list_download = functools.partial(
             _pandas_helpers.download_dataframe_row_iterator,
@@ -2370,6 +2402,7 @@ class RowIterator(HTTPIterator):
             self.schema,
             dtypes,
             timeout=timeout,
+            download_profile=self._download_profile,
         )
         return self._to_page_iterable(
             bqstorage_download,
@@ -2621,7 +2654,7 @@ class RowIterator(HTTPIterator):
         """
         _pandas_helpers.verify_pandas_imports()
 
-        if geography_as_object and shapely is None:
+        if geography_as_object and not shapely:
             raise ValueError(_NO_SHAPELY_ERROR)
 
         if bool_dtype is DefaultPandasDTypes.BOOL_DTYPE:
@@ -2717,6 +2750,7 @@ class RowIterator(HTTPIterator):
             create_bqstorage_client=create_bqstorage_client,
             timeout=timeout,
         )
+        conversion_start = time.monotonic()
 
         # Default date dtype is `db_dtypes.DateDtype()` that could cause out of bounds error,
         # when pyarrow converts date values to nanosecond precision. To avoid the error, we
@@ -2766,10 +2800,18 @@ class RowIterator(HTTPIterator):
             df[column] = pandas.Series(df[column], dtype=dtypes[column], copy=False)
 
         if geography_as_object:
+            from shapely import wkt  # type: ignore
+
             for field in self.schema:
                 if field.field_type.upper() == "GEOGRAPHY" and field.mode != "REPEATED":
-                    df[field.name] = df[field.name].dropna().apply(_read_wkt)
+                    df[field.name] = df[field.name].dropna().apply(wkt.loads)
 
+        if self._download_profile is not None:
+            self._download_profile.record(
+                metrics.DownloadPhase.PANDAS_CONVERSION,
+                duration=time.monotonic() - conversion_start,
+                rows=len(df),
+            )
         return df
 
     @staticmethod
@@ -2890,7 +2932,7 @@ class RowIterator(HTTPIterator):
 
         .. versionadded:: 2.24.0
         """
-        if geopandas is None:
+        if not geopandas:
             raise ValueError(_NO_GEOPANDAS_ERROR)
 
         geography_columns = set(
@@ -2976,7 +3018,7 @@ class _EmptyRowIterator(RowIterator):
         Returns:
             pyarrow.Table: An empty :class:`pyarrow.Table`.
         """
-        if pyarrow is None:
+        if not pyarrow:
             raise ValueError(_NO_PYARROW_ERROR)
         return pyarrow.Table.from_arrays(())
 
@@ -3057,7 +3099,7 @@ class _EmptyRowIterator(RowIterator):
         Returns:
             pandas.DataFrame: An empty :class:`~pandas.DataFrame`.
         """
-        if geopandas is None:
+        if not geopandas:
             raise ValueError(_NO_GEOPANDAS_ERROR)
 
         # Since an empty GeoDataFrame has no geometry column, we do not CRS on it,
@@ -3768,7 +3810,7 @@ class BigLakeConfiguration(object):
         Returns:
             BigLakeConfiguration represented as an API resource.
         """
-        return copy.deepcopy(self._properties)
+        return _helpers._copy_resource(self._properties)
 
 
 def _item_to_row(iterator, resource):
@@ -3788,7 +3830,9 @@ def _item_to_row(iterator, resource):
         google.cloud.bigquery.table.Row: The next row in the page.
     """
     return Row(
-        _helpers._row_tuple_from_json(resource, iterator.schema),
+        _helpers._row_tuple_from_compiled(
+            resource, iterator._compiled_schema(_helpers.CELL_DATA_PARSER)
+        ),
         iterator._field_to_index,
     )
 
@@ -3825,7 +3869,9 @@ def _rows_page_start(iterator, page, response):
     """
     # Make a (lazy) copy of the page in column-oriented format for use in data
     # science packages.
-    page._columns = _row_iterator_page_columns(iterator._schema, response)
+    page._columns = _row_iterator_page_columns(
+        iterator._compiled_schema(_helpers.DATA_FRAME_CELL_DATA_PARSER), response
+    )
 
     total_rows = response.get("totalRows")
     # Don't reset total_rows if it's not present in the next API response.
@@ -32,13 +32,6 @@ def make_connection(*responses):
     return mock_conn
 
 
-def _to_pyarrow(value):
-    """Convert Python value to pyarrow value."""
-    import pyarrow
-
-    return pyarrow.array([value])[0]
-
-
 def make_client(project="PROJECT", **kw):
     credentials = mock.Mock(spec=google.auth.credentials.Credentials)
     return google.cloud.bigquery.client.Client(project, credentials, **kw)
@@ -1189,6 +1189,23 @@ class Test_JobConfig(unittest.TestCase):
         self.assertEqual(found, expected)
         self.assertIsNot(found, expected)  # copied
 
+    def test_deepcopy(self):
+        import copy
+
+        job_config = self._make_one()
+        job_config._properties = {self.JOB_TYPE: {"labels": {"foo": "bar"}}}
+        job_config._extra = ["baz"]
+        found = copy.deepcopy(job_config)
+        self.assertIsInstance(found, self._get_target_class())
+        self.assertEqual(found._job_type, self.JOB_TYPE)
+        self.assertEqual(found._properties, job_config._properties)
+        self.assertIsNot(
+            found._properties[self.JOB_TYPE]["labels"],
+            job_config._properties[self.JOB_TYPE]["labels"],
+        )
+        self.assertEqual(found._extra, ["baz"])
+        self.assertIsNot(found._extra, job_config._extra)
+
     # 'from_api_repr' cannot be tested on '_JobConfig', because it presumes
     # the ctor can be called w/o arguments
 
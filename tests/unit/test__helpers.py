@@ -320,20 +320,20 @@ class Test_rows_from_json(unittest.TestCase):
     def _call_fut(self, rows, schema):
         from google.cloud.bigquery._helpers import _rows_from_json
 
-        with _field_isinstance_patcher():
-            return _rows_from_json(rows, schema)
+        return _rows_from_json(rows, schema)
 
     def test_w_record_subfield(self):
+        from google.cloud.bigquery.schema import SchemaField
         from google.cloud.bigquery.table import Row
 
-        full_name = _Field("REQUIRED", "full_name", "STRING")
-        area_code = _Field("REQUIRED", "area_code", "STRING")
-        local_number = _Field("REQUIRED", "local_number", "STRING")
-        rank = _Field("REQUIRED", "rank", "INTEGER")
-        phone = _Field(
-            "NULLABLE", "phone", "RECORD", fields=[area_code, local_number, rank]
+        full_name = SchemaField("full_name", "STRING", "REQUIRED")
+        area_code = SchemaField("area_code", "STRING", "REQUIRED")
+        local_number = SchemaField("local_number", "STRING", "REQUIRED")
+        rank = SchemaField("rank", "INTEGER", "REQUIRED")
+        phone = SchemaField(
+            "phone", "RECORD", "NULLABLE", fields=[area_code, local_number, rank]
         )
-        color = _Field("REPEATED", "color", "STRING")
+        color = SchemaField("color", "STRING", "REPEATED")
         schema = [full_name, phone, color]
         rows = [
             {
@@ -364,13 +364,14 @@ class Test_rows_from_json(unittest.TestCase):
         self.assertEqual(coerced, expected)
 
     def test_w_int64_float64_bool(self):
+        from google.cloud.bigquery.schema import SchemaField
         from google.cloud.bigquery.table import Row
 
         # "Standard" SQL dialect uses 'INT64', 'FLOAT64', 'BOOL'.
-        candidate = _Field("REQUIRED", "candidate", "STRING")
-        votes = _Field("REQUIRED", "votes", "INT64")
-        percentage = _Field("REQUIRED", "percentage", "FLOAT64")
-        incumbent = _Field("REQUIRED", "incumbent", "BOOL")
+        candidate = SchemaField("candidate", "STRING", "REQUIRED")
+        votes = SchemaField("votes", "INT64", "REQUIRED")
+        percentage = SchemaField("percentage", "FLOAT64", "REQUIRED")
+        incumbent = SchemaField("incumbent", "BOOL", "REQUIRED")
         schema = [candidate, votes, percentage, incumbent]
         rows = [
             {"f": [{"v": "Phred Phlyntstone"}, {"v": 8}, {"v": 0.25}, {"v": "true"}]},
@@ -394,6 +395,163 @@ class Test_rows_from_json(unittest.TestCase):
         self.assertEqual(coerced, expected)
 
 
+class TestCompiledSchemaField(unittest.TestCase):
+    def _compile(self, schema, parser=None):
+        from google.cloud.bigquery import _helpers
+
+        parser = parser or _helpers.CELL_DATA_PARSER
+        return parser.compile_schema(schema)
+
+    def test_precomputes_attributes(self):
+        from google.cloud.bigquery import _helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema_field = SchemaField(
+            "person",
+            "record",
+            mode="repeated",
+            fields=[SchemaField("name", "string"), SchemaField("age", "int64")],
+        )
+
+        (field,) = self._compile([schema_field])
+
+        self.assertEqual(field.name, "person")
+        self.assertEqual(field.field_type, "RECORD")
+        self.assertEqual(field.mode, "REPEATED")
+        self.assertTrue(field.is_repeated)
+        self.assertIs(field.parser, _helpers.CELL_DATA_PARSER)
+        self.assertEqual([sub.name for sub in field.fields], ["name", "age"])
+        self.assertEqual(
+            field.fields[1].converter, _helpers.CELL_DATA_PARSER.int64_to_py
+        )
+        self.assertIsInstance(field.fields, tuple)
+        self.assertEqual(repr(field), repr(schema_field))
+
+    def test_is_immutable(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        (field,) = self._compile([SchemaField("x", "INTEGER")])
+
+        with self.assertRaises(AttributeError):
+            field.mode = "REPEATED"
+        with self.assertRaises(AttributeError):
+            del field.name
+        with self.assertRaises(AttributeError):
+            field.extra = 1
+
+    def test_to_py_nested(self):
+        from google.cloud.bigquery import _helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [
+            SchemaField(
+                "outer",
+                "RECORD",
+                mode="REPEATED",
+                fields=[
+                    SchemaField("ints", "INTEGER", mode="REPEATED"),
+                    SchemaField("payload", "JSON"),
+                ],
+            )
+        ]
+        row = {
+            "f": [
+                {
+                    "v": [
+                        {
+                            "v": {
+                                "f": [
+                                    {"v": [{"v": "1"}, {"v": "2"}]},
+                                    {"v": '{"a": 1}'},
+                                ]
+                            }
+                        },
+                    ]
+                }
+            ]
+        }
+
+        compiled = self._compile(schema)
+
+        self.assertEqual(
+            _helpers._row_tuple_from_compiled(row, compiled),
+            _helpers._row_tuple_from_json(row, schema),
+        )
+        self.assertEqual(
+            _helpers._row_tuple_from_compiled(row, compiled),
+            ([{"ints": [1, 2], "payload": {"a": 1}}],),
+        )
+        # Fields compiled for another parser use this parser's converters.
+        self.assertEqual(
+            _helpers.DATA_FRAME_CELL_DATA_PARSER.to_py(row["f"][0]["v"], compiled[0]),
+            [{"ints": [1, 2], "payload": '{"a": 1}'}],
+        )
+
+    def test_to_py_record(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema_field = SchemaField(
+            "rec",
+            "STRUCT",
+            fields=[
+                SchemaField("name", "STRING"),
+                SchemaField("tags", "STRING", mode="REPEATED"),
+                SchemaField("inner", "RECORD", fields=[SchemaField("x", "FLOAT")]),
+            ],
+        )
+        (field,) = self._compile([schema_field])
+        value = {
+            "f": [
+                {"v": "a"},
+                {"v": [{"v": "t1"}, {"v": "t2"}]},
+                {"v": None},
+            ]
+        }
+
+        self.assertEqual(
+            field.to_py(value), {"name": "a", "tags": ["t1", "t2"], "inner": None}
+        )
+        self.assertIsNone(field.to_py(None))
+
+    def test_to_py_required_record_none(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema_field = SchemaField(
+            "rec", "RECORD", mode="REQUIRED", fields=[SchemaField("x", "INTEGER")]
+        )
+        (field,) = self._compile([schema_field])
+
+        with self.assertRaises(TypeError):
+            field.to_py(None)
+
+    def test_to_py_record_overridden_by_parser(self):
+        from google.cloud.bigquery import _helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        class _Parser(_helpers.CellDataParser):
+            def record_to_py(self, value, field):
+                return "overridden"
+
+        parser = _Parser()
+        schema_field = SchemaField("rec", "RECORD", fields=[SchemaField("x", "INT64")])
+        (field,) = self._compile([schema_field], parser=parser)
+
+        self.assertEqual(field.converter, parser.record_to_py)
+        self.assertEqual(field.to_py({"f": [{"v": "1"}]}), "overridden")
+
+    def test_to_py_unknown_type_warns(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        (field,) = self._compile([SchemaField("x", "UNKNOWN_TYPE")])
+
+        with warnings.catch_warnings(record=True) as warned:
+            warnings.simplefilter("always")
+            self.assertEqual(field.to_py("raw"), "raw")
+
+        self.assertEqual(len(warned), 1)
+        self.assertIn("UNKNOWN_TYPE", str(warned[0].message))
+
+
 class Test_int_to_json(unittest.TestCase):
     def _call_fut(self, value):
         from google.cloud.bigquery._helpers import _int_to_json
@@ -991,6 +1149,35 @@ class Test_snake_to_camel_case(unittest.TestCase):
         self.assertEqual(self._call_fut("friendlyName"), "friendlyName")
 
 
+class Test__copy_resource(unittest.TestCase):
+    def _call_fut(self, resource):
+        from google.cloud.bigquery._helpers import _copy_resource
+
+        return _copy_resource(resource)
+
+    def test_w_nested_resource(self):
+        resource = {
+            "tableReference": {"projectId": "p", "datasetId": "d", "tableId": "t"},
+            "labels": {"a": "b"},
+            "schema": {"fields": [{"name": "x", "type": "INTEGER", "fields": []}]},
+            "numRows": 10,
+            "expirationTime": None,
+        }
+        found = self._call_fut(resource)
+        self.assertEqual(found, resource)
+        self.assertIsNot(found, resource)
+        self.assertIsNot(found["labels"], resource["labels"])
+        self.assertIsNot(found["schema"]["fields"], resource["schema"]["fields"])
+        self.assertIsNot(found["schema"]["fields"][0], resource["schema"]["fields"][0])
+
+    def test_w_other_values_uses_deepcopy(self):
+        value = decimal.Decimal("1.5")
+        resource = {"values": (value, [1])}
+        found = self._call_fut(resource)
+        self.assertEqual(found, resource)
+        self.assertIsNot(found["values"][1], resource["values"][1])
+
+
 class Test__get_sub_prop(unittest.TestCase):
     def _call_fut(self, container, keys, **kw):
         from google.cloud.bigquery._helpers import _get_sub_prop
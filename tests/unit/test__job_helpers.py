@@ -1192,3 +1192,42 @@ def test_wait_or_cancel_exception_raises_original_exception():
         timeout=123,
         retry=retry,
     )
+
+
+def test_query_estimate_cache_key_covers_config():
+    config = job_query.QueryJobConfig(
+        query_parameters=[ScalarQueryParameter("x", "INT64", 1)]
+    )
+    key = _job_helpers.query_estimate_cache_key("SELECT @x", config, "p", "US")
+
+    assert key == _job_helpers.query_estimate_cache_key(
+        "SELECT @x",
+        job_query.QueryJobConfig.from_api_repr(config.to_api_repr()),
+        "p",
+        "US",
+    )
+    assert key != _job_helpers.query_estimate_cache_key("SELECT @x", config, "p", "EU")
+    config.query_parameters = [ScalarQueryParameter("x", "INT64", 2)]
+    assert key != _job_helpers.query_estimate_cache_key("SELECT @x", config, "p", "US")
+
+
+def test_query_estimate_cache_evicts_least_recently_used():
+    cache = _job_helpers.QueryEstimateCache(max_size=2)
+    jobs = [mock.create_autospec(job_query.QueryJob, instance=True) for _ in range(3)]
+    as_of = mock.sentinel.as_of
+
+    cache.put("a", jobs[0], as_of)
+    cache.put("b", jobs[1], as_of)
+    assert cache.get("a") == (jobs[0], as_of)
+    cache.put("c", jobs[2], as_of)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == (jobs[0], as_of)
+    assert cache.get("c") == (jobs[2], as_of)
+
+    cache.discard("a")
+    cache.discard("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,107 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from google.cloud.bigquery import _lazy_imports
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    namespace = {}
+    lazy = _lazy_imports.LazyModule("json", namespace)
+    namespace["json"] = lazy
+
+    assert lazy.dumps is json.dumps
+    assert namespace["json"] is json
+    assert bool(lazy)
+    assert _lazy_imports.import_error(lazy) is None
+
+
+def test_lazy_module_w_attr_and_loader():
+    namespace = {}
+    loader = mock.Mock(return_value=json)
+    lazy = _lazy_imports.LazyModule(
+        "some.module", namespace, attr="alias", loader=loader
+    )
+    namespace["alias"] = lazy
+
+    assert lazy
+    assert lazy.loads is json.loads
+    loader.assert_called_once_with()
+    assert namespace["alias"] is json
+
+
+def test_lazy_module_does_not_replace_patched_binding():
+    lazy = _lazy_imports.LazyModule("json", {})
+    namespace = {"json": None}
+    lazy._namespace = namespace
+
+    assert lazy.dumps is json.dumps
+    assert namespace["json"] is None
+
+
+def test_lazy_module_missing():
+    namespace = {}
+    lazy = _lazy_imports.LazyModule("not_a_real_module_for_tests", namespace)
+    namespace["not_a_real_module_for_tests"] = lazy
+
+    assert not lazy
+    assert namespace["not_a_real_module_for_tests"] is lazy
+    assert isinstance(_lazy_imports.import_error(lazy), ImportError)
+    with pytest.raises(AttributeError, match="not_a_real_module_for_tests"):
+        lazy.anything
+
+
+def test_lazy_module_loader_returns_none():
+    lazy = _lazy_imports.LazyModule("json", {}, loader=lambda: None)
+
+    assert not lazy
+    assert _lazy_imports.import_error(lazy) is None
+
+
+def test_import_error_wo_lazy_module():
+    assert _lazy_imports.import_error(None) is None
+    assert _lazy_imports.import_error(json) is None
+
+
+def test_repr():
+    assert repr(_lazy_imports.LazyModule("pandas", {})) == "<LazyModule 'pandas'>"
+
+
+def test_import_bigquery_does_not_import_heavy_dependencies():
+    heavy = (
+        "pandas",
+        "pyarrow",
+        "db_dtypes",
+        "google.cloud.bigquery_storage_v1",
+        "tqdm.notebook",
+        "IPython",
+    )
+    code = (
+        "import json, sys\n"
+        "import google.cloud.bigquery\n"
+        "import google.cloud.bigquery.dbapi\n"
+        f"print(json.dumps([name for name in {heavy!r} if name in sys.modules]))\n"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert json.loads(output) == []
@@ -85,6 +85,8 @@ skip_if_no_bignumeric = pytest.mark.skipif(
 def module_under_test():
     from google.cloud.bigquery import _pandas_helpers
 
+    # Tests infer the schema of equally shaped frames under different patches.
+    _pandas_helpers._SCHEMA_INFERENCE_CACHE.clear()
     return _pandas_helpers
 
 
@@ -1506,6 +1508,169 @@ def test_dataframe_to_bq_schema_geography(module_under_test, monkeypatch):
     )
 
 
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_dataframe_to_bq_schema_caches_by_shape(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "pandas_gbq", None)
+    get_schema = mock.Mock(wraps=module_under_test._get_schema_by_pyarrow)
+    monkeypatch.setattr(module_under_test, "_get_schema_by_pyarrow", get_schema)
+
+    def make_frame(values):
+        return pandas.DataFrame(
+            {"id": [1, 2], "payload": pandas.Series(values, dtype=object)}
+        )
+
+    def to_bq_schema(values):
+        return module_under_test.dataframe_to_bq_schema(
+            make_frame(values), [], use_cache=True
+        )
+
+    with pytest.warns(FutureWarning):
+        first = to_bq_schema(["a", "b"])
+        first[0]._properties["mode"] = "REQUIRED"
+        second = to_bq_schema(["c", "d"])
+        # Another type of values in the object column is another shape.
+        third = to_bq_schema([[1.5], [2.5]])
+
+    assert second == (
+        schema.SchemaField("id", "INTEGER"),
+        schema.SchemaField("payload", "STRING"),
+    )
+    assert third[1] == schema.SchemaField("payload", "FLOAT64", mode="REPEATED")
+    assert get_schema.call_count == 2
+    assert len(module_under_test._SCHEMA_INFERENCE_CACHE) == 2
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_dataframe_to_bq_schema_not_cached_by_default(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "pandas_gbq", None)
+    dataframe = pandas.DataFrame({"id": [1, 2]})
+
+    with pytest.warns(FutureWarning):
+        module_under_test.dataframe_to_bq_schema(dataframe, [])
+
+    assert len(module_under_test._SCHEMA_INFERENCE_CACHE) == 0
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+@pytest.mark.parametrize(
+    ("first_values", "second_values", "expected"),
+    [
+        ([1, 2], [1, 2.5], schema.SchemaField("payload", "FLOAT64")),
+        (
+            [{"a": 1}, {"a": 2}],
+            [{"b": "x"}, {"b": "y"}],
+            schema.SchemaField(
+                "payload", "RECORD", fields=[schema.SchemaField("b", "STRING")]
+            ),
+        ),
+        (
+            [[1], [2]],
+            [[1], [2.5]],
+            schema.SchemaField("payload", "FLOAT64", mode="REPEATED"),
+        ),
+    ],
+)
+def test_dataframe_to_bq_schema_cache_keys_object_value_structure(
+    module_under_test, monkeypatch, first_values, second_values, expected
+):
+    monkeypatch.setattr(module_under_test, "pandas_gbq", None)
+    monkeypatch.setattr(
+        module_under_test,
+        "_get_schema_by_pyarrow",
+        mock.Mock(
+            side_effect=lambda name, series, sample_size: (
+                expected
+                if list(series) == second_values
+                else schema.SchemaField(name, "INTEGER")
+            )
+        ),
+    )
+
+    def to_bq_schema(values):
+        dataframe = pandas.DataFrame({"payload": pandas.Series(values, dtype=object)})
+        return module_under_test.dataframe_to_bq_schema(dataframe, [], use_cache=True)
+
+    with pytest.warns(FutureWarning):
+        to_bq_schema(first_values)
+        second = to_bq_schema(second_values)
+
+    assert second == (expected,)
+    assert len(module_under_test._SCHEMA_INFERENCE_CACHE) == 2
+
+
+def test_schema_inference_key_object_structures(module_under_test):
+    pandas = pytest.importorskip("pandas")
+
+    def key(values):
+        dataframe = pandas.DataFrame({"payload": pandas.Series(values, dtype=object)})
+        return module_under_test._schema_inference_key(dataframe, [], None)
+
+    assert key([1, 2]) == key([3, None, 4])
+    assert key([1, 2]) != key([1, 2.5])
+    assert key([{"a": 1}]) != key([{"b": "x"}])
+    assert key([{"a": 1}]) != key([{"a": "x"}])
+    assert key([decimal.Decimal("1.5")]) != key([decimal.Decimal("1.1234567891")])
+    assert key([None, None, 1]) != key([None, None, 1.5])
+    # Only the first non-null values are read.
+    sample_size = module_under_test._SCHEMA_KEY_SAMPLE_SIZE
+    assert key([None] + [1] * sample_size + [2.5]) == key([1] * sample_size + ["x"])
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_dataframe_to_bq_schema_w_sample_size(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "pandas_gbq", None)
+    array = mock.Mock(wraps=pyarrow.array)
+    monkeypatch.setattr(pyarrow, "array", array)
+    dataframe = pandas.DataFrame(
+        {
+            "numbers": pandas.Series([decimal.Decimal("1.5")] * 100, dtype=object),
+            "late": pandas.Series([None] * 10 + [[True]] * 90, dtype=object),
+        }
+    )
+
+    with pytest.warns(FutureWarning):
+        detected = module_under_test.dataframe_to_bq_schema(
+            dataframe, [], sample_size=10
+        )
+
+    assert detected == (
+        schema.SchemaField("numbers", "NUMERIC"),
+        schema.SchemaField("late", "BOOL", mode="REPEATED"),
+    )
+    # The all-null sample of "late" falls back to converting the column.
+    # Shorter conversions are pandas internals.
+    lengths = [len(call.args[0]) for call in array.call_args_list]
+    assert [length for length in lengths if length >= 10] == [10, 10, 100]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+def test_dataframe_to_bq_schema_duplicate_columns_not_cached(module_under_test):
+    dataframe = pandas.DataFrame([[1, 2]], columns=["a", "a"])
+
+    key = module_under_test._schema_inference_key(dataframe, [], None)
+
+    assert key is None
+
+
+def test_schema_inference_cache_evicts_least_recently_used(module_under_test):
+    cache = module_under_test.SchemaInferenceCache(max_size=2)
+    cache.put(("a",), [schema.SchemaField("a", "STRING")])
+    cache.put(("b",), [schema.SchemaField("b", "STRING")])
+    assert cache.get(("a",)) == (schema.SchemaField("a", "STRING"),)
+
+    cache.put(("c",), [schema.SchemaField("c", "STRING")])
+
+    assert len(cache) == 2
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    cache.clear()
+    assert len(cache) == 0
+
+
 @pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
 def test__first_array_valid_no_valid_items(module_under_test):
     series = pandas.Series([None, pandas.NA, float("NaN")])
@@ -1787,6 +1952,89 @@ def test__download_table_bqstorage_stream_omits_read_session(
     reader.rows.assert_called_once_with()
 
 
+@pytest.mark.skipif(
+    bigquery_storage is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test__download_table_bqstorage_stream_w_download_profile(module_under_test):
+    import google.cloud.bigquery_storage_v1.reader
+    import google.cloud.bigquery_storage_v1.types
+    from google.cloud.bigquery import metrics
+
+    bqstorage_client = mock.create_autospec(
+        bigquery_storage.BigQueryReadClient, instance=True
+    )
+    reader = mock.create_autospec(
+        google.cloud.bigquery_storage_v1.reader.ReadRowsStream, instance=True
+    )
+    bqstorage_client.read_rows.return_value = reader
+    reader.rows.return_value.pages = [
+        mock.Mock(num_items=3),
+        mock.Mock(num_items=4),
+    ]
+    page_to_item = mock.Mock(return_value=mock.Mock(nbytes=64))
+    profile = metrics.DownloadProfile()
+    worker_queue = queue.Queue()
+
+    module_under_test._download_table_bqstorage_stream(
+        module_under_test._DownloadState(profile),
+        bqstorage_client,
+        google.cloud.bigquery_storage_v1.types.ReadSession(),
+        google.cloud.bigquery_storage_v1.types.ReadStream(name="streams/s0"),
+        worker_queue,
+        page_to_item,
+    )
+
+    assert worker_queue.qsize() == 2
+    read = profile.phases[metrics.DownloadPhase.STREAM_READ]
+    assert read.rows == 7
+    assert read.pages == 2
+    assert profile.phases[metrics.DownloadPhase.ARROW_DECODE].bytes == 128
+    assert profile.streams["streams/s0"].rows == 7
+
+
+@pytest.mark.skipif(
+    bigquery_storage is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test__download_table_bqstorage_w_download_profile(module_under_test):
+    from google.cloud.bigquery import dataset
+    from google.cloud.bigquery import metrics
+    from google.cloud.bigquery import table
+
+    bqstorage_client = mock.create_autospec(
+        bigquery_storage.BigQueryReadClient, instance=True
+    )
+    fake_session = mock.Mock(streams=["stream/s0"])
+    bqstorage_client.create_read_session.return_value = fake_session
+    table_ref = table.TableReference(
+        dataset.DatasetReference("project-x", "dataset-y"),
+        "table-z",
+    )
+    profile = metrics.DownloadProfile()
+    download_state = module_under_test._DownloadState()
+
+    def fake_download_stream(
+        download_state, bqstorage_client, session, stream, worker_queue, page_to_item
+    ):
+        assert download_state.profile is profile
+        worker_queue.put("result_page")
+
+    with mock.patch.object(
+        module_under_test, "_download_table_bqstorage_stream", new=fake_download_stream
+    ):
+        results = list(
+            module_under_test._download_table_bqstorage(
+                "some-project",
+                table_ref,
+                bqstorage_client,
+                download_state=download_state,
+                download_profile=profile,
+            )
+        )
+
+    assert results == ["result_page"]
+    assert metrics.DownloadPhase.CREATE_READ_SESSION in profile.phases
+
+
 @pytest.mark.parametrize(
     "stream_count,maxsize_kwarg,expected_call_count,expected_maxsize",
     [
@@ -1977,6 +2225,32 @@ def test_download_arrow_row_iterator_unknown_field_type(module_under_test):
     assert col.to_pylist() == [2.2, 22.22, 222.222]
 
 
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_download_arrow_row_iterator_w_download_profile(module_under_test):
+    from google.cloud.bigquery import metrics
+
+    fake_page = api_core.page_iterator.Page(
+        parent=mock.Mock(),
+        items=[{"page_data": "foo"}],
+        item_to_value=api_core.page_iterator._item_to_value_identity,
+    )
+    fake_page._columns = [[1, 10, 100]]
+    bq_schema = [schema.SchemaField("population_size", "INTEGER")]
+    profile = metrics.DownloadProfile()
+
+    results = list(
+        module_under_test.download_arrow_row_iterator(
+            [fake_page, fake_page], bq_schema, download_profile=profile
+        )
+    )
+
+    stats = profile.phases[metrics.DownloadPhase.ARROW_DECODE]
+    assert stats.pages == 2
+    assert stats.rows == 6
+    assert stats.bytes == sum(batch.nbytes for batch in results)
+    assert stats.duration >= 0
+
+
 @pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
 def test_download_arrow_row_iterator_known_field_type(module_under_test):
     fake_page = api_core.page_iterator.Page(
@@ -2012,6 +2286,85 @@ def test_download_arrow_row_iterator_known_field_type(module_under_test):
     assert col.to_pylist() == ["2.2", "22.22", "222.222"]
 
 
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_download_arrow_row_iterator_nested_from_raw_page(module_under_test):
+    from google.cloud.bigquery import table
+
+    bq_schema = [
+        schema.SchemaField("id", "INTEGER"),
+        schema.SchemaField("nums", "INTEGER", mode="REPEATED"),
+        schema.SchemaField(
+            "orders",
+            "RECORD",
+            mode="REPEATED",
+            fields=[
+                schema.SchemaField("name", "STRING"),
+                schema.SchemaField("tags", "STRING", mode="REPEATED"),
+                schema.SchemaField(
+                    "attrs", "RECORD", fields=[schema.SchemaField("k", "INTEGER")]
+                ),
+                schema.SchemaField(
+                    "items",
+                    "RECORD",
+                    mode="REPEATED",
+                    fields=[schema.SchemaField("price", "NUMERIC")],
+                ),
+            ],
+        ),
+        schema.SchemaField(
+            "extra", "STRUCT", fields=[schema.SchemaField("ts", "TIMESTAMP")]
+        ),
+    ]
+    order = {
+        "f": [
+            {"v": "a"},
+            {"v": [{"v": "x"}, {"v": "y"}]},
+            {"v": {"f": [{"v": "7"}]}},
+            {"v": [{"v": {"f": [{"v": "1.50"}]}}, {"v": {"f": [{"v": None}]}}]},
+        ]
+    }
+    empty_order = {"f": [{"v": None}, {"v": []}, {"v": None}, {"v": []}]}
+    response = {
+        "rows": [
+            {
+                "f": [
+                    {"v": "1"},
+                    {"v": [{"v": "1"}, {"v": "2"}]},
+                    {"v": [{"v": order}, {"v": empty_order}]},
+                    {"v": {"f": [{"v": "1700000000000000"}]}},
+                ]
+            },
+            {"f": [{"v": None}, {"v": []}, {"v": []}, {"v": None}]},
+        ]
+    }
+
+    def make_page(raw_page):
+        page = api_core.page_iterator.Page(
+            parent=mock.Mock(),
+            items=response["rows"],
+            item_to_value=api_core.page_iterator._item_to_value_identity,
+            raw_page=raw_page,
+        )
+        page._columns = table._row_iterator_page_columns(bq_schema, response)
+        return page
+
+    (nested,) = module_under_test.download_arrow_row_iterator(
+        [make_page(response)], bq_schema
+    )
+    (row_wise,) = module_under_test.download_arrow_row_iterator(
+        [make_page(None)], bq_schema
+    )
+
+    assert nested.equals(row_wise)
+    assert nested.column(2).to_pylist()[0][1] == {
+        "name": None,
+        "tags": [],
+        "attrs": None,
+        "items": [],
+    }
+    assert nested.column(3).null_count == 1
+
+
 @pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
 def test_download_arrow_row_iterator_dict_sequence_schema(module_under_test):
     fake_page = api_core.page_iterator.Page(
@@ -246,3 +246,16 @@ def test_installed_pandas_version_returns_parsed_version():
     assert version.major == 1
     assert version.minor == 1
     assert version.micro == 0
+
+
+def test_supports_range_pyarrow_is_computed_on_first_access():
+    with mock.patch.dict(_versions_helpers.__dict__):
+        _versions_helpers.__dict__.pop("SUPPORTS_RANGE_PYARROW", None)
+        supports_range = _versions_helpers.SUPPORTS_RANGE_PYARROW
+        assert supports_range is (supports_range and pandas is not None)
+        assert "SUPPORTS_RANGE_PYARROW" in _versions_helpers.__dict__
+
+
+def test_module_getattr_unknown_attribute():
+    with pytest.raises(AttributeError, match="NOT_A_CONSTANT"):
+        _versions_helpers.NOT_A_CONSTANT
@@ -0,0 +1,186 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import google.api_core.exceptions
+import pytest
+
+from google.cloud.bigquery import bulk
+from google.cloud.bigquery.routine import Routine
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import Table, TableReference
+
+TABLE_ID = "my-project.my_dataset.my_table"
+
+
+def _existing_table(**properties):
+    resource = {
+        "tableReference": {
+            "projectId": "my-project",
+            "datasetId": "my_dataset",
+            "tableId": "my_table",
+        },
+        "etag": "etag-1",
+        "schema": {"fields": [{"name": "id", "type": "INTEGER", "mode": "REQUIRED"}]},
+        "timePartitioning": {"type": "DAY", "field": None},
+    }
+    resource.update(properties)
+    return Table.from_api_repr(resource)
+
+
+def test_table_changes_unchanged():
+    definition = Table(TABLE_ID, schema=[SchemaField("id", "INT64", "REQUIRED")])
+
+    fields, _ = bulk._table_changes(definition, _existing_table())
+
+    assert fields == []
+
+
+def test_table_changes_ignores_unset_keys():
+    from google.cloud.bigquery.table import TimePartitioning
+
+    definition = Table(TABLE_ID)
+    definition.time_partitioning = TimePartitioning(type_="DAY")
+
+    fields, _ = bulk._table_changes(
+        definition, _existing_table(timePartitioning={"type": "DAY"})
+    )
+
+    assert fields == []
+
+
+def test_table_changes_w_changes():
+    definition = Table(
+        TABLE_ID,
+        schema=[
+            SchemaField("id", "INTEGER", "NULLABLE"),
+            SchemaField("name", "STRING"),
+        ],
+    )
+    definition.description = "new"
+    definition.labels = {"team": "b"}
+
+    fields, patch = bulk._table_changes(
+        definition, _existing_table(labels={"team": "a", "old": "x"})
+    )
+
+    assert fields == ["description", "labels", "schema"]
+    assert patch.etag == "etag-1"
+    assert patch.description == "new"
+    assert patch.labels == {"old": None, "team": "b"}
+    assert [(f.name, f.mode) for f in patch.schema] == [
+        ("id", "NULLABLE"),
+        ("name", "NULLABLE"),
+    ]
+
+
+def test_table_changes_w_view_query():
+    definition = Table(TABLE_ID)
+    definition.view_query = "SELECT 2"
+    existing = _existing_table(view={"query": "SELECT 1", "useLegacySql": False})
+
+    fields, patch = bulk._table_changes(definition, existing)
+
+    assert fields == ["view_query"]
+    assert patch.view_query == "SELECT 2"
+
+
+def test_table_changes_w_incompatible_schema():
+    definition = Table(TABLE_ID, schema=[SchemaField("id", "STRING")])
+
+    with pytest.raises(ValueError, match="id: type changed"):
+        bulk._table_changes(definition, _existing_table())
+
+
+def test_routine_changes():
+    resource = {
+        "routineReference": {
+            "projectId": "my-project",
+            "datasetId": "my_dataset",
+            "routineId": "my_routine",
+        },
+        "etag": "etag-1",
+        "routineType": "SCALAR_FUNCTION",
+        "language": "SQL",
+        "definitionBody": "x * 2",
+    }
+    existing = Routine.from_api_repr(resource)
+    definition = Routine(
+        "my-project.my_dataset.my_routine",
+        type_="SCALAR_FUNCTION",
+        body="x * 3",
+    )
+
+    fields, update_fields, patch = bulk._routine_changes(definition, existing)
+
+    assert fields == ["body"]
+    assert update_fields == ["body", "language", "type_"]
+    assert patch.etag == "etag-1"
+    assert patch.body == "x * 3"
+
+
+def test_routine_changes_keeps_unset_properties():
+    resource = {
+        "routineReference": {
+            "projectId": "my-project",
+            "datasetId": "my_dataset",
+            "routineId": "my_routine",
+        },
+        "etag": "etag-1",
+        "routineType": "SCALAR_FUNCTION",
+        "language": "SQL",
+        "definitionBody": "x * 2",
+        "description": "keep me",
+        "arguments": [{"name": "x", "dataType": {"typeKind": "INT64"}}],
+    }
+    existing = Routine.from_api_repr(resource)
+    definition = Routine(
+        "my-project.my_dataset.my_routine",
+        type_="SCALAR_FUNCTION",
+        language="SQL",
+        body="x * 3",
+    )
+
+    fields, update_fields, patch = bulk._routine_changes(definition, existing)
+    sent = patch._build_resource(update_fields)
+
+    assert fields == ["body"]
+    assert sent == {
+        "arguments": [{"name": "x", "dataType": {"typeKind": "INT64"}}],
+        "definitionBody": "x * 3",
+        "description": "keep me",
+        "language": "SQL",
+        "routineType": "SCALAR_FUNCTION",
+    }
+
+
+def test_report():
+    ref = TableReference.from_string(TABLE_ID)
+    error = google.api_core.exceptions.Forbidden("denied")
+    report = bulk.BulkReport(
+        [
+            bulk.BulkResult(ref, bulk.BulkAction.CREATE),
+            bulk.BulkResult(ref, bulk.BulkAction.UPDATE, ("description",)),
+            bulk.BulkResult(ref, bulk.BulkAction.UPDATE, error=error),
+            bulk.BulkResult(ref, bulk.BulkAction.UNCHANGED),
+            bulk.BulkResult(ref, bulk.BulkAction.DELETE),
+        ]
+    )
+
+    assert [r.action for r in report.created] == [bulk.BulkAction.CREATE]
+    assert [r.fields for r in report.updated] == [("description",)]
+    assert len(report.unchanged) == 1
+    assert len(report.deleted) == 1
+    assert [r.error for r in report.errors] == [error]
+    assert not report.ok
+    assert bulk.BulkReport([]).ok
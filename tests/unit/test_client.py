@@ -23,6 +23,7 @@ import itertools
 import json
 import operator
 import os
+import threading
 import unittest
 from unittest import mock
 import warnings
@@ -331,6 +332,69 @@ class TestClient(unittest.TestCase):
 
             final_attributes.assert_not_called()
 
+    def test__call_api_w_metrics_hook(self):
+        from concurrent.futures import TimeoutError
+        from google.cloud.bigquery import metrics
+        from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+        creds = _make_credentials()
+        hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds, metrics_hook=hook
+        )
+
+        api_request_patcher = mock.patch.object(
+            client._connection,
+            "api_request",
+            side_effect=[TimeoutError, "result"],
+        )
+        retry = DEFAULT_RETRY.with_deadline(1).with_predicate(
+            lambda exc: isinstance(exc, TimeoutError)
+        )
+
+        with api_request_patcher:
+            result = client._call_api(
+                retry,
+                span_name="BigQuery.getTable",
+                method="GET",
+                path="/projects/p/datasets/d/tables/t",
+            )
+
+        assert result == "result"
+        first, second = [c.args[0] for c in hook.on_request.call_args_list]
+        assert first.operation == "BigQuery.getTable"
+        assert first.method == "GET"
+        assert first.path_template == (
+            "/projects/{project}/datasets/{dataset}/tables/{table}"
+        )
+        assert first.attempt == 1
+        assert first.error_reason == "TimeoutError"
+        assert second.attempt == 2
+        assert second.retry_reason == "TimeoutError"
+        assert second.error_reason is None
+
+    def test__call_api_w_metrics_hook_records_http_response(self):
+        from google.cloud.bigquery import metrics
+
+        http = mock.create_autospec(requests.Session, instance=True)
+        http.is_mtls = False
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"kind": "bigquery#job"}'
+        http.request.return_value = response
+        creds = _make_credentials()
+        hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds, _http=http, metrics_hook=hook
+        )
+
+        client._call_api(retry=None, method="GET", path="/projects/p/jobs/j")
+
+        metric = hook.on_request.call_args.args[0]
+        assert metric.status_code == 200
+        assert metric.response_bytes == len(response._content)
+        assert metric.path_template == "/projects/{project}/jobs/{job}"
+
     def test__call_api_span_creator_called(self):
         from concurrent.futures import TimeoutError
         from google.cloud.bigquery.retry import DEFAULT_RETRY
@@ -812,6 +876,36 @@ class TestClient(unittest.TestCase):
                 with self.assertRaises(AttributeError):
                     client.get_dataset(dataset_ref, dataset_view=invalid_view_value)
 
+    def test_get_datasets(self):
+        from google.cloud.bigquery.dataset import Dataset
+        from google.cloud.bigquery.enums import DatasetView
+
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection()
+
+        def api_request(method, path, query_params, timeout):
+            self.assertEqual(query_params, {"datasetView": "METADATA"})
+            project, dataset_id = path.split("/")[2::2]
+            if dataset_id == "missing":
+                raise google.api_core.exceptions.NotFound("dataset not found")
+            return {"datasetReference": {"projectId": project, "datasetId": dataset_id}}
+
+        conn.api_request.side_effect = api_request
+
+        found = client.get_datasets(
+            ["ds_a", "missing", DatasetReference("other-project", "ds_b")],
+            dataset_view=DatasetView.METADATA,
+            max_workers=2,
+        )
+
+        self.assertEqual(len(found), 3)
+        self.assertIsInstance(found[0], Dataset)
+        self.assertEqual(found[0].dataset_id, "ds_a")
+        self.assertIsInstance(found[1], google.api_core.exceptions.NotFound)
+        self.assertEqual(found[2].project, "other-project")
+        self.assertEqual(client.get_datasets([]), [])
+
     def test_ensure_bqstorage_client_creating_new_instance(self):
         bigquery_storage = pytest.importorskip("google.cloud.bigquery_storage")
 
@@ -1686,6 +1780,39 @@ class TestClient(unittest.TestCase):
         )
         self.assertEqual(table.table_id, self.TABLE_ID)
 
+    def test_get_tables(self):
+        from google.cloud.bigquery.table import Table
+
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection()
+
+        def api_request(method, path, timeout):
+            self.assertEqual(timeout, 7.5)
+            table_id = path.split("/")[-1]
+            if table_id == "missing":
+                raise google.api_core.exceptions.NotFound("table not found")
+            return self._make_table_resource() | {
+                "tableReference": {
+                    "projectId": self.PROJECT,
+                    "datasetId": self.DS_ID,
+                    "tableId": table_id,
+                }
+            }
+
+        conn.api_request.side_effect = api_request
+        table_ids = ["table_%d" % index for index in range(12)]
+        refs = ["%s.%s" % (self.DS_ID, table_id) for table_id in table_ids]
+        refs.insert(3, self.TABLE_REF.dataset_id + ".missing")
+
+        found = client.get_tables(refs, timeout=7.5)
+
+        self.assertEqual(len(found), 13)
+        self.assertIsInstance(found.pop(3), google.api_core.exceptions.NotFound)
+        self.assertTrue(all(isinstance(table, Table) for table in found))
+        self.assertEqual([table.table_id for table in found], table_ids)
+        self.assertEqual(conn.api_request.call_count, 13)
+
     def test_get_table_sets_user_agent(self):
         creds = _make_credentials()
         http = mock.create_autospec(requests.Session)
@@ -2778,6 +2905,445 @@ class TestClient(unittest.TestCase):
         self.assertEqual(req[1]["data"], sent)
         self.assertIsNone(table3.description)
 
+    def _make_evolve_table_resource(self, fields, etag):
+        resource = self._make_table_resource()
+        resource["etag"] = etag
+        resource["schema"] = {"fields": fields}
+        return resource
+
+    def test_evolve_table_schema_no_changes(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        resource = self._make_evolve_table_resource(
+            [{"name": "id", "type": "INTEGER", "mode": "NULLABLE"}], "etag-1"
+        )
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection(resource)
+
+        table = client.evolve_table_schema(self.TABLE_REF, [SchemaField("id", "INT64")])
+
+        self.assertEqual(table.etag, "etag-1")
+        conn.api_request.assert_called_once()
+        self.assertEqual(conn.api_request.call_args[1]["method"], "GET")
+
+    def test_evolve_table_schema_w_table_skips_get(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        old_fields = [{"name": "id", "type": "INTEGER", "mode": "REQUIRED"}]
+        table = Table.from_api_repr(
+            self._make_evolve_table_resource(old_fields, "etag-1")
+        )
+        new_fields = [
+            SchemaField("id", "INTEGER"),
+            SchemaField("name", "STRING"),
+        ]
+        updated_resource = self._make_evolve_table_resource(
+            [field.to_api_repr() for field in new_fields], "etag-2"
+        )
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection(updated_resource)
+
+        updated = client.evolve_table_schema(table, new_fields)
+
+        self.assertEqual(updated.etag, "etag-2")
+        self.assertEqual(list(updated.schema), new_fields)
+        conn.api_request.assert_called_once()
+        request = conn.api_request.call_args[1]
+        self.assertEqual(request["method"], "PATCH")
+        self.assertEqual(request["headers"], {"If-Match": "etag-1"})
+        self.assertEqual(
+            request["data"],
+            {
+                "schema": {
+                    "fields": [
+                        {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
+                        {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+                    ]
+                }
+            },
+        )
+        # The table passed in is not changed.
+        self.assertEqual(table.schema[0].mode, "REQUIRED")
+
+    def test_evolve_table_schema_retries_on_etag_mismatch(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        fields = [{"name": "id", "type": "INTEGER", "mode": "NULLABLE"}]
+        name = {"name": "name", "type": "STRING", "mode": "NULLABLE"}
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection(
+            self._make_evolve_table_resource(fields, "etag-1"),
+            google.api_core.exceptions.PreconditionFailed("etag mismatch"),
+            # Another writer already added the field.
+            self._make_evolve_table_resource(fields + [name], "etag-2"),
+        )
+
+        table = client.evolve_table_schema(
+            self.TABLE_REF,
+            [SchemaField("id", "INTEGER"), SchemaField("name", "STRING")],
+        )
+
+        self.assertEqual(table.etag, "etag-2")
+        methods = [call[1]["method"] for call in conn.api_request.call_args_list]
+        self.assertEqual(methods, ["GET", "PATCH", "GET"])
+
+    def test_evolve_table_schema_gives_up_after_max_attempts(self):
+        from google.cloud.bigquery import client as client_module
+        from google.cloud.bigquery.schema import SchemaField
+
+        fields = [{"name": "id", "type": "INTEGER", "mode": "NULLABLE"}]
+        responses = [self._make_evolve_table_resource(fields, "etag-0")]
+        for attempt in range(1, client_module._MAX_SCHEMA_EVOLUTION_ATTEMPTS):
+            responses.append(
+                google.api_core.exceptions.PreconditionFailed("etag mismatch")
+            )
+            responses.append(
+                self._make_evolve_table_resource(fields, f"etag-{attempt}")
+            )
+        responses.append(google.api_core.exceptions.PreconditionFailed("etag mismatch"))
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection(*responses)
+
+        with self.assertRaises(google.api_core.exceptions.PreconditionFailed):
+            client.evolve_table_schema(self.TABLE_REF, [SchemaField("name", "STRING")])
+
+        self.assertEqual(len(conn.api_request.call_args_list), len(responses))
+
+    def test_evolve_table_schema_incompatible(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        resource = self._make_evolve_table_resource(
+            [{"name": "id", "type": "INTEGER", "mode": "NULLABLE"}], "etag-1"
+        )
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection(resource)
+
+        with self.assertRaisesRegex(ValueError, "id: type changed"):
+            client.evolve_table_schema(self.TABLE_REF, [SchemaField("id", "STRING")])
+
+        conn.api_request.assert_called_once()
+
+    def _crawl_api_request(self, method, path, query_params=None, **kwargs):
+        parts = path.strip("/").split("/")
+        if parts[-1] == "datasets":
+            return {
+                "datasets": [
+                    {"datasetReference": {"projectId": self.PROJECT, "datasetId": ds}}
+                    for ds in ("ds_a", "ds_b")
+                ]
+            }
+        dataset_id = parts[3]
+        if parts[-1] == "tables":
+            page_token = (query_params or {}).get("pageToken")
+            table_ids = {
+                ("ds_a", None): ["old"],
+                ("ds_a", "token"): ["new"],
+                ("ds_b", None): ["deleted"],
+            }[(dataset_id, page_token)]
+            response = {
+                "tables": [
+                    {
+                        "tableReference": {
+                            "projectId": self.PROJECT,
+                            "datasetId": dataset_id,
+                            "tableId": table_id,
+                        }
+                    }
+                    for table_id in table_ids
+                ]
+            }
+            if dataset_id == "ds_a" and page_token is None:
+                response["nextPageToken"] = "token"
+            return response
+        table_id = parts[-1]
+        if table_id == "deleted":
+            raise google.api_core.exceptions.NotFound("table not found")
+        modified = {"old": 1000, "new": 3000}[table_id]
+        return {
+            "tableReference": {
+                "projectId": self.PROJECT,
+                "datasetId": dataset_id,
+                "tableId": table_id,
+            },
+            "lastModifiedTime": str(modified),
+        }
+
+    def test_crawl_metadata(self):
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection()
+        conn.api_request.side_effect = self._crawl_api_request
+
+        tables = list(client.crawl_metadata(max_workers=2))
+
+        self.assertEqual(sorted(table.table_id for table in tables), ["new", "old"])
+        # list datasets, 3 pages of tables and 3 tables.
+        self.assertEqual(conn.api_request.call_count, 7)
+
+    def test_crawl_metadata_skips_deleted_dataset(self):
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection()
+
+        def api_request(method, path, query_params=None, **kwargs):
+            if path.endswith("/datasets/ds_b/tables"):
+                raise google.api_core.exceptions.NotFound("dataset not found")
+            return self._crawl_api_request(method, path, query_params, **kwargs)
+
+        conn.api_request.side_effect = api_request
+
+        tables = list(client.crawl_metadata(max_workers=2))
+
+        self.assertEqual(sorted(table.table_id for table in tables), ["new", "old"])
+        # list datasets, 3 pages of tables and 2 tables.
+        self.assertEqual(conn.api_request.call_count, 6)
+
+    def test_crawl_metadata_w_datasets_modified_since(self):
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection()
+        conn.api_request.side_effect = self._crawl_api_request
+
+        tables = list(
+            client.crawl_metadata(
+                datasets=["ds_a"],
+                modified_since=datetime.datetime(1970, 1, 1, 0, 0, 2),
+                max_requests_per_second=1000,
+            )
+        )
+
+        self.assertEqual([table.table_id for table in tables], ["new"])
+        paths = [call[1]["path"] for call in conn.api_request.call_args_list]
+        self.assertNotIn("/projects/%s/datasets" % self.PROJECT, paths)
+
+    def _apply_metadata_client(self):
+        dataset_path = "/projects/%s/datasets/%s" % (self.PROJECT, self.DS_ID)
+        store = {}
+
+        def table(table_id, **properties):
+            return dict(
+                tableReference={
+                    "projectId": self.PROJECT,
+                    "datasetId": self.DS_ID,
+                    "tableId": table_id,
+                },
+                etag="etag-" + table_id,
+                **properties,
+            )
+
+        id_schema = {"fields": [{"name": "id", "type": "INTEGER"}]}
+        store[dataset_path + "/tables/t_same"] = table("t_same", schema=id_schema)
+        store[dataset_path + "/tables/t_old"] = table("t_old", description="old")
+        store[dataset_path + "/tables/t_gone"] = table("t_gone")
+
+        def api_request(method, path, data=None, **kwargs):
+            if method == "GET":
+                if path not in store:
+                    raise google.api_core.exceptions.NotFound(path)
+                return store[path]
+            if method == "POST":
+                reference = data.get("tableReference") or data["routineReference"]
+                resource_id = reference.get("tableId") or reference["routineId"]
+                query = data.get("view", {}).get("query", "")
+                if "v1" in query and dataset_path + "/tables/v1" not in store:
+                    raise google.api_core.exceptions.NotFound("v1 not found")
+                store[path + "/" + resource_id] = data
+                return data
+            if method == "PATCH":
+                store[path] = dict(store[path], **data)
+                return store[path]
+            if method == "PUT":
+                store[path] = data
+                return data
+            if method == "DELETE":
+                if store.pop(path, None) is None:
+                    raise google.api_core.exceptions.NotFound(path)
+                return {}
+            raise AssertionError(method)
+
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        conn = client._connection = make_connection()
+        conn.api_request.side_effect = api_request
+        return client, conn, store
+
+    def _apply_metadata_definitions(self):
+        from google.cloud.bigquery.routine import Routine
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        dataset_id = "%s.%s" % (self.PROJECT, self.DS_ID)
+        t_same = Table(dataset_id + ".t_same", schema=[SchemaField("id", "INT64")])
+        t_old = Table(dataset_id + ".t_old")
+        t_old.description = "new"
+        v2 = Table(dataset_id + ".v2")
+        v2.view_query = "SELECT * FROM %s.v1" % self.DS_ID
+        v1 = Table(dataset_id + ".v1")
+        v1.view_query = "SELECT 1 AS x"
+        r1 = Routine(dataset_id + ".r1", type_="SCALAR_FUNCTION", body="1")
+        return [t_same, t_old, v2, v1, r1]
+
+    def test_apply_metadata(self):
+        from google.cloud.bigquery.bulk import BulkAction
+
+        ds_path = "/projects/%s/datasets/%s" % (self.PROJECT, self.DS_ID)
+        client, conn, store = self._apply_metadata_client()
+
+        report = client.apply_metadata(
+            self._apply_metadata_definitions(),
+            deletes=["%s.t_gone" % self.DS_ID, "%s.t_missing" % self.DS_ID],
+            max_workers=1,
+        )
+
+        self.assertTrue(report.ok)
+        self.assertEqual(
+            [(result.reference.path, result.action) for result in report.results],
+            [
+                (ds_path + "/tables/t_same", BulkAction.UNCHANGED),
+                (ds_path + "/tables/t_old", BulkAction.UPDATE),
+                (ds_path + "/tables/v2", BulkAction.CREATE),
+                (ds_path + "/tables/v1", BulkAction.CREATE),
+                (ds_path + "/routines/r1", BulkAction.CREATE),
+                (ds_path + "/tables/t_gone", BulkAction.DELETE),
+                (ds_path + "/tables/t_missing", BulkAction.DELETE),
+            ],
+        )
+        self.assertEqual(report.updated[0].fields, ("description",))
+        self.assertEqual(report.updated[0].resource.description, "new")
+        self.assertIn(ds_path + "/tables/v2", store)
+        self.assertNotIn(ds_path + "/tables/t_gone", store)
+        patch_calls = [
+            call
+            for call in conn.api_request.call_args_list
+            if call[1]["method"] == "PATCH"
+        ]
+        self.assertEqual(len(patch_calls), 1)
+        self.assertEqual(patch_calls[0][1]["data"], {"description": "new"})
+        self.assertEqual(patch_calls[0][1]["headers"], {"If-Match": "etag-t_old"})
+
+    def test_apply_metadata_dry_run(self):
+        from google.cloud.bigquery.bulk import BulkAction
+
+        ds_path = "/projects/%s/datasets/%s" % (self.PROJECT, self.DS_ID)
+        client, conn, store = self._apply_metadata_client()
+
+        report = client.apply_metadata(
+            self._apply_metadata_definitions(),
+            deletes=["%s.t_gone" % self.DS_ID],
+            dry_run=True,
+        )
+
+        self.assertTrue(report.dry_run)
+        self.assertEqual(
+            [result.action for result in report.results],
+            [
+                BulkAction.UNCHANGED,
+                BulkAction.UPDATE,
+                BulkAction.CREATE,
+                BulkAction.CREATE,
+                BulkAction.CREATE,
+                BulkAction.DELETE,
+            ],
+        )
+        methods = {call[1]["method"] for call in conn.api_request.call_args_list}
+        self.assertEqual(methods, {"GET"})
+        self.assertIn(ds_path + "/tables/t_gone", store)
+
+    def test_apply_metadata_reports_errors(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        client, conn, _ = self._apply_metadata_client()
+        dataset_id = "%s.%s" % (self.PROJECT, self.DS_ID)
+        # Changing a column type cannot be applied to the existing table.
+        t_same = Table(dataset_id + ".t_same", schema=[SchemaField("id", "STRING")])
+        # The view depends on a table which is not defined.
+        v2 = Table(dataset_id + ".v2")
+        v2.view_query = "SELECT * FROM %s.v1" % self.DS_ID
+
+        report = client.apply_metadata([t_same, v2])
+
+        self.assertFalse(report.ok)
+        self.assertIsInstance(report.results[0].error, ValueError)
+        self.assertIsInstance(
+            report.results[1].error, google.api_core.exceptions.NotFound
+        )
+        # No retry round, since nothing of the first round was applied.
+        self.assertEqual(conn.api_request.call_count, 3)
+
+    def test_apply_metadata_updates_routine_keeping_unset_properties(self):
+        from google.cloud.bigquery.bulk import BulkAction
+        from google.cloud.bigquery.routine import Routine
+
+        client, conn, store = self._apply_metadata_client()
+        routine_path = "/projects/%s/datasets/%s/routines/r1" % (
+            self.PROJECT,
+            self.DS_ID,
+        )
+        arguments = [{"name": "x", "dataType": {"typeKind": "INT64"}}]
+        store[routine_path] = {
+            "routineReference": {
+                "projectId": self.PROJECT,
+                "datasetId": self.DS_ID,
+                "routineId": "r1",
+            },
+            "etag": "etag-r1",
+            "routineType": "SCALAR_FUNCTION",
+            "language": "SQL",
+            "definitionBody": "x * 2",
+            "description": "keep me",
+            "arguments": arguments,
+        }
+        definition = Routine(
+            "%s.%s.r1" % (self.PROJECT, self.DS_ID),
+            type_="SCALAR_FUNCTION",
+            language="SQL",
+            body="2",
+        )
+
+        report = client.apply_metadata([definition])
+
+        self.assertEqual(report.results[0].action, BulkAction.UPDATE)
+        self.assertEqual(report.results[0].fields, ("body",))
+        (put_call,) = [
+            call
+            for call in conn.api_request.call_args_list
+            if call[1]["method"] == "PUT"
+        ]
+        self.assertEqual(put_call[1]["headers"], {"If-Match": "etag-r1"})
+        sent = put_call[1]["data"]
+        self.assertEqual(sent["definitionBody"], "2")
+        self.assertEqual(sent["description"], "keep me")
+        self.assertEqual(sent["arguments"], arguments)
+
+    def test_apply_metadata_w_invalid_definition(self):
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+
+        with self.assertRaises(TypeError):
+            client.apply_metadata([self.TABLE_REF])
+
+        self.assertEqual(client.apply_metadata([]).results, [])
+
+    def test_request_throttle(self):
+        from google.cloud.bigquery import client as client_module
+
+        with mock.patch.object(
+            client_module.time, "monotonic", return_value=100.0
+        ), mock.patch.object(client_module.time, "sleep") as sleep:
+            throttle = client_module._RequestThrottle(4)
+            throttle.wait()
+            throttle.wait()
+            throttle.wait()
+
+        self.assertEqual(sleep.call_args_list, [mock.call(0.25), mock.call(0.5)])
+
     def test_delete_job_metadata_not_found(self):
         creds = _make_credentials()
         client = self._make_one("client-proj", creds, location="client-loc")
@@ -4473,6 +5039,216 @@ class TestClient(unittest.TestCase):
 
         self.assertIn("Cannot pass", exc.exception.args[0])
 
+    def _dry_run_resource(self, query, referenced_tables=(), total_bytes=1024):
+        return {
+            "jobReference": {"projectId": self.PROJECT, "jobId": "dry-run"},
+            "configuration": {"query": {"query": query}, "dryRun": True},
+            "statistics": {
+                "creationTime": 1700000000000.0,
+                "query": {
+                    "totalBytesProcessed": str(total_bytes),
+                    "referencedTables": [
+                        {
+                            "projectId": self.PROJECT,
+                            "datasetId": self.DS_ID,
+                            "tableId": table_id,
+                        }
+                        for table_id in referenced_tables
+                    ],
+                },
+            },
+        }
+
+    def _table_resource_modified(self, table_id, modified_millis):
+        return {
+            "tableReference": {
+                "projectId": self.PROJECT,
+                "datasetId": self.DS_ID,
+                "tableId": table_id,
+            },
+            "lastModifiedTime": str(modified_millis),
+        }
+
+    def test_estimate_query_reuses_dry_run_while_tables_unchanged(self):
+        query = "SELECT * FROM t"
+        client = self._make_one(project=self.PROJECT, credentials=_make_credentials())
+        conn = client._connection = make_connection(
+            self._dry_run_resource(query, ["t"], total_bytes=2048),
+            self._table_resource_modified("t", 1600000000000),
+        )
+
+        first = client.estimate_query(query)
+        second = client.estimate_query(query)
+
+        self.assertIs(second, first)
+        self.assertEqual(first.total_bytes_processed, 2048)
+        self.assertTrue(first.dry_run)
+        self.assertEqual(conn.api_request.call_count, 2)
+        _, dry_run_request = conn.api_request.call_args_list[0]
+        self.assertEqual(dry_run_request["method"], "POST")
+        self.assertTrue(dry_run_request["data"]["configuration"]["dryRun"])
+        _, table_request = conn.api_request.call_args_list[1]
+        self.assertEqual(table_request["method"], "GET")
+        self.assertEqual(
+            table_request["path"],
+            "/projects/%s/datasets/%s/tables/t" % (self.PROJECT, self.DS_ID),
+        )
+
+    def test_estimate_query_redoes_dry_run_after_table_change(self):
+        query = "SELECT * FROM t"
+        client = self._make_one(project=self.PROJECT, credentials=_make_credentials())
+        conn = client._connection = make_connection(
+            self._dry_run_resource(query, ["t"], total_bytes=1),
+            self._table_resource_modified("t", 1800000000000),
+            self._dry_run_resource(query, ["t"], total_bytes=2),
+        )
+
+        first = client.estimate_query(query)
+        second = client.estimate_query(query)
+
+        self.assertEqual(first.total_bytes_processed, 1)
+        self.assertEqual(second.total_bytes_processed, 2)
+        self.assertEqual(conn.api_request.call_count, 3)
+        self.assertEqual(len(client._query_estimate_cache), 1)
+
+    def test_estimate_query_redoes_dry_run_if_table_deleted(self):
+        from google.cloud.exceptions import NotFound
+
+        query = "SELECT * FROM t"
+        client = self._make_one(project=self.PROJECT, credentials=_make_credentials())
+        conn = client._connection = make_connection(
+            self._dry_run_resource(query, ["t"]),
+            NotFound("table t"),
+            self._dry_run_resource(query, ["t"]),
+        )
+
+        client.estimate_query(query)
+        client.estimate_query(query)
+
+        self.assertEqual(conn.api_request.call_count, 3)
+
+    def test_estimate_query_checks_referenced_tables_concurrently(self):
+        query = "SELECT * FROM a, b, c"
+        client = self._make_one(project=self.PROJECT, credentials=_make_credentials())
+        conn = client._connection = make_connection()
+        modified = {"a": 1600000000000, "b": 1600000000000, "c": 1600000000000}
+        table_paths = []
+        # The three table requests of a check only pass it together.
+        all_tables_requested = threading.Barrier(3, timeout=10)
+
+        def api_request(method, path, data=None, **kwargs):
+            if method == "POST":
+                return self._dry_run_resource(query, ["a", "b", "c"])
+            table_paths.append(path)
+            all_tables_requested.wait()
+            table_id = path.rsplit("/", 1)[-1]
+            return self._table_resource_modified(table_id, modified[table_id])
+
+        conn.api_request.side_effect = api_request
+
+        first = client.estimate_query(query)
+        second = client.estimate_query(query)
+        modified["b"] = 1800000000000
+        third = client.estimate_query(query)
+
+        self.assertIs(second, first)
+        self.assertIsNot(third, first)
+        self.assertEqual(len(table_paths), 6)
+        self.assertEqual(conn.api_request.call_count, 8)
+
+    def test_estimate_query_w_cache(self):
+        from google.cloud.bigquery._job_helpers import QueryEstimateCache
+
+        query = "SELECT 1"
+        cache = QueryEstimateCache()
+        first_client = self._make_one(
+            project=self.PROJECT, credentials=_make_credentials()
+        )
+        first_client._connection = make_connection(self._dry_run_resource(query))
+        second_client = self._make_one(
+            project=self.PROJECT, credentials=_make_credentials()
+        )
+        second_conn = second_client._connection = make_connection()
+
+        first = first_client.estimate_query(query, cache=cache)
+        second = second_client.estimate_query(query, cache=cache)
+
+        self.assertIs(second, first)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(len(first_client._query_estimate_cache), 0)
+        second_conn.api_request.assert_not_called()
+
+    def test_estimate_query_key_includes_parameters(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        query = "SELECT @x"
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            default_query_job_config=QueryJobConfig(use_query_cache=False),
+        )
+        conn = client._connection = make_connection(
+            self._dry_run_resource(query),
+            self._dry_run_resource(query),
+        )
+        config = QueryJobConfig(
+            query_parameters=[ScalarQueryParameter("x", "INT64", 1)]
+        )
+
+        first = client.estimate_query(query, job_config=config)
+        config.query_parameters = [ScalarQueryParameter("x", "INT64", 2)]
+        second = client.estimate_query(query, job_config=config)
+        third = client.estimate_query(query, job_config=config)
+
+        self.assertIsNot(first, second)
+        self.assertIs(third, second)
+        self.assertEqual(conn.api_request.call_count, 2)
+        self.assertIsNone(config.dry_run)
+        _, request = conn.api_request.call_args
+        self.assertFalse(request["data"]["configuration"]["query"]["useQueryCache"])
+
+    def test_estimate_query_wo_cache(self):
+        query = "SELECT 1"
+        client = self._make_one(project=self.PROJECT, credentials=_make_credentials())
+        conn = client._connection = make_connection(
+            self._dry_run_resource(query),
+            self._dry_run_resource(query),
+        )
+
+        first = client.estimate_query(query)
+        second = client.estimate_query(query, use_cache=False)
+        third = client.estimate_query(query)
+
+        self.assertIsNot(first, second)
+        self.assertIs(third, second)
+        self.assertEqual(conn.api_request.call_count, 2)
+
+    def test_estimate_query_w_wrong_config(self):
+        from google.cloud.bigquery.job import LoadJobConfig
+
+        client = self._make_one(project=self.PROJECT, credentials=_make_credentials())
+
+        with self.assertRaises(TypeError):
+            client.estimate_query("SELECT 1", job_config=LoadJobConfig())
+
+    def test_estimate_queries(self):
+        client = self._make_one(project=self.PROJECT, credentials=_make_credentials())
+        conn = client._connection = make_connection()
+
+        def api_request(method, path, data=None, **kwargs):
+            query = data["configuration"]["query"]["query"]
+            return self._dry_run_resource(query, total_bytes=len(query))
+
+        conn.api_request.side_effect = api_request
+        queries = ["SELECT 1", "SELECT 22", "SELECT 333", "SELECT 1"]
+
+        jobs = client.estimate_queries(queries, max_workers=2)
+
+        self.assertEqual([job.query for job in jobs], queries)
+        self.assertEqual([job.total_bytes_processed for job in jobs], [8, 9, 10, 8])
+        self.assertEqual(client.estimate_queries([]), [])
+
     def test_query_defaults(self):
         from google.cloud.bigquery.job import QueryJob
 
@@ -7938,6 +8714,38 @@ class TestClientUpload(object):
         sent_config = load_table_from_file.mock_calls[0][2]["job_config"]
         assert sent_config.source_format == job.SourceFormat.PARQUET
 
+    def test_load_table_from_dataframe_w_schema_sample_size(self):
+        pandas = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        from google.cloud.bigquery import _pandas_helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame([{"id": 1}, {"id": 2}])
+
+        get_table_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.get_table",
+            autospec=True,
+            side_effect=google.api_core.exceptions.NotFound("Table not found"),
+        )
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file", autospec=True
+        )
+        to_schema_patch = mock.patch.object(
+            _pandas_helpers,
+            "dataframe_to_bq_schema",
+            autospec=True,
+            return_value=(SchemaField("id", "INTEGER"),),
+        )
+        with load_patch, get_table_patch, to_schema_patch as dataframe_to_bq_schema:
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, schema_sample_size=100, cache_schema=True
+            )
+
+        dataframe_to_bq_schema.assert_called_once_with(
+            dataframe, mock.ANY, sample_size=100, use_cache=True
+        )
+
     def test_load_table_from_dataframe_w_custom_job_config_wihtout_source_format(self):
         pandas = pytest.importorskip("pandas")
         pytest.importorskip("pyarrow")
@@ -9858,6 +10666,36 @@ class TestClientUpload(object):
         client.schema_to_json(schema_list, fake_file)
         assert file_content == json.loads(fake_file.getvalue())
 
+    def test_schema_from_json_frozen_round_trip(self):
+        from google.cloud.bigquery.schema import FrozenSchema, SchemaField
+
+        file_content = [
+            {"name": "qtr", "type": "STRING", "mode": "REQUIRED"},
+            {
+                "name": "rep",
+                "type": "RECORD",
+                "mode": "NULLABLE",
+                "fields": [{"name": "id", "type": "INTEGER", "mode": "NULLABLE"}],
+            },
+        ]
+        client = self._make_client()
+
+        frozen = client.schema_from_json(
+            io.StringIO(json.dumps(file_content)), frozen=True
+        )
+
+        assert isinstance(frozen, FrozenSchema)
+        assert frozen == [
+            SchemaField("qtr", "STRING", "REQUIRED"),
+            SchemaField("rep", "RECORD", fields=[SchemaField("id", "INTEGER")]),
+        ]
+
+        fake_file = io.StringIO()
+        with mock.patch.object(SchemaField, "to_api_repr") as to_api_repr:
+            client.schema_to_json(frozen, fake_file)
+        to_api_repr.assert_not_called()
+        assert json.loads(fake_file.getvalue()) == file_content
+
 
 def test_upload_chunksize(client):
     with mock.patch("google.cloud.bigquery.client.ResumableUpload") as RU:
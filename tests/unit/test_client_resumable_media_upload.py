@@ -292,6 +292,27 @@ def test__do_resumable_upload():
     )
 
 
+def test__do_resumable_upload_w_metrics_hook():
+    from google.cloud.bigquery import metrics
+
+    file_obj = _make_file_obj()
+    file_obj_len = len(file_obj.getvalue())
+    transport = _make_transport(_make_resumable_upload_responses(file_obj_len))
+    hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+    client = _make_client(_http=transport, metrics_hook=hook)
+
+    client._do_resumable_upload(file_obj, EXPECTED_CONFIGURATION, None, None)
+
+    initiate, chunk = [c.args[0] for c in hook.on_upload_chunk.call_args_list]
+    assert initiate.chunk_index == -1
+    assert initiate.bytes_sent == 0
+    assert initiate.status_code == http.client.OK
+    assert chunk.chunk_index == 0
+    assert chunk.bytes_sent == file_obj_len
+    assert chunk.status_code == http.client.OK
+    assert chunk.error_reason is None
+
+
 def test__do_resumable_upload_custom_project():
     file_obj = _make_file_obj()
     file_obj_len = len(file_obj.getvalue())
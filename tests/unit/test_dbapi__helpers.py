@@ -15,7 +15,6 @@
 import datetime
 import decimal
 import math
-import operator as op
 import re
 import unittest
 
@@ -81,6 +80,28 @@ class TestQueryParameters(unittest.TestCase):
         self.assertTrue(math.isinf(inf_parameter.value))
         self.assertEqual(inf_parameter.type_, "FLOAT64")
 
+    def test_bigquery_scalar_type_memoized_per_python_type(self):
+        class MyInt(int):
+            pass
+
+        self.assertNotIn(MyInt, _helpers._SCALAR_TYPES_BY_PYTHON_TYPE)
+        self.assertEqual(_helpers.bigquery_scalar_type(MyInt(1)), "INT64")
+        self.assertEqual(_helpers._SCALAR_TYPES_BY_PYTHON_TYPE[MyInt], "INT64")
+        self.assertEqual(_helpers.bigquery_scalar_type(MyInt(2)), "INT64")
+
+    def test_bigquery_scalar_type_value_dependent_types_not_memoized(self):
+        naive = datetime.datetime(2020, 1, 1)
+        aware = naive.replace(tzinfo=datetime.timezone.utc)
+        numeric = decimal.Decimal("1.5")
+        bignumeric = decimal.Decimal("1.5E+30")
+
+        self.assertEqual(_helpers.bigquery_scalar_type(naive), "DATETIME")
+        self.assertEqual(_helpers.bigquery_scalar_type(aware), "TIMESTAMP")
+        self.assertEqual(_helpers.bigquery_scalar_type(numeric), "NUMERIC")
+        self.assertEqual(_helpers.bigquery_scalar_type(bignumeric), "BIGNUMERIC")
+        self.assertNotIn(datetime.datetime, _helpers._SCALAR_TYPES_BY_PYTHON_TYPE)
+        self.assertNotIn(decimal.Decimal, _helpers._SCALAR_TYPES_BY_PYTHON_TYPE)
+
     def test_array_to_query_parameter_valid_argument(self):
         expected_types = [
             ([True, False], "BOOL"),
@@ -203,50 +224,78 @@ class TestQueryParameters(unittest.TestCase):
         self.assertEqual(query_parameters, [])
 
 
-class TestToBqTableRows(unittest.TestCase):
+class TestRecordBatchesToBqTableRows(unittest.TestCase):
     def test_empty_iterable(self):
-        rows_iterable = iter([])
-        result = _helpers.to_bq_table_rows(rows_iterable)
+        result = _helpers.record_batches_to_bq_table_rows(iter([]))
         self.assertEqual(list(result), [])
 
-    def test_non_empty_iterable(self):
-        pytest.importorskip("numpy")
-        pytest.importorskip("pyarrow")
-        from tests.unit.helpers import _to_pyarrow
+    def test_empty_record_batch(self):
+        pyarrow = pytest.importorskip("pyarrow")
 
-        rows_iterable = [
-            dict(
-                one=_to_pyarrow(1.1),
-                four=_to_pyarrow(1.4),
-                two=_to_pyarrow(1.2),
-                three=_to_pyarrow(1.3),
-            ),
-            dict(
-                one=_to_pyarrow(2.1),
-                four=_to_pyarrow(2.4),
-                two=_to_pyarrow(2.2),
-                three=_to_pyarrow(2.3),
-            ),
-        ]
-
-        result = _helpers.to_bq_table_rows(rows_iterable)
+        record_batch = pyarrow.record_batch(
+            [pyarrow.array([], type=pyarrow.int64())], names=["one"]
+        )
 
-        rows = list(result)
-        self.assertEqual(len(rows), 2)
+        result = _helpers.record_batches_to_bq_table_rows([record_batch])
 
-        row_1, row_2 = rows
-        self.assertIsInstance(row_1, table.Row)
-        self.assertIsInstance(row_2, table.Row)
+        self.assertEqual(list(result), [])
 
-        field_value = op.itemgetter(1)
+    def test_non_empty_record_batches(self):
+        pyarrow = pytest.importorskip("pyarrow")
 
-        items = sorted(row_1.items(), key=field_value)
-        expected_items = [("one", 1.1), ("two", 1.2), ("three", 1.3), ("four", 1.4)]
-        self.assertEqual(items, expected_items)
+        schema = pyarrow.schema(
+            [
+                ("int_col", pyarrow.int64()),
+                ("str_col", pyarrow.string()),
+                ("list_col", pyarrow.list_(pyarrow.int64())),
+                (
+                    "struct_col",
+                    pyarrow.struct([("name", pyarrow.string())]),
+                ),
+            ]
+        )
+        record_batches = [
+            pyarrow.RecordBatch.from_pylist(
+                [
+                    {
+                        "int_col": 1,
+                        "str_col": "a",
+                        "list_col": [1, 2],
+                        "struct_col": {"name": "x"},
+                    },
+                    {
+                        "int_col": None,
+                        "str_col": "b",
+                        "list_col": [],
+                        "struct_col": None,
+                    },
+                ],
+                schema=schema,
+            ),
+            pyarrow.RecordBatch.from_pylist(
+                [
+                    {
+                        "int_col": 3,
+                        "str_col": None,
+                        "list_col": [3],
+                        "struct_col": {"name": "z"},
+                    }
+                ],
+                schema=schema,
+            ),
+        ]
 
-        items = sorted(row_2.items(), key=field_value)
-        expected_items = [("one", 2.1), ("two", 2.2), ("three", 2.3), ("four", 2.4)]
-        self.assertEqual(items, expected_items)
+        rows = list(_helpers.record_batches_to_bq_table_rows(record_batches))
+
+        self.assertEqual(len(rows), 3)
+        for row in rows:
+            self.assertIsInstance(row, table.Row)
+        self.assertEqual(rows[0].values(), (1, "a", [1, 2], {"name": "x"}))
+        self.assertEqual(rows[1].values(), (None, "b", [], None))
+        self.assertEqual(rows[2].values(), (3, None, [3], {"name": "z"}))
+        self.assertEqual(rows[2]["str_col"], None)
+        self.assertEqual(rows[2].get("list_col"), [3])
+        self.assertIs(rows[0]._xxx_field_to_index, rows[2]._xxx_field_to_index)
 
 
 class TestRaiseOnClosedDecorator(unittest.TestCase):
@@ -142,6 +142,174 @@ class TestConnection(unittest.TestCase):
         self.assertIs(connection._client, mock_client)
         self.assertIs(connection._bqstorage_client, None)
 
+    def test_connect_w_max_stream_count(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        mock_client = self._mock_client()
+        mock_client._ensure_bqstorage_client.return_value = None
+
+        connection = connect(client=mock_client, max_stream_count=4)
+
+        self.assertEqual(connection._max_stream_count, 4)
+        self.assertEqual(connection.cursor().max_stream_count, 4)
+        self.assertEqual(connect(client=mock_client).cursor().max_stream_count, 1)
+
+    def _mock_session_client(self, session_id="session-1"):
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery import table
+
+        mock_client = self._mock_client()
+        mock_client._ensure_bqstorage_client.return_value = None
+        mock_job = mock.create_autospec(job.QueryJob)
+        mock_job.session_info = job.base.SessionInfo({"sessionId": session_id})
+        mock_rows = mock.create_autospec(table.RowIterator, instance=True)
+        mock_rows.schema = []
+        mock_rows.total_rows = 0
+        mock_rows.num_dml_affected_rows = None
+        mock_rows.__iter__.return_value = iter([])
+        mock_job.result.return_value = mock_rows
+        mock_client.query.return_value = mock_job
+        mock_client.query_and_wait.return_value = mock_rows
+        return mock_client
+
+    def test_use_session_attaches_session_to_queries(self):
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.query import ConnectionProperty
+
+        mock_client = self._mock_session_client()
+        connection = connect(client=mock_client, use_session=True)
+        cursor = connection.cursor()
+
+        cursor.execute("CREATE TEMP TABLE t AS SELECT 1 AS x")
+        connection.cursor().execute("SELECT x FROM t", job_id="my-job")
+
+        mock_client.query.assert_any_call("SELECT 1", job_config=mock.ANY)
+        create_config = mock_client.query.call_args_list[0].kwargs["job_config"]
+        self.assertTrue(create_config.create_session)
+        _, kwargs = mock_client.query_and_wait.call_args
+        self.assertEqual(
+            [prop._properties for prop in kwargs["job_config"].connection_properties],
+            [{"key": "session_id", "value": "session-1"}],
+        )
+        _, kwargs = mock_client.query.call_args
+        self.assertEqual(kwargs["job_id"], "my-job")
+        self.assertEqual(
+            kwargs["job_config"].connection_properties[0].value, "session-1"
+        )
+        # The session is created only once per connection.
+        self.assertEqual(mock_client.query.call_count, 2)
+
+        config = job.QueryJobConfig(
+            connection_properties=[
+                ConnectionProperty("time_zone", "UTC"),
+                ConnectionProperty("session_id", "mine"),
+            ]
+        )
+        cursor.execute("SELECT 1", job_config=config)
+        _, kwargs = mock_client.query_and_wait.call_args
+        self.assertEqual(
+            [prop.value for prop in kwargs["job_config"].connection_properties],
+            ["UTC", "mine"],
+        )
+
+    def test_use_session_leaves_job_config_unchanged(self):
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.query import ConnectionProperty
+
+        mock_client = self._mock_session_client()
+        connection = connect(client=mock_client, use_session=True)
+        config = job.QueryJobConfig(
+            connection_properties=[ConnectionProperty("time_zone", "UTC")]
+        )
+
+        connection.cursor().execute("SELECT 1", job_config=config)
+
+        _, kwargs = mock_client.query_and_wait.call_args
+        self.assertIsNot(kwargs["job_config"], config)
+        self.assertEqual(
+            [prop.key for prop in kwargs["job_config"].connection_properties],
+            ["time_zone", "session_id"],
+        )
+        self.assertEqual(
+            [prop.key for prop in config.connection_properties], ["time_zone"]
+        )
+
+        # Reused on another connection, the config runs in its session.
+        other_client = self._mock_session_client(session_id="session-2")
+        other = connect(client=other_client, use_session=True)
+        other.cursor().execute("SELECT 1", job_config=config)
+
+        _, kwargs = other_client.query_and_wait.call_args
+        self.assertEqual(
+            kwargs["job_config"].connection_properties[-1].value, "session-2"
+        )
+
+    def test_use_session_close_aborts_session(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        mock_client = self._mock_session_client()
+        connection = connect(client=mock_client, use_session=True)
+        connection.cursor().execute("SELECT 1")
+
+        connection.close()
+
+        (query,), kwargs = mock_client.query_and_wait.call_args
+        self.assertEqual(query, "CALL BQ.ABORT_SESSION()")
+        self.assertEqual(
+            kwargs["job_config"].connection_properties[0].value, "session-1"
+        )
+        self.assertIsNone(connection._session_id)
+
+    def test_use_session_close_wo_queries(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        mock_client = self._mock_session_client()
+        connection = connect(client=mock_client, use_session=True)
+
+        connection.close()
+
+        mock_client.query.assert_not_called()
+        mock_client.query_and_wait.assert_not_called()
+
+    def test_use_session_close_warns_if_abort_fails(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery.dbapi import connect
+
+        mock_client = self._mock_session_client()
+        connection = connect(client=mock_client, use_session=True)
+        connection.cursor().execute("SELECT 1")
+        mock_client.query_and_wait.side_effect = exceptions.NotFound("session")
+
+        with pytest.warns(RuntimeWarning, match="session-1"):
+            connection.close()
+
+    def test_use_session_create_error(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.dbapi import DatabaseError
+
+        mock_client = self._mock_session_client()
+        mock_client.query.side_effect = exceptions.Forbidden("denied")
+        connection = connect(client=mock_client, use_session=True)
+
+        with self.assertRaisesRegex(DatabaseError, "denied"):
+            connection.cursor().execute("SELECT 1")
+        mock_client.query_and_wait.assert_not_called()
+
+    def test_wo_session_queries_run_on_their_own(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        mock_client = self._mock_session_client()
+        connection = connect(client=mock_client)
+        connection.cursor().execute("SELECT 1")
+        connection.close()
+
+        mock_client.query.assert_not_called()
+        _, kwargs = mock_client.query_and_wait.call_args
+        self.assertEqual(kwargs["job_config"].connection_properties, [])
+
     def test_raises_error_if_closed(self):
         from google.cloud.bigquery.dbapi.exceptions import ProgrammingError
 
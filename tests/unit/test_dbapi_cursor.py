@@ -23,8 +23,6 @@ import google.cloud.bigquery.table as bq_table
 
 from google.api_core import exceptions
 
-from tests.unit.helpers import _to_pyarrow
-
 
 class TestCursor(unittest.TestCase):
     @staticmethod
@@ -102,8 +100,15 @@ class TestCursor(unittest.TestCase):
 
         mock_client.create_read_session.return_value = mock_read_session
 
+        def to_arrow():
+            import pyarrow
+
+            return pyarrow.RecordBatch.from_pylist(rows)
+
+        mock_page = mock.Mock(num_items=len(rows))
+        mock_page.to_arrow.side_effect = to_arrow
         mock_rows_stream = mock.MagicMock()
-        mock_rows_stream.rows.return_value = iter(rows)
+        mock_rows_stream.rows.return_value.pages = [mock_page]
         mock_client.read_rows.return_value = mock_rows_stream
 
         return mock_client
@@ -327,18 +332,8 @@ class TestCursor(unittest.TestCase):
             ),
         ]
         bqstorage_streamed_rows = [
-            {
-                "bar": _to_pyarrow(1.2),
-                "foo": _to_pyarrow(1.1),
-                "quux": _to_pyarrow(1.4),
-                "baz": _to_pyarrow(1.3),
-            },
-            {
-                "bar": _to_pyarrow(2.2),
-                "foo": _to_pyarrow(2.1),
-                "quux": _to_pyarrow(2.4),
-                "baz": _to_pyarrow(2.3),
-            },
+            {"bar": 1.2, "foo": 1.1, "quux": 1.4, "baz": 1.3},
+            {"bar": 2.2, "foo": 2.1, "quux": 2.4, "baz": 2.3},
         ]
 
         mock_client = self._mock_client(rows=row_data)
@@ -370,6 +365,42 @@ class TestCursor(unittest.TestCase):
 
         self.assertEqual(sorted_row_data, expected_row_data)
 
+    def test_fetchall_w_bqstorage_client_w_download_profile(self):
+        pytest.importorskip("google.cloud.bigquery_storage")
+        pytest.importorskip("pyarrow")
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery import metrics
+
+        row_data = [bq_table.Row([8], {"foo": 0}), bq_table.Row([9], {"foo": 0})]
+
+        def fake_ensure_bqstorage_client(bqstorage_client=None, **kwargs):
+            return bqstorage_client
+
+        # More rows than the first page, so that the BQ Storage API is used.
+        mock_client = self._mock_client(rows=row_data, total_rows=100)
+        mock_client._ensure_bqstorage_client.side_effect = fake_ensure_bqstorage_client
+        mock_bqstorage_client = self._mock_bqstorage_client(
+            stream_count=1, rows=[{"foo": 1}, {"foo": 2}]
+        )
+
+        connection = dbapi.connect(
+            client=mock_client,
+            bqstorage_client=mock_bqstorage_client,
+        )
+        cursor = connection.cursor()
+        cursor.download_profile = metrics.DownloadProfile()
+        cursor.execute("SELECT foo FROM some_table")
+
+        rows = cursor.fetchall()
+
+        mock_client.list_rows.assert_not_called()
+        self.assertEqual([row[0] for row in rows], [1, 2])
+        profile = cursor.download_profile
+        self.assertIn(metrics.DownloadPhase.CREATE_READ_SESSION, profile.phases)
+        self.assertEqual(profile.phases[metrics.DownloadPhase.STREAM_READ].rows, 2)
+        self.assertEqual(profile.streams["streams/stream_0"].pages, 1)
+        self.assertIn(metrics.DownloadPhase.ARROW_DECODE, profile.phases)
+
     def test_fetchall_w_bqstorage_client_fetch_no_rows(self):
         pytest.importorskip("google.cloud.bigquery_storage")
         from google.cloud.bigquery import dbapi
@@ -442,7 +473,7 @@ class TestCursor(unittest.TestCase):
 
         # Use unordered data to also test any non-determenistic key order in dicts.
         row_data = [bq_table.Row([1.2, 1.1], {"bar": 1, "foo": 0})]
-        bqstorage_streamed_rows = [{"bar": _to_pyarrow(1.2), "foo": _to_pyarrow(1.1)}]
+        bqstorage_streamed_rows = [{"bar": 1.2, "foo": 1.1}]
 
         def fake_ensure_bqstorage_client(bqstorage_client=None, **kwargs):
             return bqstorage_client
@@ -494,6 +525,183 @@ class TestCursor(unittest.TestCase):
 
         self.assertEqual(sorted_row_data, expected_row_data)
 
+    def _fetch_w_multiple_streams(self, query):
+        from google.cloud.bigquery import dbapi
+
+        row_data = [bq_table.Row([1.1, 1.2], {"foo": 0, "bar": 1})]
+
+        def fake_ensure_bqstorage_client(bqstorage_client=None, **kwargs):
+            return bqstorage_client
+
+        mock_client = self._mock_client(
+            rows=row_data,
+            # Assume there are many more pages of data to look at so that the
+            # BQ Storage API is necessary.
+            total_rows=1000,
+            destination_table="P.DS.T",
+        )
+        mock_client._ensure_bqstorage_client.side_effect = fake_ensure_bqstorage_client
+        mock_bqstorage_client = self._mock_bqstorage_client(stream_count=1)
+
+        connection = dbapi.connect(
+            client=mock_client,
+            bqstorage_client=mock_bqstorage_client,
+            max_stream_count=4,
+        )
+        cursor = connection.cursor()
+        cursor.execute(query)
+        return cursor, mock_client, mock_bqstorage_client
+
+    def test_fetchall_w_bqstorage_client_w_multiple_streams(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        pytest.importorskip("google.cloud.bigquery_storage")
+
+        record_batches = [
+            pyarrow.RecordBatch.from_pylist([{"foo": 1, "bar": "a"}]),
+            pyarrow.RecordBatch.from_pylist([{"foo": 2, "bar": "b"}]),
+        ]
+        cursor, mock_client, mock_bqstorage_client = self._fetch_w_multiple_streams(
+            "SELECT foo, bar FROM some_table"
+        )
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_bqstorage",
+            return_value=iter(record_batches),
+        ) as download:
+            rows = cursor.fetchall()
+
+        mock_client.list_rows.assert_not_called()
+        download.assert_called_once_with(
+            "P",
+            bq_table.TableReference.from_string("P.DS.T"),
+            mock_bqstorage_client,
+            preserve_order=False,
+            max_stream_count=4,
+            download_profile=None,
+        )
+        self.assertEqual([tuple(row.values()) for row in rows], [(1, "a"), (2, "b")])
+        self.assertEqual(rows[1]["bar"], "b")
+
+    def test_fetchall_w_bqstorage_client_w_multiple_streams_preserves_order(self):
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("google.cloud.bigquery_storage")
+
+        cursor, _, _ = self._fetch_w_multiple_streams(
+            "SELECT foo FROM some_table ORDER BY foo"
+        )
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_bqstorage",
+            return_value=iter([]),
+        ) as download:
+            self.assertEqual(cursor.fetchall(), [])
+
+        self.assertTrue(download.call_args.kwargs["preserve_order"])
+
+    def test_close_stops_bqstorage_download(self):
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("google.cloud.bigquery_storage")
+
+        cursor, _, _ = self._fetch_w_multiple_streams("SELECT foo FROM some_table")
+        download = mock.MagicMock()
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_bqstorage",
+            return_value=download,
+        ):
+            cursor.fetchone()
+
+        # Executing another query stops reading the previous results.
+        cursor.execute("SELECT 1")
+        download.close.assert_called_once_with()
+
+        download.reset_mock()
+        cursor._bqstorage_download = download
+        cursor.close()
+        download.close.assert_called_once_with()
+
+    def test_fetch_record_batches(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[])
+        mock_bqstorage_client = mock.sentinel.bqstorage_client
+        mock_client._ensure_bqstorage_client.return_value = mock_bqstorage_client
+        connection = dbapi.connect(mock_client, max_stream_count=3)
+        cursor = connection.cursor()
+        cursor.execute("SELECT foo FROM some_table")
+        rows = cursor._query_rows
+        record_batches = mock.MagicMock()
+        rows.to_arrow_iterable.return_value = record_batches
+
+        result = cursor.fetch_record_batches()
+
+        self.assertIs(result, record_batches)
+        rows.to_arrow_iterable.assert_called_once_with(
+            bqstorage_client=mock_bqstorage_client, max_stream_count=3
+        )
+        # The record batches consume all the rows.
+        self.assertIsNone(cursor.fetchone())
+        cursor.close()
+        record_batches.close.assert_called_once_with()
+
+    def test_fetch_arrow_table(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client(rows=[(1,)]))
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1;")
+        rows = cursor._query_rows
+
+        result = cursor.fetch_arrow_table()
+
+        self.assertIs(result, rows.to_arrow.return_value)
+        rows.to_arrow.assert_called_once_with(
+            bqstorage_client=None, create_bqstorage_client=False
+        )
+        self.assertEqual(cursor.fetchall(), [])
+
+    def test_fetch_df(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client(rows=[(1,)]))
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1;")
+        rows = cursor._query_rows
+
+        result = cursor.fetch_df(dtypes={"f0_": "float64"})
+
+        self.assertIs(result, rows.to_dataframe.return_value)
+        rows.to_dataframe.assert_called_once_with(
+            bqstorage_client=None,
+            create_bqstorage_client=False,
+            dtypes={"f0_": "float64"},
+        )
+
+    def test_fetch_columnar_wo_execute_raises_error(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client())
+        cursor = connection.cursor()
+
+        for fetch in (
+            cursor.fetch_record_batches,
+            cursor.fetch_arrow_table,
+            cursor.fetch_df,
+        ):
+            with self.assertRaisesRegex(dbapi.InterfaceError, "execute"):
+                fetch()
+
+    def test_fetch_columnar_after_fetchone_raises_error(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client(rows=[(1,), (2,)]))
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1;")
+        cursor.fetchone()
+
+        with self.assertRaisesRegex(dbapi.InterfaceError, "fetchone"):
+            cursor.fetch_arrow_table()
+
     def test_execute_custom_job_id(self):
         from google.cloud.bigquery.dbapi import connect
 
@@ -671,6 +879,284 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, -1)
 
+    def _query_and_wait_calls(self, mock_client):
+        return [
+            (call.args[0], call.kwargs["job_config"].query_parameters)
+            for call in mock_client.query_and_wait.call_args_list
+        ]
+
+    def test_executemany_w_batch_size_positional(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = dbapi.connect(mock_client, executemany_batch_size=2)
+        cursor = connection.cursor()
+
+        cursor.executemany(
+            "INSERT INTO t (a, b) VALUES (%s, %(:STRING)s);",
+            [(1, "x"), (2, "y"), (3, "z")],
+        )
+
+        self.assertEqual(
+            self._query_and_wait_calls(mock_client),
+            [
+                (
+                    "INSERT INTO t (a, b) VALUES (?, ?), (?, ?);",
+                    [
+                        ScalarQueryParameter(None, "INT64", 1),
+                        ScalarQueryParameter(None, "STRING", "x"),
+                        ScalarQueryParameter(None, "INT64", 2),
+                        ScalarQueryParameter(None, "STRING", "y"),
+                    ],
+                ),
+                (
+                    "INSERT INTO t (a, b) VALUES (?, ?);",
+                    [
+                        ScalarQueryParameter(None, "INT64", 3),
+                        ScalarQueryParameter(None, "STRING", "z"),
+                    ],
+                ),
+            ],
+        )
+        self.assertEqual(cursor.rowcount, 4)
+
+    def test_executemany_w_batch_size_named(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = dbapi.connect(mock_client)
+        cursor = connection.cursor()
+        cursor.executemany_batch_size = 10
+
+        cursor.executemany(
+            "insert into t (a, b)\nvalues (%(a)s, CONCAT(%(b:STRING)s, ')'))",
+            [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}],
+        )
+
+        ((operation, parameters),) = self._query_and_wait_calls(mock_client)
+        self.assertEqual(
+            operation,
+            "insert into t (a, b)\nvalues (@`a__0`, CONCAT(@`b__0`, ')')), "
+            "(@`a__1`, CONCAT(@`b__1`, ')'))",
+        )
+        self.assertEqual(
+            parameters,
+            [
+                ScalarQueryParameter("a__0", "INT64", 1),
+                ScalarQueryParameter("b__0", "STRING", "x"),
+                ScalarQueryParameter("a__1", "INT64", 2),
+                ScalarQueryParameter("b__1", "STRING", "y"),
+            ],
+        )
+        self.assertEqual(cursor.rowcount, 2)
+
+    def test_executemany_w_batch_size_named_w_suffixed_names(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = dbapi.connect(mock_client, executemany_batch_size=10)
+        cursor = connection.cursor()
+
+        cursor.executemany(
+            "INSERT INTO t (a, b) VALUES (%(a)s, %(a__0)s)",
+            [{"a": 1, "a__0": 2}, {"a": 3, "a__0": 4}],
+        )
+
+        ((operation, parameters),) = self._query_and_wait_calls(mock_client)
+        self.assertEqual(
+            operation,
+            "INSERT INTO t (a, b) VALUES (@`a__0`, @`a__0__0`), (@`a__1`, @`a__0__1`)",
+        )
+        self.assertEqual(
+            [(parameter.name, parameter.value) for parameter in parameters],
+            [("a__0", 1), ("a__0__0", 2), ("a__1", 3), ("a__0__1", 4)],
+        )
+
+    def test_executemany_w_batch_size_wo_parameters(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = dbapi.connect(mock_client, executemany_batch_size=10)
+        cursor = connection.cursor()
+
+        for parameters in ([(), ()], [{}, {}]):
+            mock_client.query_and_wait.reset_mock()
+            cursor.executemany("INSERT INTO t (a) VALUES (1)", parameters)
+
+            ((operation, query_parameters),) = self._query_and_wait_calls(mock_client)
+            self.assertEqual(operation, "INSERT INTO t (a) VALUES (1), (1)")
+            self.assertEqual(query_parameters, [])
+            self.assertEqual(cursor.rowcount, 2)
+
+    def test_executemany_w_batch_size_mismatched_parameters(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client(), executemany_batch_size=10)
+        cursor = connection.cursor()
+
+        with self.assertRaisesRegex(dbapi.ProgrammingError, "same names"):
+            cursor.executemany("INSERT INTO t (a) VALUES (%(a)s)", [{"a": 1}, {"b": 2}])
+        with self.assertRaisesRegex(dbapi.ProgrammingError, "same length"):
+            cursor.executemany("INSERT INTO t (a) VALUES (%s)", [(1,), (2, 3)])
+
+    def test_executemany_w_batch_size_not_batchable(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        connection = dbapi.connect(mock_client, executemany_batch_size=10)
+        cursor = connection.cursor()
+
+        for operation in (
+            "DELETE FROM t WHERE a = %s",
+            "INSERT INTO t (a) SELECT %s",
+            "INSERT INTO t (a) VALUES (%s) -- comment",
+            "INSERT INTO t (a) VALUES (%s), (%s)",
+            "INSERT INTO t (a) VALUES (%s); SELECT 1",
+        ):
+            mock_client.query_and_wait.reset_mock()
+            parameters = [(1,), (2,)] if operation.count("%s") == 1 else [(1, 2)] * 2
+            cursor.executemany(operation, parameters)
+            self.assertEqual(mock_client.query_and_wait.call_count, 2, operation)
+
+    def test_executemany_w_batch_size_parentheses_in_literal(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = dbapi.connect(mock_client, executemany_batch_size=10)
+        cursor = connection.cursor()
+
+        cursor.executemany("INSERT INTO t VALUES (%s, 'a)\\'(')", [(1,), (2,)])
+
+        ((operation, _),) = self._query_and_wait_calls(mock_client)
+        self.assertEqual(operation, "INSERT INTO t VALUES (?, 'a)\\'('), (?, 'a)\\'(')")
+
+    def test_executemany_w_batch_size_limited_by_max_parameters(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        connection = dbapi.connect(mock_client, executemany_batch_size=10)
+        cursor = connection.cursor()
+
+        with mock.patch("google.cloud.bigquery.dbapi.cursor._MAX_QUERY_PARAMETERS", 4):
+            cursor.executemany("INSERT INTO t VALUES (%s, %s)", [(1, 2)] * 5)
+
+        self.assertEqual(
+            [operation for operation, _ in self._query_and_wait_calls(mock_client)],
+            [
+                "INSERT INTO t VALUES (?, ?), (?, ?)",
+                "INSERT INTO t VALUES (?, ?), (?, ?)",
+                "INSERT INTO t VALUES (?, ?)",
+            ],
+        )
+        self.assertEqual(cursor.rowcount, 3)
+
+    def test_execute_async_and_poll(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery import schema
+
+        mock_client = self._mock_client(
+            rows=[("hello", 7)],
+            schema=[
+                schema.SchemaField("foo", "STRING"),
+                schema.SchemaField("bar", "INTEGER"),
+            ],
+        )
+        mock_job = mock_client.query.return_value
+        mock_job.done.side_effect = [False, True]
+        connection = dbapi.connect(mock_client)
+        cursor = connection.cursor()
+
+        cursor.execute_async("SELECT foo, bar FROM t WHERE bar = %s", (7,))
+
+        mock_client.query_and_wait.assert_not_called()
+        ((operation,), kwargs) = mock_client.query.call_args
+        self.assertEqual(operation, "SELECT foo, bar FROM t WHERE bar = ?")
+        self.assertEqual(len(kwargs["job_config"].query_parameters), 1)
+        self.assertIsNone(kwargs["job_id"])
+        self.assertIs(cursor.query_job, mock_job)
+        self.assertIsNone(cursor.description)
+        self.assertEqual(cursor.rowcount, -1)
+
+        self.assertFalse(cursor.poll())
+        mock_job.result.assert_not_called()
+        self.assertTrue(cursor.poll())
+
+        mock_job.result.assert_called_once_with(page_size=None)
+        self.assertEqual([column.name for column in cursor.description], ["foo", "bar"])
+        self.assertEqual(cursor.rowcount, 1)
+        self.assertEqual(cursor.fetchall(), [("hello", 7)])
+        self.assertTrue(cursor.poll())
+
+    def test_execute_async_fetch_waits_for_results(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[(1,), (2,)])
+        connection = dbapi.connect(mock_client)
+        cursor = connection.cursor()
+        cursor.arraysize = 1
+
+        cursor.execute_async("SELECT 1")
+
+        self.assertEqual(cursor.fetchmany(), [(1,)])
+        mock_client.query.return_value.result.assert_called_once_with(page_size=1)
+        self.assertEqual(cursor.rowcount, 2)
+
+    def test_execute_async_query_error(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[])
+        mock_job = mock_client.query.return_value
+        mock_job.done.return_value = True
+        mock_job.result.side_effect = exceptions.BadRequest("syntax error")
+        connection = dbapi.connect(mock_client)
+        cursor = connection.cursor()
+        cursor.execute_async("SELECT")
+
+        with self.assertRaisesRegex(dbapi.DatabaseError, "syntax error"):
+            cursor.poll()
+        self.assertTrue(cursor.poll())
+        with self.assertRaisesRegex(dbapi.InterfaceError, "No query results"):
+            cursor.fetchone()
+
+    def test_execute_async_poll_error(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[])
+        mock_client.query.return_value.done.side_effect = exceptions.NotFound("job")
+        connection = dbapi.connect(mock_client)
+        cursor = connection.cursor()
+        cursor.execute_async("SELECT 1")
+
+        with self.assertRaises(dbapi.DatabaseError):
+            cursor.poll()
+
+    def test_execute_async_submit_error(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[])
+        mock_client.query.side_effect = exceptions.Forbidden("denied")
+        connection = dbapi.connect(mock_client)
+        cursor = connection.cursor()
+
+        with self.assertRaisesRegex(dbapi.DatabaseError, "denied"):
+            cursor.execute_async("SELECT 1")
+
+    def test_execute_after_execute_async_discards_pending_job(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[(1,)])
+        connection = dbapi.connect(mock_client)
+        cursor = connection.cursor()
+        cursor.execute_async("SELECT 2")
+
+        cursor.execute("SELECT 1")
+
+        self.assertTrue(cursor.poll())
+        mock_client.query.return_value.result.assert_not_called()
+        self.assertEqual(cursor.fetchall(), [(1,)])
+
     def test_is_iterable(self):
         from google.cloud.bigquery import dbapi
 
@@ -937,3 +1423,36 @@ def test__extract_types_fail(match, inp):
 
     with pytest.raises(exceptions.ProgrammingError, match=match):
         et(inp)
+
+
+def test__format_operation_reuses_prepared_operation():
+    from google.cloud.bigquery.dbapi import cursor
+
+    operation = "SELECT %(a:INT64)s, %(b)s -- test__format_operation_reuses"
+    cache_info = cursor._prepare_operation.cache_info()
+
+    first = cursor._format_operation(operation, {"a": 1, "b": "x"})
+    second = cursor._format_operation(operation, {"a": 2, "b": "y"})
+
+    assert first == (
+        "SELECT @`a`, @`b` -- test__format_operation_reuses",
+        {"a": "INT64"},
+    )
+    assert second is first
+    assert cursor._prepare_operation.cache_info().hits == cache_info.hits + 1
+    with pytest.raises(TypeError):
+        first[1]["b"] = "STRING"
+
+
+def test__format_operation_prepared_per_parameter_count():
+    from google.cloud.bigquery.dbapi import cursor
+    from google.cloud.bigquery.dbapi import exceptions
+
+    operation = "SELECT %s, %(:STRING)s"
+
+    assert cursor._format_operation(operation, (1, "x")) == (
+        "SELECT ?, ?",
+        (None, "STRING"),
+    )
+    with pytest.raises(exceptions.ProgrammingError):
+        cursor._format_operation(operation, (1,))
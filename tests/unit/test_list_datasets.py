@@ -124,3 +124,23 @@ def test_list_datasets_explicit_response_missing_datasets_key(client, PROJECT):
         },
         timeout=DEFAULT_TIMEOUT,
     )
+
+
+def test_list_datasets_w_fields_raw(client, PROJECT):
+    resource = {
+        "datasetReference": {"projectId": PROJECT, "datasetId": "ds"},
+        "labels": {"a": "b"},
+    }
+    conn = client._connection = make_connection({"datasets": [resource]})
+
+    datasets = list(
+        client.list_datasets(fields=["labels", "datasetReference"], raw=True)
+    )
+
+    assert datasets == [resource]
+    conn.api_request.assert_called_once_with(
+        method="GET",
+        path="/projects/%s/datasets" % PROJECT,
+        query_params={"fields": "nextPageToken,datasets(datasetReference,labels)"},
+        timeout=DEFAULT_TIMEOUT,
+    )
@@ -290,3 +290,38 @@ def test_list_jobs_w_parent_job_filter(client, PROJECT):
             timeout=DEFAULT_TIMEOUT,
         )
         conn.api_request.reset_mock()
+
+
+def test_list_jobs_w_projection_fields_raw(client, PROJECT):
+    resource = {"jobReference": {"projectId": PROJECT, "jobId": "job_1"}}
+    conn = client._connection = make_connection({"jobs": [resource]})
+
+    jobs = list(
+        client.list_jobs(projection="minimal", fields=["status/state"], raw=True)
+    )
+
+    assert jobs == [resource]
+    conn.api_request.assert_called_once_with(
+        method="GET",
+        path="/projects/%s/jobs" % PROJECT,
+        query_params={
+            "projection": "minimal",
+            "fields": "nextPageToken,jobs(jobReference,status/state)",
+        },
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+
+def test_list_jobs_w_minimal_projection(client, PROJECT):
+    from google.cloud.bigquery.job import UnknownJob
+
+    resource = {
+        "jobReference": {"projectId": PROJECT, "jobId": "job_1"},
+        "state": "DONE",
+    }
+    client._connection = make_connection({"jobs": [resource]})
+
+    (found,) = list(client.list_jobs(projection="minimal"))
+
+    assert isinstance(found, UnknownJob)
+    assert found.job_id == "job_1"
@@ -178,3 +178,78 @@ def test_list_tables_page_size(make_dataset, get_reference, client, PROJECT, DS_
     conn.api_request.assert_called_once_with(
         method="GET", path=path, query_params=dict(maxResults=42), timeout=7.5
     )
+
+
+def test_list_tables_w_fields_raw(client, PROJECT, DS_ID):
+    path = "/projects/{}/datasets/{}/tables".format(PROJECT, DS_ID)
+    resource = {
+        "tableReference": {"projectId": PROJECT, "datasetId": DS_ID, "tableId": "t"},
+        "type": "VIEW",
+    }
+    conn = client._connection = make_connection({"tables": [resource]})
+
+    tables = list(client.list_tables(DS_ID, fields=["type"], raw=True))
+
+    assert tables == [resource]
+    conn.api_request.assert_called_once_with(
+        method="GET",
+        path=path,
+        query_params={"fields": "nextPageToken,tables(tableReference,type)"},
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+
+def test_list_tables_in_datasets(client, PROJECT):
+    from google.cloud.bigquery.table import TableListItem
+
+    def api_request(method, path, query_params, timeout):
+        dataset_id = path.split("/")[4]
+        if dataset_id == "empty":
+            return {}
+        page_token = query_params.get("pageToken")
+        table_id = "t2" if page_token else "t1"
+        response = {
+            "tables": [
+                {
+                    "tableReference": {
+                        "projectId": PROJECT,
+                        "datasetId": dataset_id,
+                        "tableId": table_id,
+                    }
+                }
+            ]
+        }
+        if not page_token:
+            response["nextPageToken"] = "token"
+        return response
+
+    conn = client._connection = make_connection()
+    conn.api_request.side_effect = api_request
+
+    tables = list(
+        client.list_tables_in_datasets(
+            ["ds_a", "empty", "ds_b", "ds_c"], fields=["type"], max_workers=2
+        )
+    )
+
+    assert all(isinstance(table, TableListItem) for table in tables)
+    assert [(table.dataset_id, table.table_id) for table in tables] == [
+        ("ds_a", "t1"),
+        ("ds_a", "t2"),
+        ("ds_b", "t1"),
+        ("ds_b", "t2"),
+        ("ds_c", "t1"),
+        ("ds_c", "t2"),
+    ]
+    assert conn.api_request.call_count == 7
+    for call in conn.api_request.call_args_list:
+        assert call.kwargs["query_params"]["fields"] == (
+            "nextPageToken,tables(tableReference,type)"
+        )
+
+
+def test_list_tables_in_datasets_empty(client):
+    conn = client._connection = make_connection()
+
+    assert list(client.list_tables_in_datasets([])) == []
+    conn.api_request.assert_not_called()
@@ -14,6 +14,7 @@
 
 import copy
 import re
+import threading
 from concurrent import futures
 from unittest import mock
 import warnings
@@ -309,13 +310,76 @@ def test__run_query_dry_run_without_errors_is_silent():
     job_config = job.QueryJobConfig()
     job_config.dry_run = True
     with client_patch as client_mock, io.capture_output() as captured:
-        client_mock().query(sql).job_id = None
+        client_mock().project = "test-project"
+        client_mock().estimate_query.return_value = job.QueryJob(
+            "dry-run", sql, client_mock()
+        )
         magics._run_query(client_mock(), sql, job_config=job_config)
 
     assert len(captured.stderr) == 0
     assert len(captured.stdout) == 0
 
 
+def test__run_query_dry_run_uses_estimate_query():
+    client_mock = mock.create_autospec(bigquery.Client, instance=True)
+    client_mock.project = "test-project"
+    estimate = job.QueryJob.from_api_repr(
+        {
+            "jobReference": {"projectId": "test-project", "jobId": "dry-run"},
+            "configuration": {"query": {"query": "SELECT 17"}, "dryRun": True},
+            "statistics": {"query": {"totalBytesProcessed": "17"}},
+        },
+        client_mock,
+    )
+    client_mock.estimate_query.return_value = estimate
+    job_config = job.QueryJobConfig(dry_run=True)
+
+    query_job = magics._run_query(client_mock, "SELECT 17", job_config=job_config)
+
+    # The cell gets a copy of the shared, cached job.
+    assert query_job is not estimate
+    assert query_job._properties == estimate._properties
+    assert query_job.total_bytes_processed == 17
+    client_mock.estimate_query.assert_called_once_with(
+        "SELECT 17", job_config=job_config, cache=magics.context._query_estimate_cache
+    )
+    client_mock.query.assert_not_called()
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_dryrun_option_shares_estimates_between_cells(monkeypatch):
+    ip = IPython.get_ipython()
+    monkeypatch.setattr(bigquery, "bigquery_magics", None)
+    bigquery.load_ipython_extension(ip)
+    magics.context.credentials = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    magics.context.project = "project-from-context"
+    estimate_caches = []
+    shared_jobs = []
+
+    def estimate_query(self, query, job_config=None, cache=None):
+        estimate_caches.append(cache)
+        if not shared_jobs:
+            shared_jobs.append(job.QueryJob("dry-run", query, self))
+        return shared_jobs[0]
+
+    monkeypatch.setattr(bigquery.Client, "estimate_query", estimate_query)
+
+    with io.capture_output():
+        ip.run_cell_magic("bigquery", "--dry_run first_job", "SELECT 17 AS num")
+        ip.run_cell_magic("bigquery", "--dry_run second_job", "SELECT 17 AS num")
+
+    assert len(estimate_caches) == 2
+    assert estimate_caches[0] is estimate_caches[1]
+    assert estimate_caches[0] is magics.context._query_estimate_cache
+    # Each cell's variable holds its own copy of the shared dry run.
+    first_job, second_job = ip.user_ns["first_job"], ip.user_ns["second_job"]
+    assert first_job is not second_job
+    assert shared_jobs[0] not in (first_job, second_job)
+    assert first_job.job_id == second_job.job_id == "dry-run"
+
+
 def test__make_bqstorage_client_false():
     credentials_mock = mock.create_autospec(
         google.auth.credentials.Credentials, instance=True
@@ -793,6 +857,318 @@ def test_bigquery_magic_w_max_results_valid_calls_queryjob_result(monkeypatch):
     )
 
 
+def _patch_client_query(monkeypatch):
+    ip = IPython.get_ipython()
+    monkeypatch.setattr(bigquery, "bigquery_magics", None)
+    bigquery.load_ipython_extension(ip)
+    magics.context._project = None
+
+    credentials_mock = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    monkeypatch.setattr(
+        google.auth, "default", lambda: (credentials_mock, "general-project")
+    )
+    query_job_mock = mock.create_autospec(
+        google.cloud.bigquery.job.QueryJob, instance=True
+    )
+    monkeypatch.setattr(
+        google.cloud.bigquery.client.Client,
+        "query",
+        mock.Mock(return_value=query_job_mock),
+    )
+    return ip, query_job_mock
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_to_arrow(monkeypatch):
+    pyarrow = pytest.importorskip("pyarrow")
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    result = pyarrow.table({"num": [17]})
+    query_job_mock.to_arrow.return_value = result
+
+    return_value = ip.run_cell_magic(
+        "bigquery", "--use_rest_api --to_arrow", "SELECT 17 AS num"
+    )
+
+    assert return_value is result
+    query_job_mock.to_arrow.assert_called_once_with(
+        bqstorage_client=None,
+        create_bqstorage_client=False,
+        progress_bar_type=mock.ANY,
+    )
+    query_job_mock.to_dataframe.assert_not_called()
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_to_arrow_and_max_results(monkeypatch):
+    pytest.importorskip("pyarrow")
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+
+    ip.run_cell_magic("bigquery", "--max_results=5 --to_arrow", "SELECT 17 AS num")
+
+    query_job_mock.result.assert_called_with(max_results=5)
+    query_job_mock.result.return_value.to_arrow.assert_called_once_with(
+        bqstorage_client=None,
+        create_bqstorage_client=False,
+        progress_bar_type=mock.ANY,
+    )
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_to_parquet(monkeypatch, tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    rows = query_job_mock.result.return_value
+    rows.to_arrow_iterable.return_value = iter(
+        [
+            pyarrow.record_batch({"num": [1, 2]}),
+            pyarrow.record_batch({"num": [3]}),
+        ]
+    )
+    path = str(tmp_path / "results.parquet")
+
+    return_value = ip.run_cell_magic(
+        "bigquery", f"--use_rest_api --to_parquet {path}", "SELECT num FROM t"
+    )
+
+    assert return_value == path
+    query_job_mock.result.assert_called_with()
+    rows.to_arrow_iterable.assert_called_once_with(bqstorage_client=None)
+    query_job_mock.to_dataframe.assert_not_called()
+    assert pyarrow.parquet.read_table(path).to_pydict() == {"num": [1, 2, 3]}
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_to_parquet_empty_results(monkeypatch, tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    rows = query_job_mock.result.return_value
+    rows.to_arrow_iterable.return_value = iter([])
+    rows.schema = [bigquery.SchemaField("num", "INTEGER")]
+    path = str(tmp_path / "results.parquet")
+
+    ip.run_cell_magic("bigquery", f"--use_rest_api --to_parquet {path}", "SELECT 1")
+
+    written = pyarrow.parquet.read_table(path)
+    assert written.num_rows == 0
+    assert written.column_names == ["num"]
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_table_id_and_to_arrow(monkeypatch):
+    ip = IPython.get_ipython()
+    monkeypatch.setattr(bigquery, "bigquery_magics", None)
+    bigquery.load_ipython_extension(ip)
+    magics.context._project = None
+
+    credentials_mock = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    default_patch = mock.patch(
+        "google.auth.default", return_value=(credentials_mock, "general-project")
+    )
+    client_patch = mock.patch(
+        "google.cloud.bigquery.magics.magics.bigquery.Client", autospec=True
+    )
+    row_iterator_mock = mock.create_autospec(
+        google.cloud.bigquery.table.RowIterator, instance=True
+    )
+
+    with default_patch, client_patch as client_mock:
+        client_mock().list_rows.return_value = row_iterator_mock
+        return_value = ip.run_cell_magic(
+            "bigquery",
+            "--use_rest_api --to_arrow --max_results=5",
+            "bigquery-public-data.samples.shakespeare",
+        )
+
+    client_mock().list_rows.assert_called_once_with(
+        "bigquery-public-data.samples.shakespeare", max_results=5
+    )
+    assert return_value is row_iterator_mock.to_arrow.return_value
+    row_iterator_mock.to_arrow.assert_called_once_with(
+        bqstorage_client=None, create_bqstorage_client=False
+    )
+    row_iterator_mock.to_dataframe.assert_not_called()
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_to_arrow_and_to_parquet(monkeypatch):
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+
+    with pytest.raises(ValueError, match="--to_arrow or --to_parquet"):
+        ip.run_cell_magic(
+            "bigquery", "--to_arrow --to_parquet out.parquet", "SELECT 17 AS num"
+        )
+
+    query_job_mock.result.assert_not_called()
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_async(monkeypatch, ipython_ns_cleanup):
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    ipython_ns_cleanup.append((ip, "df"))
+    close_transports_mock = mock.Mock()
+    monkeypatch.setattr(magics, "_close_transports", close_transports_mock)
+    rows = query_job_mock.result.return_value
+    rows.total_rows = 3
+    rows.to_dataframe_iterable.return_value = iter(
+        [
+            pandas.DataFrame({"num": [1, 2]}),
+            pandas.DataFrame({"num": [3]}),
+        ]
+    )
+
+    return_value = ip.run_cell_magic(
+        "bigquery", "df --async --use_rest_api", "SELECT num FROM t"
+    )
+
+    assert return_value is None
+    background_query = ip.user_ns["df"]
+    assert isinstance(background_query, magics.BackgroundQuery)
+    assert background_query.query_job is query_job_mock
+    result = background_query.result(timeout=5)
+    assert result["num"].tolist() == [1, 2, 3]
+    assert background_query.done()
+    assert background_query.rows_downloaded == 3
+    assert background_query.total_rows == 3
+    assert repr(background_query) == ("<BackgroundQuery done, 3 of 3 rows downloaded>")
+    query_job_mock.result.assert_called_once_with()
+    rows.to_dataframe_iterable.assert_called_once_with(bqstorage_client=None)
+    close_transports_mock.assert_called_once()
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_async_and_max_results(monkeypatch, ipython_ns_cleanup):
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    ipython_ns_cleanup.append((ip, "df"))
+    rows = query_job_mock.result.return_value
+    rows.to_dataframe_iterable.return_value = iter([])
+
+    ip.run_cell_magic("bigquery", "df --async --max_results=5", "SELECT 1")
+
+    result = ip.user_ns["df"].result(timeout=5)
+    assert len(result) == 0
+    query_job_mock.result.assert_called_once_with(max_results=5)
+    rows.to_dataframe_iterable.assert_called_once_with(bqstorage_client=None)
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_async_query_fails(monkeypatch, ipython_ns_cleanup):
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    ipython_ns_cleanup.append((ip, "df"))
+    error = exceptions.BadRequest("syntax error")
+    query_job_mock.result.side_effect = error
+
+    ip.run_cell_magic("bigquery", "df --async --use_rest_api", "SELECT FROM")
+
+    background_query = ip.user_ns["df"]
+    assert background_query.exception(timeout=5) is error
+    with pytest.raises(exceptions.BadRequest):
+        background_query.result()
+    assert repr(background_query).startswith("<BackgroundQuery failed:")
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_async_table_id(monkeypatch, ipython_ns_cleanup):
+    ip = IPython.get_ipython()
+    ipython_ns_cleanup.append((ip, "df"))
+    monkeypatch.setattr(bigquery, "bigquery_magics", None)
+    bigquery.load_ipython_extension(ip)
+    magics.context._project = None
+
+    credentials_mock = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    default_patch = mock.patch(
+        "google.auth.default", return_value=(credentials_mock, "general-project")
+    )
+    client_patch = mock.patch(
+        "google.cloud.bigquery.magics.magics.bigquery.Client", autospec=True
+    )
+    row_iterator_mock = mock.create_autospec(
+        google.cloud.bigquery.table.RowIterator, instance=True
+    )
+    row_iterator_mock.to_dataframe_iterable.return_value = iter(
+        [pandas.DataFrame({"word": ["hamlet"]})]
+    )
+
+    with default_patch, client_patch as client_mock:
+        client_mock().list_rows.return_value = row_iterator_mock
+        ip.run_cell_magic(
+            "bigquery",
+            "df --async --use_rest_api --max_results=1",
+            "bigquery-public-data.samples.shakespeare",
+        )
+        result = ip.user_ns["df"].result(timeout=5)
+
+    assert ip.user_ns["df"].query_job is None
+    assert result["word"].tolist() == ["hamlet"]
+    client_mock().list_rows.assert_called_once_with(
+        "bigquery-public-data.samples.shakespeare", max_results=1
+    )
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_async_cancel(monkeypatch, ipython_ns_cleanup):
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    ipython_ns_cleanup.append((ip, "df"))
+    query_done = threading.Event()
+
+    def wait_for_query():
+        query_done.wait(5)
+        raise exceptions.BadRequest("Job was cancelled")
+
+    query_job_mock.result.side_effect = wait_for_query
+    query_job_mock.done.return_value = False
+    query_job_mock.cancel.side_effect = lambda: query_done.set()
+
+    ip.run_cell_magic("bigquery", "df --async --use_rest_api", "SELECT 1")
+    background_query = ip.user_ns["df"]
+    assert not background_query.done()
+    assert repr(background_query) == (
+        "<BackgroundQuery running, 0 of ? rows downloaded>"
+    )
+
+    background_query.cancel()
+
+    query_job_mock.cancel.assert_called_once_with()
+    assert isinstance(background_query.exception(timeout=5), exceptions.BadRequest)
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_async_result_timeout(monkeypatch, ipython_ns_cleanup):
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+    ipython_ns_cleanup.append((ip, "df"))
+    release = threading.Event()
+    query_job_mock.result.side_effect = lambda: release.wait(5)
+
+    ip.run_cell_magic("bigquery", "df --async --use_rest_api", "SELECT 1")
+
+    with pytest.raises(futures.TimeoutError):
+        ip.user_ns["df"].result(timeout=0.01)
+    release.set()
+    ip.user_ns["df"].exception(timeout=5)
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+def test_bigquery_magic_w_async_wo_destination_var(monkeypatch):
+    ip, query_job_mock = _patch_client_query(monkeypatch)
+
+    with pytest.raises(ValueError, match="--async requires a destination"):
+        ip.run_cell_magic("bigquery", "--async", "SELECT 17 AS num")
+
+    with pytest.raises(ValueError, match="--async cannot be used"):
+        ip.run_cell_magic("bigquery", "df --async --to_arrow", "SELECT 17 AS num")
+
+    query_job_mock.result.assert_not_called()
+
+
 @pytest.mark.usefixtures("ipython_interactive")
 def test_bigquery_magic_w_max_results_query_job_results_fails(monkeypatch):
     ip = IPython.get_ipython()
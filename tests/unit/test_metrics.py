@@ -0,0 +1,271 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import google.api_core.exceptions
+import pytest
+
+from google.cloud.bigquery import metrics
+
+
+def _make_metric(**kwargs):
+    values = dict(
+        method="GET",
+        operation="BigQuery.getTable",
+        path_template="/projects/{project}/datasets/{dataset}/tables/{table}",
+        attempt=1,
+        duration=0.02,
+        status_code=200,
+        response_bytes=100,
+        error_reason=None,
+        retry_reason=None,
+    )
+    values.update(kwargs)
+    return metrics.RequestMetric(**values)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        (None, None),
+        ("", ""),
+        ("/projects/p/jobs", "/projects/{project}/jobs"),
+        ("/projects/p/queries/job-1", "/projects/{project}/queries/{job}"),
+        (
+            "/projects/p/datasets/d/tables/t/insertAll",
+            "/projects/{project}/datasets/{dataset}/tables/{table}/insertAll",
+        ),
+        (
+            "/projects/p/datasets/d/tables/t:getIamPolicy",
+            "/projects/{project}/datasets/{dataset}/tables/{table}:getIamPolicy",
+        ),
+        ("/projects/p/jobs/j/cancel", "/projects/{project}/jobs/{job}/cancel"),
+    ],
+)
+def test_path_template(path, expected):
+    assert metrics.path_template(path) == expected
+
+
+def test_instrument_call_success_records_response_info():
+    hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+
+    def call():
+        response = mock.Mock(status_code=200, content=b"{}" * 5)
+        metrics._record_response(response)
+        return {"ok": True}
+
+    instrumented = metrics.instrument_call(
+        call, hook, method="GET", path="/projects/p/jobs/j", operation="BigQuery.job"
+    )
+
+    assert instrumented() == {"ok": True}
+    hook.on_request.assert_called_once()
+    metric = hook.on_request.call_args.args[0]
+    assert metric.method == "GET"
+    assert metric.operation == "BigQuery.job"
+    assert metric.path_template == "/projects/{project}/jobs/{job}"
+    assert metric.attempt == 1
+    assert metric.duration >= 0
+    assert metric.status_code == 200
+    assert metric.response_bytes == 10
+    assert metric.error_reason is None
+    assert metric.retry_reason is None
+
+
+def test_instrument_call_failure_sets_retry_reason_on_next_attempt():
+    hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+    error = google.api_core.exceptions.TooManyRequests(
+        "slow down", errors=[{"reason": "rateLimitExceeded"}]
+    )
+    call = mock.Mock(side_effect=[error, "result"])
+    instrumented = metrics.instrument_call(call, hook, method="POST")
+
+    with pytest.raises(google.api_core.exceptions.TooManyRequests):
+        instrumented()
+    assert instrumented() == "result"
+
+    first, second = [c.args[0] for c in hook.on_request.call_args_list]
+    assert first.attempt == 1
+    assert first.status_code == 429
+    assert first.error_reason == "rateLimitExceeded"
+    assert first.retry_reason is None
+    assert second.attempt == 2
+    assert second.error_reason is None
+    assert second.retry_reason == "rateLimitExceeded"
+
+
+def test_instrument_call_failure_wo_structured_errors_uses_type_name():
+    hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+    call = mock.Mock(side_effect=ConnectionError("reset"))
+    instrumented = metrics.instrument_call(call, hook)
+
+    with pytest.raises(ConnectionError):
+        instrumented()
+
+    metric = hook.on_request.call_args.args[0]
+    assert metric.error_reason == "ConnectionError"
+    assert metric.status_code is None
+
+
+def test_instrument_call_ignores_hook_errors():
+    hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+    hook.on_request.side_effect = RuntimeError("broken hook")
+    instrumented = metrics.instrument_call(lambda: "result", hook)
+
+    assert instrumented() == "result"
+
+
+def test_upload_chunk_timer_success():
+    hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+
+    with metrics.UploadChunkTimer(hook, 3) as timer:
+        timer.finish(mock.Mock(status_code=308), 1024)
+
+    metric = hook.on_upload_chunk.call_args.args[0]
+    assert metric.chunk_index == 3
+    assert metric.bytes_sent == 1024
+    assert metric.status_code == 308
+    assert metric.error_reason is None
+
+
+def test_upload_chunk_timer_failure():
+    hook = mock.create_autospec(metrics.MetricsHook, instance=True)
+
+    with pytest.raises(google.api_core.exceptions.ServiceUnavailable):
+        with metrics.UploadChunkTimer(hook, 0):
+            raise google.api_core.exceptions.ServiceUnavailable("unavailable")
+
+    metric = hook.on_upload_chunk.call_args.args[0]
+    assert metric.status_code == 503
+    assert metric.bytes_sent == 0
+    assert metric.error_reason == "ServiceUnavailable"
+
+
+def test_histogram_collector_aggregates_requests():
+    collector = metrics.HistogramCollector(buckets=[0.1, 1.0])
+    collector.on_request(_make_metric(duration=0.05))
+    collector.on_request(
+        _make_metric(
+            duration=0.5,
+            status_code=503,
+            response_bytes=None,
+            error_reason="backendError",
+        )
+    )
+    collector.on_request(
+        _make_metric(duration=5.0, attempt=2, retry_reason="backendError")
+    )
+    collector.on_request(_make_metric(operation="BigQuery.getDataset"))
+
+    snapshot = collector.snapshot()
+
+    assert len(snapshot["requests"]) == 2
+    series = snapshot["requests"][0]
+    assert series["operation"] == "BigQuery.getTable"
+    assert series["latency"]["bounds"] == [0.1, 1.0]
+    assert series["latency"]["counts"] == [1, 1, 1]
+    assert series["latency"]["count"] == 3
+    assert series["latency"]["sum"] == pytest.approx(5.55)
+    assert series["attempts"] == 3
+    assert series["errors"] == 1
+    assert series["retries"] == 1
+    assert series["response_bytes"] == 200
+    assert series["status_codes"] == {200: 2, 503: 1}
+    assert series["retry_reasons"] == {"backendError": 1}
+
+
+def test_histogram_collector_aggregates_uploads_and_resets():
+    collector = metrics.HistogramCollector()
+    collector.on_upload_chunk(
+        metrics.UploadChunkMetric(
+            chunk_index=0,
+            duration=0.2,
+            bytes_sent=512,
+            status_code=308,
+            error_reason=None,
+        )
+    )
+    collector.on_upload_chunk(
+        metrics.UploadChunkMetric(
+            chunk_index=1,
+            duration=0.3,
+            bytes_sent=0,
+            status_code=503,
+            error_reason="ServiceUnavailable",
+        )
+    )
+
+    uploads = collector.snapshot()["uploads"]
+    assert uploads["requests"] == 2
+    assert uploads["errors"] == 1
+    assert uploads["bytes_sent"] == 512
+    assert uploads["status_codes"] == {308: 1, 503: 1}
+    assert uploads["latency"]["count"] == 2
+
+    collector.reset()
+    snapshot = collector.snapshot()
+    assert snapshot["requests"] == []
+    assert snapshot["uploads"]["requests"] == 0
+
+
+def test_download_profile_record_phase_and_stream():
+    profile = metrics.DownloadProfile()
+
+    profile.record(metrics.DownloadPhase.GET_PAGE, duration=0.5, rows=10, pages=1)
+    profile.record(
+        metrics.DownloadPhase.STREAM_READ,
+        duration=1.0,
+        bytes=100,
+        rows=20,
+        pages=2,
+        stream="streams/s0",
+    )
+    profile.record(
+        metrics.DownloadPhase.STREAM_READ, duration=2.0, rows=5, stream="streams/s1"
+    )
+
+    assert profile.phases[metrics.DownloadPhase.GET_PAGE] == metrics.DownloadStats(
+        duration=0.5, rows=10, pages=1
+    )
+    assert profile.phases[metrics.DownloadPhase.STREAM_READ].rows == 25
+    assert profile.phases[metrics.DownloadPhase.STREAM_READ].duration == 3.0
+    assert profile.streams["streams/s0"] == metrics.DownloadStats(
+        duration=1.0, bytes=100, rows=20, pages=2
+    )
+    assert profile.streams["streams/s1"].rows == 5
+
+
+def test_download_profile_time_and_to_dict():
+    profile = metrics.DownloadProfile()
+
+    with profile.time(metrics.DownloadPhase.PANDAS_CONVERSION) as counts:
+        counts["rows"] = 3
+
+    result = profile.to_dict()
+    stats = result["phases"][metrics.DownloadPhase.PANDAS_CONVERSION]
+    assert stats["rows"] == 3
+    assert stats["duration"] >= 0
+    assert result["streams"] == {}
+    assert "pandas_conversion" in repr(profile)
+
+
+def test_download_profile_time_records_on_error():
+    profile = metrics.DownloadProfile()
+
+    with pytest.raises(ValueError):
+        with profile.time(metrics.DownloadPhase.GET_PAGE):
+            raise ValueError("boom")
+
+    assert profile.phases[metrics.DownloadPhase.GET_PAGE].pages == 0
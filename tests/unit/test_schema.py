@@ -1043,6 +1043,271 @@ class Test_to_schema_fields:
         assert result == expected_schema
 
 
+class TestFrozenSchema:
+    RESOURCES = [
+        {"name": "id", "type": "integer", "mode": "REQUIRED"},
+        {
+            "name": "rec",
+            "type": "RECORD",
+            "fields": [{"name": "x", "type": "STRING", "mode": "nullable"}],
+        },
+    ]
+
+    def test_builds_fields_lazily(self):
+        with mock.patch.object(
+            schema.SchemaField, "from_api_repr", wraps=schema.SchemaField.from_api_repr
+        ) as from_api_repr:
+            frozen = schema.FrozenSchema.from_api_repr(self.RESOURCES)
+            assert len(frozen) == 2
+            from_api_repr.assert_not_called()
+
+            field = frozen[-1]
+            assert field.name == "rec"
+            assert frozen[1] is field
+            assert from_api_repr.call_count == 1
+
+        assert frozen[:1] == [schema.SchemaField("id", "INTEGER", mode="REQUIRED")]
+        with pytest.raises(IndexError):
+            frozen[2]
+
+    def test_equality_and_fingerprint(self):
+        frozen = schema.FrozenSchema.from_api_repr(self.RESOURCES)
+        # Spelled differently, but the same schema.
+        same = schema.FrozenSchema(
+            [
+                schema.SchemaField("id", "INTEGER", mode="REQUIRED"),
+                schema.SchemaField(
+                    "rec", "RECORD", fields=[schema.SchemaField("x", "STRING")]
+                ),
+            ]
+        )
+        other = schema.FrozenSchema(self.RESOURCES[:1])
+
+        assert frozen == same
+        assert hash(frozen) == hash(same)
+        assert frozen.fingerprint == same.fingerprint
+        assert len(frozen.fingerprint) == 64
+        assert frozen != other
+        assert frozen.fingerprint != other.fingerprint
+        assert frozen == list(same)
+        assert frozen != "not a schema"
+        assert {frozen: 1}[same] == 1
+
+    @pytest.mark.parametrize(
+        ("resource", "spelled_differently"),
+        [
+            (
+                {"name": "x", "type": "STRING", "description": None},
+                {"name": "x", "type": "STRING"},
+            ),
+            (
+                {"name": "x", "type": "STRING", "policyTags": {"names": ["a", "b"]}},
+                {"name": "x", "type": "STRING", "policyTags": {"names": ["b", "a"]}},
+            ),
+            (
+                {"name": "x", "type": "string", "mode": "nullable"},
+                {"name": "x", "type": "STRING"},
+            ),
+        ],
+    )
+    def test_equality_matches_schema_field_equality(
+        self, resource, spelled_differently
+    ):
+        frozen = schema.FrozenSchema.from_api_repr([resource])
+        other = schema.FrozenSchema.from_api_repr([spelled_differently])
+        fields = [schema.SchemaField.from_api_repr(dict(spelled_differently))]
+
+        assert frozen == fields
+        assert frozen == other
+        assert frozen.fingerprint == other.fingerprint
+
+    def test_equality_and_fingerprint_do_not_build_fields(self):
+        other_resources = copy.deepcopy(self.RESOURCES)
+        fields = schema._to_schema_fields(copy.deepcopy(self.RESOURCES))
+        frozen = schema.FrozenSchema.from_api_repr(self.RESOURCES)
+        other = schema.FrozenSchema._from_owned_api_repr(other_resources)
+
+        with mock.patch.object(
+            schema.SchemaField, "from_api_repr"
+        ) as from_api_repr, mock.patch.object(schema.copy, "deepcopy") as deepcopy:
+            assert frozen == other
+            assert frozen == fields
+            assert len(frozen.fingerprint) == 64
+
+        from_api_repr.assert_not_called()
+        deepcopy.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "resource",
+        [
+            {"name": "x", "type": "string", "maxLength": "10"},
+            {"name": "x", "type": "BIGNUMERIC", "precision": "40", "scale": "2"},
+            {"name": "x", "type": "NUMERIC", "precision": 10, "mode": "required"},
+            {"name": "x", "type": "TIMESTAMP", "timestampPrecision": "12"},
+            {"name": "x", "type": "STRING", "policyTags": {}},
+            {
+                "name": "x",
+                "type": "RECORD",
+                "defaultValueExpression": "NULL",
+                "fields": [{"name": "y", "type": "STRING", "description": "d"}],
+            },
+        ],
+    )
+    def test_resource_key_matches_schema_field_key(self, resource):
+        field = schema.SchemaField.from_api_repr(copy.deepcopy(resource))
+        key = field._key()
+        expected = key[:5] + (tuple(sub._key() for sub in field.fields),) + key[6:]
+
+        assert schema._resource_key(resource) == expected
+
+    def test_equality_ignores_changed_fields(self):
+        frozen = schema.FrozenSchema.from_api_repr(self.RESOURCES)
+        fields = list(frozen)
+
+        frozen[0]._properties["name"] = "changed"
+
+        assert frozen == schema.FrozenSchema.from_api_repr(self.RESOURCES)
+        assert frozen != fields
+        assert frozen != [{"name": "id", "type": "INTEGER", "mode": "REQUIRED"}]
+
+    def test_is_immutable(self):
+        resources = copy.deepcopy(self.RESOURCES)
+        frozen = schema.FrozenSchema.from_api_repr(resources)
+        fingerprint = frozen.fingerprint
+
+        resources[0]["name"] = "changed"
+        frozen[0]._properties["name"] = "changed too"
+        frozen.to_api_repr()[0]["name"] = "and again"
+
+        assert frozen.fingerprint == fingerprint
+        assert schema.FrozenSchema(frozen.to_api_repr()).fingerprint == fingerprint
+        assert frozen.to_api_repr()[0]["name"] == "id"
+
+    def test_compile_caches_per_parser(self):
+        from google.cloud.bigquery import _helpers
+
+        frozen = schema.FrozenSchema.from_api_repr(self.RESOURCES)
+
+        compiled = frozen.compile()
+
+        assert compiled is frozen.compile(_helpers.CELL_DATA_PARSER)
+        assert [field.name for field in compiled] == ["id", "rec"]
+        assert frozen.compile(_helpers.DATA_FRAME_CELL_DATA_PARSER) is not compiled
+
+    def test_build_schema_resource(self):
+        frozen = schema.FrozenSchema.from_api_repr(self.RESOURCES)
+
+        assert schema._build_schema_resource(frozen) == frozen.to_api_repr()
+        assert schema._to_schema_fields(frozen) == list(frozen)
+
+
+class Test_diff:
+    """Tests for the diff and evolve functions."""
+
+    OLD = [
+        {"name": "id", "type": "INTEGER", "mode": "REQUIRED"},
+        {"name": "name", "type": "STRING", "mode": "REQUIRED"},
+        {
+            "name": "address",
+            "type": "RECORD",
+            "fields": [{"name": "city", "type": "STRING"}],
+        },
+    ]
+
+    def test_no_changes(self):
+        new = [
+            schema.SchemaField("ID", "INT64", mode="REQUIRED"),
+            schema.SchemaField("address", "STRUCT", fields=[]),
+        ]
+
+        changes = schema.diff(self.OLD, new)
+
+        assert changes == schema.SchemaDiff()
+        assert not changes.has_changes
+        assert changes.is_additive
+        assert schema.evolve(self.OLD, new) == schema._to_schema_fields(self.OLD)
+
+    def test_added_and_relaxed(self):
+        new = [
+            {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+            {
+                "name": "address",
+                "type": "RECORD",
+                "fields": [
+                    {"name": "city", "type": "STRING"},
+                    {"name": "zip", "type": "STRING"},
+                ],
+            },
+            {"name": "tags", "type": "STRING", "mode": "REPEATED"},
+        ]
+
+        changes = schema.diff(self.OLD, new)
+
+        assert changes.added == ("address.zip", "tags")
+        assert changes.relaxed == ("name",)
+        assert changes.incompatible == {}
+        assert changes.has_changes
+        assert schema.evolve(self.OLD, new) == [
+            schema.SchemaField("id", "INTEGER", mode="REQUIRED"),
+            schema.SchemaField("name", "STRING", mode="NULLABLE"),
+            schema.SchemaField(
+                "address",
+                "RECORD",
+                fields=[
+                    schema.SchemaField("city", "STRING"),
+                    schema.SchemaField("zip", "STRING"),
+                ],
+            ),
+            schema.SchemaField("tags", "STRING", mode="REPEATED"),
+        ]
+        assert self.OLD[1]["mode"] == "REQUIRED"
+
+    def test_incompatible(self):
+        new = [
+            {"name": "id", "type": "STRING", "mode": "REQUIRED"},
+            {"name": "name", "type": "STRING", "mode": "REPEATED"},
+            {
+                "name": "address",
+                "type": "RECORD",
+                "fields": [{"name": "city", "type": "STRING", "mode": "REQUIRED"}],
+            },
+            {"name": "email", "type": "STRING", "mode": "REQUIRED"},
+        ]
+
+        changes = schema.diff(self.OLD, new)
+
+        assert not changes.is_additive
+        assert changes.added == ()
+        assert changes.incompatible == {
+            "id": "type changed from INTEGER to STRING",
+            "name": "mode changed from REQUIRED to REPEATED",
+            "address.city": "mode changed from NULLABLE to REQUIRED",
+            "email": "cannot add a REQUIRED field",
+        }
+
+    def test_range_element_type_changed(self):
+        old = [
+            schema.SchemaField("during", "RANGE", range_element_type="DATE"),
+            schema.SchemaField("span", "RANGE", range_element_type="DATE"),
+        ]
+        new = [
+            schema.SchemaField("during", "RANGE", range_element_type="TIMESTAMP"),
+            schema.SchemaField("span", "RANGE", range_element_type="date"),
+        ]
+
+        changes = schema.diff(old, new)
+
+        assert changes.incompatible == {
+            "during": "range element type changed from DATE to TIMESTAMP",
+        }
+        assert not schema.diff(old, [{"name": "during", "type": "RANGE"}]).has_changes
+
+    def test_field_without_type_matches_any_type(self):
+        changes = schema.diff(self.OLD, [{"name": "id", "mode": "REQUIRED"}])
+
+        assert not changes.has_changes
+
+
 class TestPolicyTags(unittest.TestCase):
     @staticmethod
     def _get_target_class():
@@ -2677,6 +2677,49 @@ class TestRowIterator(unittest.TestCase):
 
         api_request.assert_called_once_with(method="GET", path=path, query_params={})
 
+    def test_iterate_compiles_schema_once(self):
+        from google.cloud.bigquery import _helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("age", "INTEGER")]
+        api_request = mock.Mock(
+            side_effect=[
+                {"rows": [{"f": [{"v": "1"}]}], "pageToken": "next"},
+                {"rows": [{"f": [{"v": "2"}]}]},
+            ]
+        )
+        row_iterator = self._make_one(_mock_client(), api_request, "/foo", schema)
+
+        with mock.patch.object(
+            _helpers.CellDataParser,
+            "compile_schema",
+            autospec=True,
+            side_effect=_helpers.CellDataParser.compile_schema,
+        ) as compile_schema:
+            rows = list(row_iterator)
+
+        self.assertEqual([row.age for row in rows], [1, 2])
+        # Subfields are compiled too, but the INTEGER field has none.
+        parsers = [
+            call.args[0] for call in compile_schema.call_args_list if call.args[1]
+        ]
+        self.assertEqual(
+            sorted(map(id, parsers)),
+            sorted(
+                map(
+                    id,
+                    [
+                        _helpers.CELL_DATA_PARSER,
+                        _helpers.DATA_FRAME_CELL_DATA_PARSER,
+                    ],
+                )
+            ),
+        )
+        self.assertIs(
+            row_iterator._compiled_schema(_helpers.CELL_DATA_PARSER),
+            row_iterator._compiled_schema(_helpers.CELL_DATA_PARSER),
+        )
+
     def test_iterate_with_cached_first_page(self):
         from google.cloud.bigquery.schema import SchemaField
 
@@ -3396,6 +3439,63 @@ class TestRowIterator(unittest.TestCase):
         self.assertFalse(matches)
         mock_client._ensure_bqstorage_client.assert_not_called()
 
+    def test_to_arrow_w_download_profile(self):
+        pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow", minversion=self.PYARROW_MINIMUM_VERSION)
+        from google.cloud.bigquery import metrics
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("name", "STRING"), SchemaField("age", "INTEGER")]
+        rows = [
+            {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+        ]
+        api_request = mock.Mock(
+            side_effect=[
+                {"rows": rows[:1], "pageToken": "NEXTPAGE"},
+                {"rows": rows[1:]},
+            ]
+        )
+        row_iterator = self._make_one(_mock_client(), api_request, "/foo", schema)
+        profile = metrics.DownloadProfile()
+        row_iterator.download_profile = profile
+
+        tbl = row_iterator.to_arrow(create_bqstorage_client=False)
+
+        self.assertEqual(tbl.num_rows, 2)
+        self.assertIs(row_iterator.download_profile, profile)
+        get_page = profile.phases[metrics.DownloadPhase.GET_PAGE]
+        self.assertEqual(get_page.pages, 2)
+        self.assertEqual(get_page.rows, 2)
+        arrow_decode = profile.phases[metrics.DownloadPhase.ARROW_DECODE]
+        self.assertEqual(arrow_decode.pages, 2)
+        self.assertEqual(arrow_decode.rows, 2)
+
+    def test_to_arrow_w_download_profile_first_page_response(self):
+        pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow", minversion=self.PYARROW_MINIMUM_VERSION)
+        from google.cloud.bigquery import metrics
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("age", "INTEGER")]
+        first_page = {"rows": [{"f": [{"v": "32"}]}, {"f": [{"v": "33"}]}]}
+        api_request = mock.Mock()
+        row_iterator = self._make_one(
+            _mock_client(),
+            api_request,
+            "/foo",
+            schema,
+            first_page_response=first_page,
+        )
+        row_iterator.download_profile = metrics.DownloadProfile()
+
+        row_iterator.to_arrow(create_bqstorage_client=False)
+
+        api_request.assert_not_called()
+        get_page = row_iterator.download_profile.phases[metrics.DownloadPhase.GET_PAGE]
+        self.assertEqual(get_page.rows, 2)
+        self.assertEqual(get_page.duration, 0.0)
+
     def test_to_arrow_w_bqstorage(self):
         pytest.importorskip("numpy")
         pyarrow = pytest.importorskip("pyarrow")
@@ -3896,6 +3996,25 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.name.dtype.name, "object")
         self.assertEqual(df.age.dtype.name, "Int64")
 
+    def test_to_dataframe_w_download_profile(self):
+        pandas = pytest.importorskip("pandas")
+        from google.cloud.bigquery import metrics
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("age", "INTEGER", mode="REQUIRED")]
+        rows = [{"f": [{"v": "32"}]}, {"f": [{"v": "33"}]}, {"f": [{"v": "29"}]}]
+        api_request = mock.Mock(return_value={"rows": rows})
+        row_iterator = self._make_one(_mock_client(), api_request, "/foo", schema)
+        row_iterator.download_profile = metrics.DownloadProfile()
+
+        df = row_iterator.to_dataframe(create_bqstorage_client=False)
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        phases = row_iterator.download_profile.phases
+        self.assertEqual(phases[metrics.DownloadPhase.GET_PAGE].rows, 3)
+        self.assertEqual(phases[metrics.DownloadPhase.ARROW_DECODE].rows, 3)
+        self.assertEqual(phases[metrics.DownloadPhase.PANDAS_CONVERSION].rows, 3)
+
     def test_to_dataframe_timestamp_out_of_pyarrow_bounds(self):
         pandas = pytest.importorskip("pandas")
         pytest.importorskip("pyarrow")